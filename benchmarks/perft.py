@@ -0,0 +1,50 @@
+from src.backend.actions import ActionValidator
+from src.backend.actions.move_encoding import ATTACK, decode_move
+from src.backend.board import Board
+from src.backend.entities.pieces import King
+from src.backend.foundations.types import Side
+
+
+def perft(board: Board, side: Side, depth: int) -> int:
+    """
+    Count the leaf nodes of the game tree to a depth, using make/unmake
+    and whole-side move generation. Lines end early when a king falls.
+
+    Args:
+        board (Board): The position, restored on return.
+        side (Side): The side to move.
+        depth (int): The depth to count to.
+
+    Returns:
+        int: The number of leaf nodes.
+    """
+    validator = ActionValidator(board)
+    return _perft(board, validator, side, depth)
+
+
+def _perft(
+    board: Board,
+    validator: ActionValidator,
+    side: Side,
+    depth: int
+) -> int:
+    moves = validator.generate_all(side)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for packed in moves:
+        from_square, to_square, kind = decode_move(packed)
+        piece = board.get_piece_at_index(from_square)
+        if kind == ATTACK:
+            target = board.get_piece_at_index(to_square)
+            captured = board.make_attack(target, piece.get_damage())
+            if captured and isinstance(target, King):
+                nodes += 1
+                board.unmake()
+                continue
+        else:
+            board.make_move(piece, board.to_position(to_square))
+        nodes += _perft(board, validator, side.opponent, depth - 1)
+        board.unmake()
+    return nodes
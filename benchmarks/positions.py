@@ -0,0 +1,50 @@
+from src.backend.board import Board
+from src.backend.entities.pieces import (
+    Bishop, King, Knight, Pawn, Queen, Rook
+)
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+
+
+def standard() -> Board:
+    """
+    The standard chess starting position.
+    """
+    return create_standard_board()
+
+
+def rpg_skirmish() -> Board:
+    """
+    An open middlegame where both armies are already in contact and worn
+    down, so most nodes have attacks that damage without capturing.
+    """
+    board = Board(8, 8)
+    layout = [
+        (King, Side.WHITE, (0, 4), 70),
+        (Queen, Side.WHITE, (2, 3), 60),
+        (Rook, Side.WHITE, (0, 0), 50),
+        (Knight, Side.WHITE, (3, 5), 20),
+        (Bishop, Side.WHITE, (2, 6), 30),
+        (Pawn, Side.WHITE, (3, 2), 10),
+        (Pawn, Side.WHITE, (3, 3), 5),
+        (Pawn, Side.WHITE, (1, 7), 10),
+        (King, Side.BLACK, (7, 4), 80),
+        (Queen, Side.BLACK, (5, 4), 45),
+        (Rook, Side.BLACK, (7, 7), 35),
+        (Knight, Side.BLACK, (5, 2), 30),
+        (Bishop, Side.BLACK, (6, 1), 15),
+        (Pawn, Side.BLACK, (4, 4), 10),
+        (Pawn, Side.BLACK, (4, 1), 5),
+        (Pawn, Side.BLACK, (6, 6), 10),
+    ]
+    for piece_type, side, position, hp in layout:
+        piece = piece_type(side=side)
+        piece.hp = hp
+        board.place_piece(piece, position)
+    return board
+
+
+POSITIONS = {
+    "standard": standard,
+    "rpg_skirmish": rpg_skirmish,
+}
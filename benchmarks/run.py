@@ -0,0 +1,239 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List
+from src.backend.actions import ActionValidator
+from src.backend.board import Board
+from src.backend.entities.pieces import Rook
+from src.backend.foundations.types import Side
+from src.backend.simulation import play_game
+from .perft import perft
+from .positions import POSITIONS
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+PERFT_DEPTHS = {
+    "standard": 4,
+    "rpg_skirmish": 3,
+}
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Time a function, returning the best of several runs in seconds. The
+    garbage collector is paused while timing.
+    """
+    best = float("inf")
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    return best
+
+
+# --- Benchmarks ---
+def bench_perft() -> Dict[str, Dict]:
+    results = {}
+    for name, create in POSITIONS.items():
+        depth = PERFT_DEPTHS[name]
+        board = create()
+        nodes = perft(board, Side.WHITE, depth)
+        seconds = measure(lambda: perft(board, Side.WHITE, depth))
+        results[f"perft.{name}.d{depth}"] = {
+            "nodes": nodes,
+            "seconds": seconds,
+            "nodes_per_second": nodes / seconds,
+        }
+    return results
+
+
+def bench_board(ops: int = 50_000) -> Dict[str, Dict]:
+    board = Board(8, 8)
+    first = Rook()
+    second = Rook(side=Side.BLACK)
+    board.place_piece(first, (0, 0))
+    board.place_piece(second, (7, 7))
+    positions = [(r, c) for r in range(1, 7) for c in range(8)]
+
+    def place():
+        piece = Rook()
+        for position in positions:
+            board.place_piece(piece, position)
+            board.remove_piece(piece)
+
+    def move():
+        for position in positions:
+            board.move_piece(first, position)
+        board.move_piece(first, (0, 0))
+
+    def swap():
+        for _ in positions:
+            board.swap_piece(first, second)
+
+    def get_piece_at():
+        for position in positions:
+            board.get_piece_at(position)
+
+    validator = ActionValidator(board)
+
+    def generate():
+        for _ in positions:
+            validator.generate_all(Side.WHITE)
+
+    results = {}
+    # Cheap operations run more often to stay well above timer noise
+    for name, func, scale in (
+        ("board.place_remove", place, 1),
+        ("board.move_piece", move, 1),
+        ("board.swap_piece", swap, 1),
+        ("board.get_piece_at", get_piece_at, 20),
+        ("validator.generate_all", generate, 1),
+    ):
+        rounds = max(1, ops * scale // len(positions))
+        seconds = measure(lambda: [func() for _ in range(rounds)])
+        calls = rounds * len(positions)
+        results[name] = {
+            "seconds": seconds,
+            "ns_per_op": seconds / calls * 1e9,
+        }
+    return results
+
+
+def bench_games(games: int = 50) -> Dict[str, Dict]:
+    turns = 0
+
+    def play():
+        nonlocal turns
+        turns = sum(play_game(seed).turns for seed in range(games))
+
+    seconds = measure(play, repeat=3)
+    return {
+        "games.greedy": {
+            "games": games,
+            "turns": turns,
+            "seconds": seconds,
+            "turns_per_second": turns / seconds,
+        }
+    }
+
+
+def run() -> Dict[str, Dict]:
+    results = {}
+    results.update(bench_perft())
+    results.update(bench_board())
+    results.update(bench_games())
+    return results
+
+
+# --- Baseline ---
+def compare(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    threshold: float,
+    check_time: bool = False
+) -> List[str]:
+    """
+    Compare results against a baseline. Node and turn counts must match
+    exactly. Times are only compared when asked, since the baseline times
+    were measured on one machine and mean little on another.
+
+    Args:
+        results (Dict[str, Dict]): The benchmark results.
+        baseline (Dict[str, Dict]): The baseline results.
+        threshold (float): Allowed slowdown as a fraction, e.g. 0.25.
+        check_time (bool, optional): Also fail on slowdowns beyond the
+            threshold. Defaults to False.
+
+    Returns:
+        List[str]: A message for every regression, empty if none.
+    """
+    failures = []
+    for name, expected in baseline.items():
+        result = results.get(name)
+        if result is None:
+            failures.append(f"{name}: missing from results")
+            continue
+        # Node and turn counts must match exactly
+        for key in ("nodes", "turns"):
+            if key in expected and result[key] != expected[key]:
+                failures.append(
+                    f"{name}: {key} {result[key]} != {expected[key]}"
+                )
+        if not check_time:
+            continue
+        limit = expected["seconds"] * (1 + threshold)
+        if result["seconds"] > limit:
+            failures.append(
+                f"{name}: {result['seconds']:.4f}s exceeds "
+                f"{expected['seconds']:.4f}s by more than {threshold:.0%}"
+            )
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark move generation and board operations."
+    )
+    parser.add_argument("--output", help="Write JSON results to a file.")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Allowed slowdown against the baseline, as a fraction."
+    )
+    parser.add_argument(
+        "--check-time", action="store_true",
+        help="Fail on slowdowns, only meaningful on the baseline machine."
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="Overwrite the baseline with these results."
+    )
+    args = parser.parse_args()
+
+    results = run()
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        return
+
+    try:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}.", file=sys.stderr)
+        return
+
+    failures = compare(
+        results, baseline, args.threshold, args.check_time
+    )
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,51 @@
-import pygame
+import argparse
 
-from src.backend.foundation.constants import SCREEN_HEIGHT, SCREEN_WIDTH, SCREEN_FRAMERATE
-from src.game import Player
+from src.backend.cli import run_headless
+from src.backend.foundations.constants import (
+    SCREEN_FRAMERATE, SCREEN_HEIGHT, SCREEN_WIDTH, TICK_RATE
+)
+from src.backend.game import AutoBattle, GameLoop
 
 
-def main():
+def run_window(battle: AutoBattle, max_ticks: int = None):
+    import pygame
+    from src.frontend import BoardView
+
     pygame.init()
     print("Starting Chess-RPG")
-
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    player = Player("Player1")
+    view = BoardView(battle.board, screen)
 
-    # Time
-    clock = pygame.time.Clock()
-    dt = 0
-
-    while True:
+    def update(dt: float):
         # Check for exit condition
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                return
-
-        pygame.display.flip()
-        dt = clock.tick(SCREEN_FRAMERATE) / 1000 
+                loop.stop()
+        battle.update(dt)
+
+    loop = GameLoop(
+        update, view.render, tick_rate=TICK_RATE, frame_rate=SCREEN_FRAMERATE
+    )
+    loop.run(max_ticks)
+    view.close()
+    pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Chess-RPG.")
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="Run the simulation without a window or frame pacing."
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    battle = AutoBattle(seed=args.seed)
+    if args.headless:
+        run_headless(battle, args.max_ticks)
+    else:
+        run_window(battle, args.max_ticks)
 
 
 if __name__ == "__main__":
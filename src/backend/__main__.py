@@ -0,0 +1,3 @@
+from src.backend.cli import main
+
+main()
@@ -1,9 +1,23 @@
-from .action import Action, MoveAction, AttackAction
-from .action_validator import ActionValidator
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .action import Action, MoveAction, AttackAction
+    from .action_batch import ActionBatch
+    from .action_validator import ActionValidator
+    from .threat_map import ThreatMap
 
 __all__ = [
     "Action",
     "MoveAction",
     "AttackAction",
-    "ActionValidator"
+    "ActionBatch",
+    "ActionValidator",
+    "ThreatMap",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".action": ("Action", "MoveAction", "AttackAction"),
+    ".action_batch": ("ActionBatch",),
+    ".action_validator": ("ActionValidator",),
+    ".threat_map": ("ThreatMap",),
+})
@@ -14,6 +14,10 @@ class Action(ABC):
     def execute(self, board: 'Board'):
         raise NotImplementedError
 
+    @abstractmethod
+    def make(self, board: 'Board'):
+        raise NotImplementedError
+
 
 class MoveAction(Action):
     def __init__(self, actor: 'Piece', position: Vector2):
@@ -23,6 +27,9 @@ class MoveAction(Action):
     def execute(self, board: 'Board'):
         board.move_piece(self.actor, self.position)
 
+    def make(self, board: 'Board'):
+        board.make_move(self.actor, self.position)
+
     def __eq__(self, other: 'MoveAction'):
         return (
             self.actor == other.actor
@@ -40,7 +47,10 @@ class AttackAction(Action):
         self.target = target
 
     def execute(self, board: 'Board'):
-        self.target.take_damage(self.damage)
+        board.damage_piece(self.target, self.damage)
+
+    def make(self, board: 'Board'):
+        board.make_attack(self.target, self.damage)
 
     def __eq__(self, other: 'AttackAction'):
         return (
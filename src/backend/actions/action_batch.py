@@ -0,0 +1,78 @@
+from .action import Action
+from .action_validator import ActionValidator
+from typing import Iterable, List, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.backend.board import Board
+
+
+class ActionBatch:
+    """
+    A list of actions applied to a board as one unit. Each action is
+    checked against the board as left by the actions before it and then
+    made, so the board's undo stack doubles as the batch's undo log. If an
+    action is illegal or raises, everything the batch applied is unmade
+    and the board is as it was before the batch.
+    """
+    def __init__(
+        self,
+        board: 'Board',
+        actions: Optional[Iterable[Action]] = None,
+        validator: Optional[ActionValidator] = None
+    ):
+        """
+        Create a batch.
+
+        Args:
+            board (Board): The board to apply the actions to.
+            actions (Iterable[Action], optional): The initial actions.
+            validator (ActionValidator, optional): The validator to check
+                actions with. Defaults to a new validator for the board.
+        """
+        self.board = board
+        self.actions: List[Action] = list(actions or ())
+        self.validator = validator or ActionValidator(board)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def add(self, action: Action) -> 'ActionBatch':
+        """
+        Append an action to the batch.
+
+        Args:
+            action (Action): The action to append.
+
+        Returns:
+            ActionBatch: The batch, for chaining.
+        """
+        self.actions.append(action)
+        return self
+
+    def execute(self, validate: bool = True, keep_undo: bool = False):
+        """
+        Apply every action in order, or none of them.
+
+        Args:
+            validate (bool, optional): Check each action with the
+                validator before applying it. Defaults to True.
+            keep_undo (bool, optional): Leave the batch's records on the
+                board's undo stack so the actions can later be unmade.
+                Defaults to False.
+
+        Raises:
+            ValueError: If an action is illegal. The board is rolled back.
+            Exception: Any error raised while applying an action is
+                re-raised after the board is rolled back.
+        """
+        board = self.board
+        depth = board.get_undo_depth()
+        try:
+            for action in self.actions:
+                if validate and not self.validator.is_legal(action):
+                    raise ValueError(f"Illegal action in batch: {action}")
+                board.make(action)
+        except BaseException:
+            board.rollback(depth)
+            raise
+        if not keep_undo:
+            board.commit(depth)
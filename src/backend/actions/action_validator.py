@@ -1,47 +1,320 @@
-from .action import AttackAction, MoveAction
-from typing import List, TYPE_CHECKING
+from .action import Action, AttackAction, MoveAction
+from .move_encoding import (
+    ATTACK, MOVE, decode_move, encode_move, move_to
+)
+from .move_tables import get_move_tables
+from src.backend.board import BoardChange, ChangeKind
+from src.backend.foundations.types import EntityId, Side
+from typing import (
+    Dict, Iterator, List, NamedTuple, Set, Tuple, TYPE_CHECKING
+)
 if TYPE_CHECKING:
     from src.backend.board import Board
     from src.backend.entities.pieces import Piece
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class _CacheEntry:
+    """
+    Cached actions of one piece and the squares they were derived from.
+    """
+    __slots__ = ("moves", "attacks", "footprint")
+
+    def __init__(
+        self,
+        moves: List[MoveAction],
+        attacks: List[AttackAction],
+        footprint: Tuple[int, ...]
+    ):
+        self.moves = moves
+        self.attacks = attacks
+        self.footprint = footprint
+
+
 class ActionValidator:
-    def __init__(self, board: 'Board'):
+    def __init__(self, board: 'Board', use_cache: bool = False):
+        """
+        Create a validator for a board.
+
+        Args:
+            board (Board): The board to validate against.
+            use_cache (bool, optional): Cache get_valid_moves and
+                get_valid_attacks per piece, invalidating only pieces whose
+                rays cross squares touched by a board mutation. Call close
+                when done to detach from the board. Defaults to False.
+        """
         self.board = board
+        self._tables = get_move_tables(*board.get_size())
+        self._use_cache = use_cache
+        self._cache: Dict[EntityId, _CacheEntry] = {}
+        self._hits = 0
+        self._misses = 0
+        # Per square, the ids of cached pieces whose rays read it
+        self._watchers: Dict[int, Set[EntityId]] = {}
+        if use_cache:
+            board.add_listener(self._on_change)
 
-    def get_valid_moves(self, piece: 'Piece') -> List[MoveAction]:
-        moves = []
-        position = self.board.get_piece_position(piece)
-        for dx, dy in piece.get_move_directions():
-            for i in range(1, piece.get_move_range() + 1):
-                row = position[0] + dy * i
-                col = position[1] + dx * i
-
-                # Out of bounds
-                if not self.board.in_bounds((row, col)):
-                    break
+    def close(self):
+        """
+        Detach the cache from the board.
+        """
+        if self._use_cache:
+            self.board.remove_listener(self._on_change)
+            self._use_cache = False
+            self.clear_cache()
+
+    def clear_cache(self):
+        self._cache.clear()
+        self._watchers.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Get cache statistics, like functools.lru_cache's cache_info.
+
+        Returns:
+            CacheInfo: The lookups answered from the cache, the lookups
+                that built a new entry and the number of cached pieces.
+        """
+        return CacheInfo(self._hits, self._misses, len(self._cache))
+
+    def iter_moves(self, piece: 'Piece') -> Iterator[int]:
+        """
+        Lazily generate the moves of a piece as packed integers.
+
+        Args:
+            piece (Piece): The piece to generate moves for.
+
+        Yields:
+            int: Packed MOVE, see move_encoding.
+        """
+        slots = self.board.get_slots()
+        index = self.board.get_piece_index(piece)
+        base = encode_move(index, 0, MOVE)
+        for ray in self._tables.get(piece).move_rays[index]:
+            for square in ray:
                 # Piece already at location
-                if self.board.get_piece_at((row, col)):
+                if slots[square] is not None:
                     break
+                yield base | encode_move(0, square)
 
-                moves.append(MoveAction(piece, (row, col)))
-        return moves
+    def iter_attacks(self, piece: 'Piece') -> Iterator[int]:
+        """
+        Lazily generate the attacks of a piece as packed integers.
 
-    def get_valid_attacks(self, piece: 'Piece') -> List[AttackAction]:
-        attacks = []
-        position = self.board.get_piece_position(piece)
-        for dx, dy in piece.get_move_directions():
-            for i in range(1, piece.get_attack_range() + 1):
-                row = position[0] + dy * i
-                col = position[1] + dx * i
-
-                # Out of bounds
-                if not self.board.in_bounds((row, col)):
-                    break
+        Args:
+            piece (Piece): The piece to generate attacks for.
 
-                target = self.board.get_piece_at((row, col))
+        Yields:
+            int: Packed ATTACK, see move_encoding.
+        """
+        slots = self.board.get_slots()
+        index = self.board.get_piece_index(piece)
+        base = encode_move(index, 0, ATTACK)
+        side = piece.side
+        for ray in self._tables.get(piece).attack_rays[index]:
+            for square in ray:
+                target = slots[square]
                 # No target at position
-                if not target:
+                if target is None:
                     continue
-                attacks.append(AttackAction(piece, piece.get_damage(), target))
-        return attacks
+                # First piece on the ray blocks it, only enemies are targets
+                if target.side != side:
+                    yield base | encode_move(0, square)
+                break
+
+    def generate_all(self, side: Side) -> List[int]:
+        """
+        Generate every move and attack of a side in a single pass over the
+        board, without per-piece position lookups.
+
+        Args:
+            side (Side): The side to generate for.
+
+        Returns:
+            List[int]: Packed MOVE and ATTACK moves, see move_encoding.
+        """
+        packed = []
+        append = packed.append
+        slots = self.board.get_slots()
+        get_table = self._tables.get
+        attack_kind = encode_move(0, 0, ATTACK)
+        for index, piece in enumerate(slots):
+            if piece is None or piece.side != side:
+                continue
+            table = get_table(piece)
+
+            for ray in table.move_rays[index]:
+                for square in ray:
+                    if slots[square] is not None:
+                        break
+                    append(encode_move(index, square))
+
+            base = attack_kind | index
+            for ray in table.attack_rays[index]:
+                for square in ray:
+                    target = slots[square]
+                    if target is None:
+                        continue
+                    if target.side != side:
+                        append(base | encode_move(0, square))
+                    break
+        return packed
+
+    def to_action(self, packed: int) -> Action:
+        """
+        Decode a packed move into an Action against the current board.
+
+        Args:
+            packed (int): The packed move.
+
+        Returns:
+            Action: The MoveAction or AttackAction it encodes.
+        """
+        from_square, to_square, kind = decode_move(packed)
+        piece = self.board.get_piece_at_index(from_square)
+        if kind == ATTACK:
+            target = self.board.get_piece_at_index(to_square)
+            return AttackAction(piece, piece.get_damage(), target)
+        return MoveAction(piece, self.board.to_position(to_square))
+
+    def is_legal(self, action: Action) -> bool:
+        """
+        Check a single action against the board without enumerating the
+        actor's other actions. Only the squares between the actor and the
+        target are inspected.
+
+        Args:
+            action (Action): The MoveAction or AttackAction to check.
+
+        Returns:
+            bool: True if the action is legal, False otherwise.
+        """
+        board = self.board
+        actor = action.actor
+        if not board.contains_piece(actor):
+            return False
+        index = board.get_piece_index(actor)
+        slots = board.get_slots()
+        table = self._tables.get(actor)
+
+        if isinstance(action, MoveAction):
+            if not board.in_bounds(action.position):
+                return False
+            entry = table.move_targets[index].get(
+                board.to_index(action.position)
+            )
+            if entry is None:
+                return False
+            ray, step = entry
+            # Every square up to and including the target must be empty
+            for square in ray[:step + 1]:
+                if slots[square] is not None:
+                    return False
+            return True
+
+        if isinstance(action, AttackAction):
+            target = action.target
+            if (
+                action.damage != actor.get_damage()
+                or target.side == actor.side
+                or not board.contains_piece(target)
+            ):
+                return False
+            entry = table.attack_targets[index].get(
+                board.get_piece_index(target)
+            )
+            if entry is None:
+                return False
+            ray, step = entry
+            # Every square before the target must be empty
+            for square in ray[:step]:
+                if slots[square] is not None:
+                    return False
+            return True
+
+        return False
+
+    def _build_moves(self, piece: 'Piece') -> List[MoveAction]:
+        to_position = self.board.to_position
+        return [
+            MoveAction(piece, to_position(move_to(packed)))
+            for packed in self.iter_moves(piece)
+        ]
+
+    def _build_attacks(self, piece: 'Piece') -> List[AttackAction]:
+        slots = self.board.get_slots()
+        damage = piece.get_damage()
+        return [
+            AttackAction(piece, damage, slots[move_to(packed)])
+            for packed in self.iter_attacks(piece)
+        ]
+
+    def get_valid_moves(self, piece: 'Piece') -> List[MoveAction]:
+        if self._use_cache:
+            return list(self._get_entry(piece).moves)
+        return self._build_moves(piece)
+
+    def get_valid_attacks(self, piece: 'Piece') -> List[AttackAction]:
+        if self._use_cache:
+            return list(self._get_entry(piece).attacks)
+        return self._build_attacks(piece)
+
+    # --- Cache ---
+    def _footprint(self, piece: 'Piece', index: int) -> Tuple[int, ...]:
+        """
+        Get the squares whose contents decide a piece's actions: its own
+        square and every ray square up to and including the first blocker.
+        """
+        slots = self.board.get_slots()
+        table = self._tables.get(piece)
+        squares = {index}
+        for rays in (table.move_rays[index], table.attack_rays[index]):
+            for ray in rays:
+                for square in ray:
+                    squares.add(square)
+                    if slots[square] is not None:
+                        break
+        return tuple(squares)
+
+    def _get_entry(self, piece: 'Piece') -> _CacheEntry:
+        entry = self._cache.get(piece.id)
+        if entry is not None:
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        index = self.board.get_piece_index(piece)
+        entry = _CacheEntry(
+            self._build_moves(piece),
+            self._build_attacks(piece),
+            self._footprint(piece, index),
+        )
+        self._cache[piece.id] = entry
+        for square in entry.footprint:
+            self._watchers.setdefault(square, set()).add(piece.id)
+        return entry
+
+    def _invalidate(self, id: EntityId):
+        entry = self._cache.pop(id, None)
+        if entry is None:
+            return
+        for square in entry.footprint:
+            self._watchers[square].discard(id)
+
+    def _on_change(self, change: BoardChange):
+        # Actions do not depend on hp
+        if change.kind == ChangeKind.HP:
+            return
+        self._invalidate(change.piece.id)
+        for square in change.squares:
+            watchers = self._watchers.get(square)
+            if watchers:
+                for id in list(watchers):
+                    self._invalidate(id)
@@ -0,0 +1,54 @@
+from typing import Tuple
+
+# Packed move layout: bits 0-15 from square, bits 16-31 to square,
+# bits 32+ kind. Squares are board square indices (row * cols + col).
+MOVE = 0
+ATTACK = 1
+
+_SQUARE_BITS = 16
+_SQUARE_MASK = (1 << _SQUARE_BITS) - 1
+_KIND_SHIFT = 2 * _SQUARE_BITS
+
+
+def encode_move(from_square: int, to_square: int, kind: int = MOVE) -> int:
+    """
+    Pack a move into a single integer.
+
+    Args:
+        from_square (int): Square index of the acting piece.
+        to_square (int): Square index moved to or attacked.
+        kind (int, optional): MOVE or ATTACK. Defaults to MOVE.
+
+    Returns:
+        int: The packed move.
+    """
+    return (kind << _KIND_SHIFT) | (to_square << _SQUARE_BITS) | from_square
+
+
+def decode_move(packed: int) -> Tuple[int, int, int]:
+    """
+    Unpack a move packed with encode_move.
+
+    Args:
+        packed (int): The packed move.
+
+    Returns:
+        Tuple[int, int, int]: The (from_square, to_square, kind).
+    """
+    return (
+        packed & _SQUARE_MASK,
+        (packed >> _SQUARE_BITS) & _SQUARE_MASK,
+        packed >> _KIND_SHIFT,
+    )
+
+
+def move_from(packed: int) -> int:
+    return packed & _SQUARE_MASK
+
+
+def move_to(packed: int) -> int:
+    return (packed >> _SQUARE_BITS) & _SQUARE_MASK
+
+
+def move_kind(packed: int) -> int:
+    return packed >> _KIND_SHIFT
@@ -0,0 +1,150 @@
+from functools import lru_cache
+from typing import Dict, List, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.backend.entities.pieces import Piece
+from src.backend.foundations.types import Vector2
+
+# A ray is the ordered squares a piece can reach in one direction, already
+# clipped to the board and the piece's range.
+Ray = Tuple[int, ...]
+SquareRays = Tuple[Ray, ...]
+# Maps a reachable square to the ray that reaches it and its step on the ray
+SquareTargets = Dict[int, Tuple[Ray, int]]
+
+
+class PieceTable:
+    """
+    Precomputed move and attack rays for one piece type and side on one
+    board size, indexed by the square the piece stands on. The target maps
+    give direct access to the ray reaching any square.
+    """
+    __slots__ = (
+        "move_rays", "attack_rays", "move_targets", "attack_targets"
+    )
+
+    def __init__(
+        self,
+        move_rays: Tuple[SquareRays, ...],
+        attack_rays: Tuple[SquareRays, ...]
+    ):
+        self.move_rays = move_rays
+        self.attack_rays = attack_rays
+        self.move_targets = _build_targets(move_rays)
+        self.attack_targets = _build_targets(attack_rays)
+
+
+def _build_targets(
+    table: Tuple[SquareRays, ...]
+) -> Tuple[SquareTargets, ...]:
+    """
+    Index the rays of every square by the squares they reach.
+
+    Args:
+        table (Tuple[SquareRays, ...]): The rays for each square index.
+
+    Returns:
+        Tuple[SquareTargets, ...]: The target map for each square index.
+    """
+    return tuple(
+        {
+            square: (ray, step)
+            for ray in rays
+            for step, square in enumerate(ray)
+        }
+        for rays in table
+    )
+
+
+def _build_rays(
+    rows: int,
+    cols: int,
+    directions: List[Vector2],
+    max_range: int
+) -> Tuple[SquareRays, ...]:
+    """
+    Build the rays for every square of a board.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of cols.
+        directions (List[Vector2]): The (dx, dy) directions to walk.
+        max_range (int): The maximum number of steps along a direction.
+
+    Returns:
+        Tuple[SquareRays, ...]: The non-empty rays for each square index.
+    """
+    table = []
+    for row in range(rows):
+        for col in range(cols):
+            rays = []
+            for dx, dy in directions:
+                ray = []
+                for i in range(1, max_range + 1):
+                    r = row + dy * i
+                    c = col + dx * i
+                    if not (0 <= r < rows and 0 <= c < cols):
+                        break
+                    ray.append(r * cols + c)
+                if ray:
+                    rays.append(tuple(ray))
+            table.append(tuple(rays))
+    return tuple(table)
+
+
+class MoveTables:
+    """
+    Piece tables for one board size. Tables are built the first time a
+    piece type and side is seen and shared by every board of that size.
+    """
+    def __init__(self, rows: int, cols: int):
+        """
+        Create the tables for a board size.
+
+        Args:
+            rows (int): Number of rows.
+            cols (int): Number of cols.
+        """
+        self._rows = rows
+        self._cols = cols
+        self._tables: Dict[Tuple[type, int], PieceTable] = {}
+
+    def get(self, piece: 'Piece') -> PieceTable:
+        """
+        Get the table for a piece's type and side.
+
+        Args:
+            piece (Piece): The piece to get the table for.
+
+        Returns:
+            PieceTable: The shared table.
+        """
+        key = (type(piece), piece.side)
+        table = self._tables.get(key)
+        if table is None:
+            table = PieceTable(
+                _build_rays(
+                    self._rows, self._cols,
+                    piece.get_move_directions(), piece.get_move_range()
+                ),
+                _build_rays(
+                    self._rows, self._cols,
+                    piece.get_attack_directions(), piece.get_attack_range()
+                ),
+            )
+            self._tables[key] = table
+        return table
+
+
+@lru_cache(maxsize=None)
+def get_move_tables(rows: int, cols: int) -> MoveTables:
+    """
+    Get the move tables shared by all boards of a size.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of cols.
+
+    Returns:
+        MoveTables: The shared tables.
+    """
+    return MoveTables(rows, cols)
@@ -0,0 +1,163 @@
+from .move_tables import get_move_tables
+from src.backend.board import BoardChange, ChangeKind
+from src.backend.foundations.types import EntityId, Side, Vector2
+from typing import Dict, List, Set, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.backend.board import Board
+    from src.backend.entities.pieces import Piece
+
+
+class ThreatMap:
+    """
+    Per-side attack counts for every square of a board. A square is
+    attacked by a piece if one of the piece's attack rays reaches it before
+    or at the first occupied square. The map listens to the board and only
+    recomputes the pieces whose rays pass through the squares that changed.
+    """
+    def __init__(self, board: 'Board'):
+        """
+        Create a threat map for a board and start tracking it.
+
+        Args:
+            board (Board): The board to track.
+        """
+        self.board = board
+        self._tables = get_move_tables(*board.get_size())
+        rows, cols = board.get_size()
+        size = rows * cols
+        self._counts: List[List[int]] = [[0] * size for _ in Side]
+        # Per square, the ids of pieces attacking it
+        self._attackers: List[Set[EntityId]] = [set() for _ in range(size)]
+        # Per piece id, (piece, origin square, attacked squares)
+        self._records: Dict[
+            EntityId, Tuple['Piece', int, Tuple[int, ...]]
+        ] = {}
+        # Per origin square, the id of the tracked piece standing there
+        self._origins: Dict[int, EntityId] = {}
+
+        for index, piece in enumerate(board.get_slots()):
+            if piece is not None:
+                self._add(piece, index)
+        board.add_listener(self._on_change)
+
+    def close(self):
+        """
+        Stop tracking the board.
+        """
+        self.board.remove_listener(self._on_change)
+
+    # --- Queries ---
+    def is_attacked(self, position: Vector2, by_side: Side) -> bool:
+        """
+        Check if any piece of a side attacks a position.
+
+        Args:
+            position (Vector2): The position to check.
+            by_side (Side): The attacking side.
+
+        Returns:
+            bool: True if the position is attacked, False otherwise.
+        """
+        return self._counts[by_side][self.board.to_index(position)] > 0
+
+    def get_attack_count(self, position: Vector2, by_side: Side) -> int:
+        """
+        Get the number of pieces of a side attacking a position.
+
+        Args:
+            position (Vector2): The position to check.
+            by_side (Side): The attacking side.
+
+        Returns:
+            int: The number of attackers.
+        """
+        return self._counts[by_side][self.board.to_index(position)]
+
+    def get_attackers(
+        self,
+        position: Vector2,
+        by_side: Side
+    ) -> List['Piece']:
+        """
+        Get the pieces of a side attacking a position.
+
+        Args:
+            position (Vector2): The position to check.
+            by_side (Side): The attacking side.
+
+        Returns:
+            List[Piece]: The attacking pieces.
+        """
+        index = self.board.to_index(position)
+        pieces = (self._records[id][0] for id in self._attackers[index])
+        return [piece for piece in pieces if piece.side == by_side]
+
+    def get_counts(self, by_side: Side) -> List[int]:
+        """
+        Get the attack counts of a side for every square index. The list is
+        the map's own storage and must not be modified.
+
+        Args:
+            by_side (Side): The attacking side.
+
+        Returns:
+            List[int]: The attack count per square index.
+        """
+        return self._counts[by_side]
+
+    # --- Updates ---
+    def _scan(self, piece: 'Piece', index: int) -> Tuple[int, ...]:
+        """
+        Walk the attack rays of a piece up to the first occupied square.
+        """
+        slots = self.board.get_slots()
+        squares = []
+        for ray in self._tables.get(piece).attack_rays[index]:
+            for square in ray:
+                squares.append(square)
+                if slots[square] is not None:
+                    break
+        return tuple(squares)
+
+    def _add(self, piece: 'Piece', index: int):
+        squares = self._scan(piece, index)
+        counts = self._counts[piece.side]
+        for square in squares:
+            counts[square] += 1
+            self._attackers[square].add(piece.id)
+        self._records[piece.id] = (piece, index, squares)
+        self._origins[index] = piece.id
+
+    def _drop(self, id: EntityId) -> 'Piece':
+        piece, index, squares = self._records.pop(id)
+        counts = self._counts[piece.side]
+        for square in squares:
+            counts[square] -= 1
+            self._attackers[square].discard(id)
+        if self._origins.get(index) == id:
+            del self._origins[index]
+        return piece
+
+    def _on_change(self, change: BoardChange):
+        # Attacks do not depend on hp
+        if change.kind == ChangeKind.HP:
+            return
+        board = self.board
+        affected = set()
+        for square in change.squares:
+            affected.update(self._attackers[square])
+            if square in self._origins:
+                affected.add(self._origins[square])
+        if change.piece.id in self._records:
+            affected.add(change.piece.id)
+
+        pieces = [self._drop(id) for id in affected]
+        # Pieces that just arrived on a changed square
+        for square in change.squares:
+            piece = board.get_piece_at_index(square)
+            if piece is not None and piece.id not in affected:
+                pieces.append(piece)
+
+        for piece in pieces:
+            if board.contains_piece(piece):
+                self._add(piece, board.get_piece_index(piece))
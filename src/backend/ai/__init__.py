@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .search_engine import SearchEngine, SearchResult, evaluate
+    from .transposition_table import TranspositionTable
+
+__all__ = [
+    "SearchEngine",
+    "SearchResult",
+    "evaluate",
+    "TranspositionTable",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".search_engine": ("SearchEngine", "SearchResult", "evaluate"),
+    ".transposition_table": ("TranspositionTable",),
+})
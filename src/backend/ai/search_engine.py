@@ -0,0 +1,292 @@
+import random
+import time
+from typing import List, NamedTuple, Optional, TYPE_CHECKING
+from src.backend.actions import Action, ActionValidator
+from src.backend.actions.move_encoding import ATTACK, decode_move
+from src.backend.entities.pieces import King
+from src.backend.foundations.types import Side
+from .transposition_table import EXACT, LOWER, UPPER, TranspositionTable
+if TYPE_CHECKING:
+    from src.backend.board import Board
+
+MATE_SCORE = 1_000_000
+INFINITY = 2 * MATE_SCORE
+# Scores beyond this are mates, counted in plies from the searched node
+_MATE_THRESHOLD = MATE_SCORE - 10_000
+
+# Nodes searched between deadline checks
+_CLOCK_INTERVAL = 32
+
+# Keys XORed into the position hash for the side to move
+_SIDE_KEYS = tuple(random.Random(side).getrandbits(64) for side in Side)
+
+# Move ordering scores
+_TT_MOVE_ORDER = 1 << 30
+_ATTACK_ORDER = 1 << 20
+
+
+class SearchResult(NamedTuple):
+    action: Optional[Action]
+    score: int
+    depth: int
+    nodes: int
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def _to_table(score: int, ply: int) -> int:
+    """
+    Make a mate score relative to the node it is stored for, rather than
+    the root, so it stays correct when read at another ply or root.
+    """
+    if score >= _MATE_THRESHOLD:
+        return score + ply
+    if score <= -_MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _from_table(score: int, ply: int) -> int:
+    """
+    Make a stored mate score relative to the root again.
+    """
+    if score >= _MATE_THRESHOLD:
+        return score - ply
+    if score <= -_MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+def evaluate(board: 'Board', side: Side) -> int:
+    """
+    Score a position for a side. Pieces are worth their max hp plus their
+    current hp, so wearing a piece down is rewarded before it is captured.
+
+    Args:
+        board (Board): The board to score.
+        side (Side): The side to score for.
+
+    Returns:
+        int: The score, positive if side is ahead.
+    """
+    score = 0
+    for piece in board.get_slots():
+        if piece is None:
+            continue
+        value = piece.archetype.hp + piece.hp
+        score += value if piece.side == side else -value
+    return score
+
+
+class SearchEngine:
+    """
+    Iterative-deepening alpha-beta search over make/unmake on a private
+    copy of the board. Attacks are searched first, ordered by damage over
+    target hp, and capturing the enemy king ends the line. Search stops
+    when the time budget runs out and returns the best move of the last
+    completed depth.
+    """
+    def __init__(
+        self,
+        time_budget: float = 0.05,
+        max_depth: int = 32,
+        table_size: int = 1 << 16
+    ):
+        """
+        Create a search engine.
+
+        Args:
+            time_budget (float, optional): Seconds allowed per search.
+                Defaults to 0.05.
+            max_depth (int, optional): Deepest iteration. Defaults to 32.
+            table_size (int, optional): Transposition table slots. Defaults
+                to 65536.
+        """
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table = TranspositionTable(table_size)
+        self._board: Optional['Board'] = None
+        self._validator: Optional[ActionValidator] = None
+        self._deadline = 0.0
+        self._nodes = 0
+
+    def search(self, board: 'Board', side: Side) -> SearchResult:
+        """
+        Find the best action for a side.
+
+        Args:
+            board (Board): The position to search. It is not modified.
+            side (Side): The side to move.
+
+        Returns:
+            SearchResult: The best action (None if the side has none), its
+                score, the depth completed and the nodes searched.
+        """
+        self._deadline = time.perf_counter() + self.time_budget
+        self._nodes = 0
+        self.table.new_search()
+        # Search a copy that hashes hp, so damaged positions differ
+        self._board = board.clone(hp_bucket_size=1)
+        self._validator = ActionValidator(self._board)
+
+        best_move = None
+        best_score = 0
+        completed = 0
+        moves = self._validator.generate_all(side)
+        if moves:
+            best_move = self._order(moves, None)[0]
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, move = self._search_root(side, depth, moves)
+            except _SearchTimeout:
+                break
+            best_score, best_move, completed = score, move, depth
+            if abs(score) >= MATE_SCORE - self.max_depth:
+                break
+
+        self._board = None
+        self._validator = None
+        action = None
+        if best_move is not None:
+            action = ActionValidator(board).to_action(best_move)
+        return SearchResult(action, best_score, completed, self._nodes)
+
+    # --- Search ---
+    def _search_root(self, side: Side, depth: int, moves: List[int]):
+        board = self._board
+        if not moves:
+            return evaluate(board, side), None
+        undo_depth = board.get_undo_depth()
+        key = board.get_hash() ^ _SIDE_KEYS[side]
+        entry = self.table.probe(key)
+        ordered = self._order(moves, entry.move if entry else None)
+
+        alpha = -INFINITY
+        best_move = ordered[0]
+        try:
+            for packed in ordered:
+                self._check_deadline()
+                if self._make(packed):
+                    score = MATE_SCORE - 1
+                else:
+                    score = -self._negamax(
+                        side.opponent, depth - 1, -INFINITY, -alpha, 1
+                    )
+                board.unmake()
+                if score > alpha:
+                    alpha = score
+                    best_move = packed
+        except _SearchTimeout:
+            while board.get_undo_depth() > undo_depth:
+                board.unmake()
+            raise
+
+        self.table.store(key, depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    def _negamax(
+        self,
+        side: Side,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int
+    ) -> int:
+        self._nodes += 1
+        if not self._nodes % _CLOCK_INTERVAL:
+            self._check_deadline()
+
+        board = self._board
+        key = board.get_hash() ^ _SIDE_KEYS[side]
+        entry = self.table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move = entry.move
+            if entry.depth >= depth:
+                score = _from_table(entry.score, ply)
+                if entry.bound == EXACT:
+                    return score
+                if entry.bound == LOWER and score >= beta:
+                    return score
+                if entry.bound == UPPER and score <= alpha:
+                    return score
+
+        if depth <= 0:
+            return evaluate(board, side)
+
+        moves = self._validator.generate_all(side)
+        if not moves:
+            return evaluate(board, side)
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = None
+        for packed in self._order(moves, table_move):
+            if self._make(packed):
+                score = MATE_SCORE - ply - 1
+            else:
+                score = -self._negamax(
+                    side.opponent, depth - 1, -beta, -alpha, ply + 1
+                )
+            board.unmake()
+
+            if score > best_score:
+                best_score = score
+                best_move = packed
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table.store(
+            key, depth, _to_table(best_score, ply), bound, best_move
+        )
+        return best_score
+
+    def _check_deadline(self):
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+    def _make(self, packed: int) -> bool:
+        """
+        Make a packed move on the search board.
+
+        Returns:
+            bool: True if the move captured a king.
+        """
+        board = self._board
+        from_square, to_square, kind = decode_move(packed)
+        piece = board.get_piece_at_index(from_square)
+        if kind == ATTACK:
+            target = board.get_piece_at_index(to_square)
+            captured = board.make_attack(target, piece.get_damage())
+            return captured and isinstance(target, King)
+        board.make_move(piece, board.to_position(to_square))
+        return False
+
+    def _order(self, moves: List[int], table_move: Optional[int]) -> List[int]:
+        """
+        Order moves: the table move, then attacks by damage over target hp,
+        then quiet moves.
+        """
+        slots = self._board.get_slots()
+
+        def priority(packed: int) -> int:
+            if packed == table_move:
+                return _TT_MOVE_ORDER
+            from_square, to_square, kind = decode_move(packed)
+            if kind != ATTACK:
+                return 0
+            damage = slots[from_square].get_damage()
+            return _ATTACK_ORDER + damage * 1024 // max(slots[to_square].hp, 1)
+
+        return sorted(moves, key=priority, reverse=True)
@@ -0,0 +1,95 @@
+from typing import List, NamedTuple, Optional
+
+# Score bounds stored with an entry
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class TableEntry(NamedTuple):
+    key: int
+    depth: int
+    score: int
+    bound: int
+    move: Optional[int]
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results keyed by position hash. Each
+    position maps to one slot. A slot is replaced when it is empty, holds
+    the same position, was written by an older search, or holds a result
+    searched no deeper than the new one.
+    """
+    def __init__(self, size: int = 1 << 16):
+        """
+        Create a table.
+
+        Args:
+            size (int, optional): Number of slots, rounded up to a power of
+                two. Defaults to 65536.
+        """
+        size = 1 << max(size - 1, 1).bit_length()
+        self._mask = size - 1
+        self._slots: List[Optional[TableEntry]] = [None] * size
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def new_search(self):
+        """
+        Age the table so entries from earlier searches are replaced first.
+        """
+        self._generation += 1
+
+    def clear(self):
+        self._slots = [None] * len(self._slots)
+
+    def probe(self, key: int) -> Optional[TableEntry]:
+        """
+        Look up a position.
+
+        Args:
+            key (int): The position hash.
+
+        Returns:
+            Optional[TableEntry]: The stored entry, or None if absent.
+        """
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry.key == key:
+            return entry
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: int,
+        bound: int,
+        move: Optional[int]
+    ):
+        """
+        Store a search result, subject to the replacement policy.
+
+        Args:
+            key (int): The position hash.
+            depth (int): The remaining depth searched.
+            score (int): The score found.
+            bound (int): EXACT, LOWER or UPPER.
+            move (int, optional): The best packed move found.
+        """
+        index = key & self._mask
+        entry = self._slots[index]
+        if (
+            entry is None
+            or entry.key == key
+            or entry.generation != self._generation
+            or depth >= entry.depth
+        ):
+            if move is None and entry is not None and entry.key == key:
+                move = entry.move
+            self._slots[index] = TableEntry(
+                key, depth, score, bound, move, self._generation
+            )
@@ -1,5 +1,27 @@
-from .board import Board
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .board import Board
+    from .codec import decode_board, decode_piece, encode_board, encode_piece
+    from .delta import DeltaRecorder, apply_delta, get_delta_tick
+    from .events import BoardChange, ChangeKind
 
 __all__ = [
-    "Board"
+    "Board",
+    "BoardChange",
+    "ChangeKind",
+    "DeltaRecorder",
+    "apply_delta",
+    "get_delta_tick",
+    "decode_board",
+    "decode_piece",
+    "encode_board",
+    "encode_piece",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".board": ("Board",),
+    ".codec": ("decode_board", "decode_piece", "encode_board", "encode_piece"),
+    ".delta": ("DeltaRecorder", "apply_delta", "get_delta_tick"),
+    ".events": ("BoardChange", "ChangeKind"),
+})
@@ -1,49 +1,48 @@
-from src.backend.foundations.types import Vector2
-from typing import Dict, Optional, TYPE_CHECKING
+from src.backend.foundations.types import EntityId, Vector2
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from .events import BoardChange, ChangeKind
+from .zobrist import get_zobrist_keys
 if TYPE_CHECKING:
+    from src.backend.actions import Action
     from src.backend.entities.pieces import Piece
 
-
-class BoardTile:
-    """
-    Represents a tile on a chess board. Can contain a piece.
-    """
-    def __init__(self, piece: Optional['Piece'] = None):
-        """
-        Create a board tile with an optional piece attached.
-
-        Args:
-            piece (Piece, optional): A piece that occupies the Tile.
-        """
-        self.piece = piece
-
-    def is_empty(self) -> bool:
-        """
-        Check if the tile contains any piece.
-
-        Returns:
-            bool: Returns True if piece is None otherwise False
-        """
-        return self.piece is None
+# Undo record kinds
+_UNDO_MOVE = 0
+_UNDO_ATTACK = 1
 
 
 class Board:
     """
-    Represents a chess board. Comprised of tiles and id->position map for
-    quick lookup.
+    Represents a chess board. Squares are stored in flat arrays indexed by
+    square index (row * cols + col): an occupancy array and a parallel piece
+    slot array. An id->position map allows quick lookup of pieces, and a
+    Zobrist hash of the position is kept up to date on every mutation.
     """
-    def __init__(self, rows: int, cols: int):
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        hp_bucket_size: Optional[int] = None
+    ):
         """
         Create a board with a size.
 
         Args:
             rows (int): Number of rows.
             cols (int): Number of cols.
+            hp_bucket_size (int, optional): If set, piece hp is included in
+                the position hash in buckets of this size.
         """
         self._rows = rows
         self._cols = cols
-        self._grid = [[BoardTile() for _ in range(cols)] for _ in range(rows)]
-        self._id_position_map: Dict[str, Vector2] = {}
+        self._occupancy = bytearray(rows * cols)
+        self._slots: List[Optional['Piece']] = [None] * (rows * cols)
+        self._id_position_map: Dict[EntityId, Vector2] = {}
+        self._zobrist = get_zobrist_keys(rows * cols)
+        self._hp_bucket_size = hp_bucket_size
+        self._hash = 0
+        self._undo_stack: List[Tuple] = []
+        self._listeners: List[Callable[[BoardChange], None]] = []
 
     # --- Helpers ---
     def in_bounds(self, position: Vector2):
@@ -62,23 +61,35 @@ class Board:
             and 0 <= col < self._cols
         )
 
-    def _get_tile(self, position: Vector2) -> BoardTile:
+    def to_index(self, position: Vector2) -> int:
         """
-        Get the Tile on the board at a given position.
+        Convert a position to its square index.
 
         Args:
-            position (Vector2): The position to get from.
+            position (Vector2): The position to convert.
 
         Raises:
             IndexError: If the position is out of bounds.
 
         Returns:
-            BoardTile: The tile at position.
+            int: The square index (row * cols + col).
         """
-        if not self.in_bounds(position):
-            raise IndexError(f"Position {position} is out of bounds.")
         row, col = position
-        return self._grid[row][col]
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            raise IndexError(f"Position {position} is out of bounds.")
+        return row * self._cols + col
+
+    def to_position(self, index: int) -> Vector2:
+        """
+        Convert a square index to its position.
+
+        Args:
+            index (int): The square index to convert.
+
+        Returns:
+            Vector2: The position (row, col).
+        """
+        return divmod(index, self._cols)
 
     def get_size(self) -> Vector2:
         """
@@ -89,6 +100,159 @@ class Board:
         """
         return (self._rows, self._cols)
 
+    def get_hp_bucket_size(self) -> Optional[int]:
+        """
+        Get the hp bucket size used by the position hash.
+
+        Returns:
+            Optional[int]: The bucket size, or None if hp is not hashed.
+        """
+        return self._hp_bucket_size
+
+    # --- Clone ---
+    def clone(
+        self,
+        keep_ids: bool = True,
+        memo: Dict = None,
+        hp_bucket_size: Optional[int] = ...
+    ) -> 'Board':
+        """
+        Create a copy of the board and its pieces. Only mutable state is
+        copied; the hash keys are shared and the hash is carried over. The
+        undo stack and listeners are not copied.
+
+        Args:
+            keep_ids (bool, optional): Keep piece ids (e.g. for search) or
+                allocate new ones (e.g. for spawning). Defaults to True.
+            memo (Dict, optional): A deepcopy memo to record cloned pieces
+                in.
+            hp_bucket_size (int, optional): Change how hp is hashed on the
+                copy, e.g. None to ignore hp. Defaults to the board's own.
+
+        Returns:
+            Board: The copy.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result._rows = self._rows
+        result._cols = self._cols
+        result._occupancy = bytearray(self._occupancy)
+        result._slots = [None] * len(self._slots)
+        result._id_position_map = {}
+        result._zobrist = self._zobrist
+        result._hp_bucket_size = self._hp_bucket_size
+        result._hash = self._hash
+        result._undo_stack = []
+        result._listeners = []
+
+        cols = self._cols
+        slots = self._slots
+        new_slots = result._slots
+        new_map = result._id_position_map
+        for position in self._id_position_map.values():
+            index = position[0] * cols + position[1]
+            piece = slots[index]
+            piece_copy = piece.clone(keep_ids)
+            new_slots[index] = piece_copy
+            new_map[piece_copy.id] = position
+            if memo is not None:
+                memo[id(piece)] = piece_copy
+
+        if (
+            hp_bucket_size is not ...
+            and hp_bucket_size != self._hp_bucket_size
+        ):
+            result._hp_bucket_size = hp_bucket_size
+            result.rehash()
+        return result
+
+    def __deepcopy__(self, memo) -> 'Board':
+        """
+        Create a deep copy of the board. Like deep copied entities, the
+        pieces get new ids.
+        """
+        result = self.clone(keep_ids=False, memo=memo)
+        memo[id(self)] = result
+        return result
+
+    # --- Listeners ---
+    def add_listener(self, listener: Callable[[BoardChange], None]):
+        """
+        Register a callback invoked with a BoardChange after every place,
+        move, remove or swap.
+
+        Args:
+            listener (Callable[[BoardChange], None]): The callback.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[BoardChange], None]):
+        """
+        Unregister a callback added with add_listener.
+
+        Args:
+            listener (Callable[[BoardChange], None]): The callback.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(
+        self,
+        kind: ChangeKind,
+        piece: 'Piece',
+        squares: Tuple[int, ...]
+    ):
+        change = BoardChange(kind, piece, squares)
+        for listener in self._listeners:
+            listener(change)
+
+    # --- Hash ---
+    def _piece_key(self, piece: 'Piece', index: int) -> int:
+        """
+        Get the Zobrist key of a piece standing on a square.
+
+        Args:
+            piece (Piece): The piece to key.
+            index (int): The square index of the piece.
+
+        Returns:
+            int: The 64-bit key.
+        """
+        bucket = None
+        if self._hp_bucket_size:
+            bucket = max(getattr(piece, "hp", 0), 0) // self._hp_bucket_size
+        side = getattr(piece, "side", 0)
+        return self._zobrist.get_keys(type(piece), side, bucket)[index]
+
+    def get_hash(self) -> int:
+        """
+        Get the 64-bit Zobrist hash of the current position.
+
+        Returns:
+            int: The position hash.
+        """
+        return self._hash
+
+    def compute_hash(self) -> int:
+        """
+        Compute the position hash from scratch. Used to verify or resync
+        the incrementally maintained hash.
+
+        Returns:
+            int: The position hash.
+        """
+        value = 0
+        for index, piece in enumerate(self._slots):
+            if piece is not None:
+                value ^= self._piece_key(piece, index)
+        return value
+
+    def rehash(self):
+        """
+        Recompute the position hash, e.g. after hp was changed without
+        going through damage_piece.
+        """
+        self._hash = self.compute_hash()
+
     # --- Piece ---
     def contains_piece(self, piece: 'Piece'):
         return piece.id in self._id_position_map
@@ -107,6 +271,19 @@ class Board:
             raise KeyError(f"Piece {piece} is not on the board.")
         return self._id_position_map[piece.id]
 
+    def get_piece_index(self, piece: 'Piece') -> int:
+        """
+        Get the square index on the board of a piece.
+
+        Args:
+            piece (Piece): The piece to find.
+
+        Returns:
+            int: The square index of the piece on the board.
+        """
+        row, col = self.get_piece_position(piece)
+        return row * self._cols + col
+
     def get_piece_at(self, position: Vector2) -> Optional['Piece']:
         """
         Get the piece at a given position.
@@ -114,11 +291,47 @@ class Board:
         Args:
             position (Vector2): The position to get the piece at.
 
+        Raises:
+            IndexError: If the position is out of bounds.
+
         Returns:
             Optional[Piece]: The piece at a position or None.
         """
-        tile = self._get_tile(position)
-        return tile.piece
+        return self._slots[self.to_index(position)]
+
+    def get_piece_at_index(self, index: int) -> Optional['Piece']:
+        """
+        Get the piece at a given square index. No bounds check is made.
+
+        Args:
+            index (int): The square index to get the piece at.
+
+        Returns:
+            Optional[Piece]: The piece at the square or None.
+        """
+        return self._slots[index]
+
+    def get_slots(self) -> List[Optional['Piece']]:
+        """
+        Get the piece slot array, indexed by square index. The list is the
+        board's own storage and must not be modified.
+
+        Returns:
+            List[Optional[Piece]]: The piece (or None) on every square.
+        """
+        return self._slots
+
+    def is_occupied(self, index: int) -> bool:
+        """
+        Check if the square at a given index is occupied.
+
+        Args:
+            index (int): The square index to check.
+
+        Returns:
+            bool: True if a piece occupies the square, False otherwise.
+        """
+        return self._occupancy[index] != 0
 
     def place_piece(self, piece: 'Piece', position: Vector2):
         """
@@ -135,13 +348,17 @@ class Board:
         if self.contains_piece(piece):
             raise KeyError(f"Piece {piece} is already on the board.")
 
-        tile = self._get_tile(position)
-        if not tile.is_empty():
+        index = self.to_index(position)
+        if self._occupancy[index]:
             raise ValueError(f"Position {position} is already occupied.")
 
-        # Place the piece on the tile and update id position map
-        tile.piece = piece
+        # Place the piece on the square and update id position map
+        self._occupancy[index] = 1
+        self._slots[index] = piece
         self._id_position_map[piece.id] = position
+        self._hash ^= self._piece_key(piece, index)
+        if self._listeners:
+            self._notify(ChangeKind.PLACE, piece, (index,))
 
     def move_piece(self, piece: 'Piece', new_position: Vector2):
         """
@@ -158,21 +375,28 @@ class Board:
         if not self.contains_piece(piece):
             raise KeyError(f"Piece {piece} is not on the board.")
 
-        target = self.get_piece_at(new_position)
+        new_index = self.to_index(new_position)
+        target = self._slots[new_index]
         if target is not None:
             raise ValueError(
                 f"Position {new_position} is already occupied by {target}"
             )
 
-        row, col = self.get_piece_position(piece)
-        new_row, new_col = new_position
+        index = self.get_piece_index(piece)
 
         # Set previous to new position
-        self._grid[row][col].piece = None
-        self._grid[new_row][new_col].piece = piece
+        self._occupancy[index] = 0
+        self._slots[index] = None
+        self._occupancy[new_index] = 1
+        self._slots[new_index] = piece
 
         # Update id position map to new position
         self._id_position_map[piece.id] = new_position
+        self._hash ^= (
+            self._piece_key(piece, index) ^ self._piece_key(piece, new_index)
+        )
+        if self._listeners:
+            self._notify(ChangeKind.MOVE, piece, (index, new_index))
 
     def remove_piece(self, piece: 'Piece') -> bool:
         """
@@ -187,9 +411,13 @@ class Board:
         if piece.id not in self._id_position_map:
             return False
 
-        row, col = self.get_piece_position(piece)
-        self._grid[row][col].piece = None
+        index = self.get_piece_index(piece)
+        self._occupancy[index] = 0
+        self._slots[index] = None
         del self._id_position_map[piece.id]
+        self._hash ^= self._piece_key(piece, index)
+        if self._listeners:
+            self._notify(ChangeKind.REMOVE, piece, (index,))
         return True
 
     def swap_piece(self, first: 'Piece', second: 'Piece'):
@@ -209,13 +437,178 @@ class Board:
         if second.id not in self._id_position_map:
             raise KeyError(f"Piece {second} is not on the board.")
 
-        first_row, first_col = self.get_piece_position(first)
-        second_row, second_col = self.get_piece_position(second)
+        first_position = self._id_position_map[first.id]
+        second_position = self._id_position_map[second.id]
+        first_index = self.to_index(first_position)
+        second_index = self.to_index(second_position)
 
-        # Swap the entities on respective tiles
-        self._grid[first_row][first_col].piece = second
-        self._grid[second_row][second_col].piece = first
+        # Swap the entities on respective squares
+        self._slots[first_index] = second
+        self._slots[second_index] = first
 
         # Update the id position map to reflect the swap
-        self._id_position_map[first.id] = (second_row, second_col)
-        self._id_position_map[second.id] = (first_row, first_col)
+        self._id_position_map[first.id] = second_position
+        self._id_position_map[second.id] = first_position
+        self._hash ^= (
+            self._piece_key(first, first_index)
+            ^ self._piece_key(second, second_index)
+            ^ self._piece_key(first, second_index)
+            ^ self._piece_key(second, first_index)
+        )
+        if self._listeners:
+            self._notify(ChangeKind.SWAP, first, (first_index, second_index))
+
+    def damage_piece(self, piece: 'Piece', amount: int) -> bool:
+        """
+        Apply damage to a piece, keeping the position hash in sync when hp
+        is part of the hash. A piece whose hp drops to 0 or below is
+        captured and removed from the board.
+
+        Args:
+            piece (Piece): The piece to damage.
+            amount (int): The amount of damage to apply.
+
+        Returns:
+            bool: True if the piece was captured, False otherwise.
+        """
+        if piece.id not in self._id_position_map:
+            piece.take_damage(amount)
+            return False
+
+        if self._hp_bucket_size:
+            index = self.get_piece_index(piece)
+            self._hash ^= self._piece_key(piece, index)
+            piece.take_damage(amount)
+            self._hash ^= self._piece_key(piece, index)
+        else:
+            piece.take_damage(amount)
+
+        if piece.hp <= 0:
+            self.remove_piece(piece)
+            return True
+        if self._listeners:
+            self._notify(
+                ChangeKind.HP, piece, (self.get_piece_index(piece),)
+            )
+        return False
+
+    def _set_hp(self, piece: 'Piece', hp: int):
+        """
+        Set the hp of a piece on the board, keeping the hash in sync.
+
+        Args:
+            piece (Piece): The piece to update.
+            hp (int): The new hp.
+        """
+        if self._hp_bucket_size:
+            index = self.get_piece_index(piece)
+            self._hash ^= self._piece_key(piece, index)
+            piece.hp = hp
+            self._hash ^= self._piece_key(piece, index)
+        else:
+            piece.hp = hp
+        if self._listeners:
+            self._notify(
+                ChangeKind.HP, piece, (self.get_piece_index(piece),)
+            )
+
+    # --- Make / Unmake ---
+    def make(self, action: 'Action'):
+        """
+        Execute an action and record how to undo it.
+
+        Args:
+            action (Action): The action to execute.
+        """
+        action.make(self)
+
+    def make_move(self, piece: 'Piece', new_position: Vector2):
+        """
+        Move a piece and record how to undo it.
+
+        Args:
+            piece (Piece): The piece to move.
+            new_position (Vector2): The position to move the piece to.
+
+        Raises:
+            KeyError: If the piece is not on the board.
+            ValueError: If an piece is already at the target position.
+        """
+        position = self.get_piece_position(piece)
+        self.move_piece(piece, new_position)
+        self._undo_stack.append((_UNDO_MOVE, piece, position))
+
+    def make_attack(self, target: 'Piece', damage: int) -> bool:
+        """
+        Damage a piece and record how to undo it, including its capture.
+
+        Args:
+            target (Piece): The piece to damage.
+            damage (int): The amount of damage to apply.
+
+        Raises:
+            KeyError: If the target is not on the board.
+
+        Returns:
+            bool: True if the target was captured, False otherwise.
+        """
+        position = self.get_piece_position(target)
+        hp = target.hp
+        captured = self.damage_piece(target, damage)
+        self._undo_stack.append(
+            (_UNDO_ATTACK, target, hp, position if captured else None)
+        )
+        return captured
+
+    def unmake(self):
+        """
+        Undo the most recent action executed with make.
+
+        Raises:
+            IndexError: If there is nothing to undo.
+        """
+        if not self._undo_stack:
+            raise IndexError("No action to unmake.")
+
+        record = self._undo_stack.pop()
+        if record[0] == _UNDO_MOVE:
+            _, piece, position = record
+            self.move_piece(piece, position)
+            return
+
+        _, target, hp, captured_position = record
+        if captured_position is not None:
+            target.hp = hp
+            self.place_piece(target, captured_position)
+        else:
+            self._set_hp(target, hp)
+
+    def rollback(self, depth: int):
+        """
+        Undo actions executed with make until the undo stack is back to a
+        depth.
+
+        Args:
+            depth (int): The undo depth to return to.
+        """
+        while len(self._undo_stack) > depth:
+            self.unmake()
+
+    def commit(self, depth: int):
+        """
+        Forget how to undo the actions made above a depth, keeping their
+        effects.
+
+        Args:
+            depth (int): The undo depth to keep.
+        """
+        del self._undo_stack[depth:]
+
+    def get_undo_depth(self) -> int:
+        """
+        Get the number of actions that can be undone.
+
+        Returns:
+            int: The size of the undo stack.
+        """
+        return len(self._undo_stack)
@@ -0,0 +1,118 @@
+import struct
+from typing import Tuple
+from src.backend.entities.pieces import PIECE_TYPES, Piece, get_kind
+from src.backend.foundations.types import Side
+from .board import Board
+
+# rows, cols, hp bucket size (0 for none), piece count
+_HEADER = struct.Struct("<HHHH")
+# kind, flags, square, hp, integer id or string id byte length
+_PIECE = struct.Struct("<BBHiQ")
+
+# Piece flags. The low bit holds the side.
+_SIDE_MASK = 0x01
+_STRING_ID = 0x80
+
+
+def encode_piece(piece: Piece, square: int) -> bytes:
+    """
+    Encode a piece and its square. Integer ids take a fixed-width record;
+    string ids are appended as UTF-8.
+
+    Args:
+        piece (Piece): The piece to encode.
+        square (int): The square index of the piece.
+
+    Returns:
+        bytes: The encoded piece.
+    """
+    flags = int(piece.side) & _SIDE_MASK
+    id = piece.id
+    if isinstance(id, str):
+        raw = id.encode("utf-8")
+        record = _PIECE.pack(
+            get_kind(piece), flags | _STRING_ID, square, piece.hp, len(raw)
+        )
+        return record + raw
+    return _PIECE.pack(get_kind(piece), flags, square, piece.hp, id)
+
+
+def decode_piece(
+    data: bytes,
+    offset: int = 0,
+    keep_id: bool = True
+) -> Tuple[Piece, int, int]:
+    """
+    Decode a piece written by encode_piece.
+
+    Args:
+        data (bytes): The buffer to read from.
+        offset (int, optional): Where the piece starts. Defaults to 0.
+        keep_id (bool, optional): Give the piece its encoded id rather
+            than a new one. Defaults to True.
+
+    Returns:
+        Tuple[Piece, int, int]: The new piece, its square index and the
+            offset just past the piece.
+    """
+    kind, flags, square, hp, id = _PIECE.unpack_from(data, offset)
+    offset += _PIECE.size
+    if flags & _STRING_ID:
+        raw = bytes(data[offset:offset + id])
+        offset += id
+        id = raw.decode("utf-8")
+    piece = PIECE_TYPES[kind](
+        id=id if keep_id else None, side=Side(flags & _SIDE_MASK)
+    )
+    piece.hp = hp
+    return piece, square, offset
+
+
+def encode_board(board: Board) -> bytes:
+    """
+    Encode the size, hash settings and pieces of a board. Undo history
+    and listeners are not encoded.
+
+    Args:
+        board (Board): The board to encode.
+
+    Returns:
+        bytes: The encoded board.
+    """
+    rows, cols = board.get_size()
+    pieces = [
+        encode_piece(piece, square)
+        for square, piece in enumerate(board.get_slots())
+        if piece is not None
+    ]
+    header = _HEADER.pack(
+        rows, cols, board.get_hp_bucket_size() or 0, len(pieces)
+    )
+    return header + b"".join(pieces)
+
+
+def decode_board(
+    data: bytes,
+    offset: int = 0,
+    keep_ids: bool = True
+) -> Board:
+    """
+    Decode a board written by encode_board into new pieces.
+
+    Args:
+        data (bytes): The buffer to read from.
+        offset (int, optional): Where the board starts. Defaults to 0.
+        keep_ids (bool, optional): Give pieces their encoded ids rather
+            than new ones. Defaults to True.
+
+    Returns:
+        Board: The new board.
+    """
+    rows, cols, bucket, count = _HEADER.unpack_from(data, offset)
+    offset += _HEADER.size
+    board = Board(rows, cols, hp_bucket_size=bucket or None)
+    for _ in range(count):
+        piece, square, offset = decode_piece(data, offset, keep_ids)
+        board.place_piece(piece, board.to_position(square))
+    return board
+
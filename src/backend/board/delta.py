@@ -0,0 +1,128 @@
+import struct
+from typing import Dict, Optional, Set, TYPE_CHECKING
+from .codec import decode_piece, encode_piece
+from .events import BoardChange
+if TYPE_CHECKING:
+    from src.backend.entities.pieces import Piece
+    from .board import Board
+
+# tick, emptied square count, piece count
+_DELTA_HEADER = struct.Struct("<IHH")
+_SQUARE = struct.Struct("<H")
+
+
+class DeltaRecorder:
+    """
+    Collects the squares a board's changes touch and encodes their final
+    state once per tick. However many events hit a square during a tick,
+    the delta carries it once: either emptied or holding a piece record
+    from the board codec.
+    """
+    def __init__(self, board: 'Board'):
+        """
+        Create a recorder and start tracking a board.
+
+        Args:
+            board (Board): The board to track.
+        """
+        self.board = board
+        self.tick = 0
+        self._dirty: Set[int] = set()
+        board.add_listener(self._on_change)
+
+    def close(self):
+        """
+        Stop tracking the board.
+        """
+        self.board.remove_listener(self._on_change)
+
+    def has_changes(self) -> bool:
+        return bool(self._dirty)
+
+    def _on_change(self, change: BoardChange):
+        self._dirty.update(change.squares)
+
+    def flush(self) -> Optional[bytes]:
+        """
+        Encode the changes since the last flush and start a new tick.
+
+        Returns:
+            Optional[bytes]: The delta, or None if nothing changed.
+        """
+        self.tick += 1
+        if not self._dirty:
+            return None
+        slots = self.board.get_slots()
+        empty = []
+        pieces = []
+        for square in sorted(self._dirty):
+            piece = slots[square]
+            if piece is None:
+                empty.append(_SQUARE.pack(square))
+            else:
+                pieces.append(encode_piece(piece, square))
+        self._dirty.clear()
+        header = _DELTA_HEADER.pack(self.tick, len(empty), len(pieces))
+        return header + b"".join(empty) + b"".join(pieces)
+
+
+def get_delta_tick(data: bytes) -> int:
+    """
+    Get the tick a delta was flushed on.
+
+    Args:
+        data (bytes): The delta.
+
+    Returns:
+        int: The recorder tick, starting at 1.
+    """
+    return _DELTA_HEADER.unpack_from(data)[0]
+
+
+def apply_delta(board: 'Board', data: bytes):
+    """
+    Apply a delta to a mirror board holding the source's state as of the
+    previous delta. Pieces are matched by id, so a moved piece keeps its
+    object and a piece that only lost hp stays in place.
+
+    Args:
+        board (Board): The mirror board to update.
+        data (bytes): A delta from DeltaRecorder.flush.
+    """
+    _, empty_count, piece_count = _DELTA_HEADER.unpack_from(data)
+    offset = _DELTA_HEADER.size
+    emptied = []
+    for _ in range(empty_count):
+        emptied.append(_SQUARE.unpack_from(data, offset)[0])
+        offset += _SQUARE.size
+    placed = []
+    for _ in range(piece_count):
+        piece, square, offset = decode_piece(data, offset)
+        placed.append((piece, square))
+
+    # Lift every piece off a touched square unless it stays there
+    lifted: Dict[object, 'Piece'] = {}
+    for square in emptied:
+        current = board.get_piece_at_index(square)
+        if current is not None:
+            board.remove_piece(current)
+            lifted[current.id] = current
+    for decoded, square in placed:
+        current = board.get_piece_at_index(square)
+        if current is not None and current.id != decoded.id:
+            board.remove_piece(current)
+            lifted[current.id] = current
+
+    for decoded, square in placed:
+        current = board.get_piece_at_index(square)
+        if current is not None:
+            # Same piece, only hp can have changed
+            if current.hp != decoded.hp:
+                board.damage_piece(current, current.hp - decoded.hp)
+            continue
+        piece = lifted.pop(decoded.id, None)
+        if piece is None:
+            piece = decoded
+        else:
+            piece.hp = decoded.hp
+        board.place_piece(piece, board.to_position(square))
@@ -0,0 +1,29 @@
+from enum import IntEnum
+from typing import NamedTuple, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.backend.entities.pieces import Piece
+
+
+class ChangeKind(IntEnum):
+    PLACE = 0
+    MOVE = 1
+    REMOVE = 2
+    SWAP = 3
+    HP = 4
+
+
+class BoardChange(NamedTuple):
+    """
+    A single mutation of a board, passed to board listeners after it is
+    applied.
+
+    Attributes:
+        kind (ChangeKind): What kind of mutation happened.
+        piece (Piece): The piece placed, moved, removed or whose hp
+            changed. For a swap, the first piece.
+        squares (Tuple[int, ...]): The square indices touched. For a move
+            or swap, (from, to) of the piece.
+    """
+    kind: ChangeKind
+    piece: 'Piece'
+    squares: Tuple[int, ...]
@@ -0,0 +1,67 @@
+import random
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys for Zobrist hashing, one per (piece type, side,
+    hp bucket, square). Keys are generated lazily per (piece type, side,
+    hp bucket) and seeded from the piece type's qualified name so that the
+    same position hashes to the same value in every process.
+    """
+    def __init__(self, size: int):
+        """
+        Create a key table for boards with a number of squares.
+
+        Args:
+            size (int): Number of squares on the board (rows * cols).
+        """
+        self._size = size
+        self._tables: Dict[Tuple[type, int, Optional[int]], List[int]] = {}
+
+    def _build(self, key: Tuple[type, int, Optional[int]]) -> List[int]:
+        cls, side, bucket = key
+        name = f"{cls.__module__}.{cls.__qualname__}:{side}:{bucket}"
+        rng = random.Random(zlib.crc32(name.encode()) ^ (self._size << 32))
+        table = [rng.getrandbits(64) for _ in range(self._size)]
+        self._tables[key] = table
+        return table
+
+    def get_keys(
+        self,
+        cls: type,
+        side: int,
+        bucket: Optional[int] = None
+    ) -> List[int]:
+        """
+        Get the per-square keys for a piece type, side and hp bucket.
+
+        Args:
+            cls (type): The piece type.
+            side (int): The side the piece belongs to.
+            bucket (int, optional): The hp bucket, None if hp is not hashed.
+
+        Returns:
+            List[int]: One 64-bit key per square index.
+        """
+        key = (cls, side, bucket)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._build(key)
+        return table
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(size: int) -> ZobristKeys:
+    """
+    Get the key table shared by all boards with a number of squares.
+
+    Args:
+        size (int): Number of squares on the board (rows * cols).
+
+    Returns:
+        ZobristKeys: The shared key table.
+    """
+    return ZobristKeys(size)
@@ -0,0 +1,114 @@
+import argparse
+from typing import List, Optional
+from src.backend.foundations.constants import TICK_RATE
+from src.backend.game.auto_battle import AutoBattle
+from src.backend.game.loop import GameLoop
+
+
+def run_headless(battle: AutoBattle, max_ticks: Optional[int] = None):
+    """
+    Run a battle to the end on a headless game loop, without pygame.
+
+    Args:
+        battle (AutoBattle): The battle to run.
+        max_ticks (int, optional): Tick limit. Defaults to no limit.
+    """
+    def update(dt: float):
+        battle.update(dt)
+        if battle.finished:
+            loop.stop()
+
+    loop = GameLoop(update, tick_rate=TICK_RATE)
+    loop.run(max_ticks)
+    winner = battle.winner.name if battle.winner is not None else "none"
+    print(f"Finished after {battle.turns} turns, winner: {winner}")
+
+
+async def serve_forever(
+    host: str,
+    port: int,
+    unix: Optional[str] = None,
+    database: str = "matches.db",
+    save_interval: float = 30.0
+):
+    """
+    Run a match server until cancelled. Matches saved in the database are
+    resumed at start, and matches are saved to it while serving and on
+    shutdown.
+
+    Args:
+        host (str): The address to bind.
+        port (int): The TCP port.
+        unix (str, optional): A Unix socket path to listen on instead.
+        database (str, optional): The SQLite file matches are saved to.
+            Defaults to matches.db.
+        save_interval (float, optional): Seconds between saves. Defaults
+            to 30.
+    """
+    from src.backend.persistence import MatchStore
+    from src.backend.server import MatchServer
+
+    with MatchStore(database) as store:
+        server = MatchServer(store=store, save_interval=save_interval)
+        restored = server.restore(store.load_matches())
+        if unix is not None:
+            listener = await server.serve_unix(unix)
+        else:
+            listener = await server.serve(host, port)
+        print(f"Resumed {restored} matches from {database}")
+        print("Serving on", ", ".join(
+            str(sock.getsockname()) for sock in listener.sockets
+        ))
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Backend entry point. Runs a headless battle, the match server with
+    the "serve" command, or a tournament with the "tournament" command.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run Chess-RPG without a display."
+    )
+    commands = parser.add_subparsers(dest="command")
+    battle = commands.add_parser("battle", help="Run one auto battle.")
+    battle.add_argument("--seed", type=int, default=None)
+    battle.add_argument("--max-ticks", type=int, default=None)
+    serve = commands.add_parser("serve", help="Run the match server.")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument(
+        "--unix", default=None, help="Listen on a Unix socket path instead."
+    )
+    serve.add_argument(
+        "--db", default="matches.db",
+        help="SQLite file matches are saved to and resumed from."
+    )
+    serve.add_argument("--save-interval", type=float, default=30.0)
+    commands.add_parser(
+        "tournament", add_help=False,
+        help="Run a self-play tournament, see its --help."
+    )
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command == "tournament":
+        # Only tournaments need the process pool machinery
+        from src.backend.simulation.tournament import main as tournament
+        tournament(rest)
+        return
+    if args.command == "serve":
+        # Only the server needs the event loop machinery
+        import asyncio
+        asyncio.run(serve_forever(
+            args.host, args.port, args.unix, args.db, args.save_interval
+        ))
+        return
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    run_headless(
+        AutoBattle(seed=getattr(args, "seed", None)),
+        getattr(args, "max_ticks", None)
+    )
@@ -0,0 +1,13 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .instrumentation import Instrumentation, OperationStats
+
+__all__ = [
+    "Instrumentation",
+    "OperationStats",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".instrumentation": ("Instrumentation", "OperationStats"),
+})
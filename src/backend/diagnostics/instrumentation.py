@@ -0,0 +1,208 @@
+import json
+import sys
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Board mutations recorded by default. Nested calls are recorded too, so
+# make_move also counts the move_piece it performs.
+BOARD_METHODS = (
+    "place_piece",
+    "move_piece",
+    "remove_piece",
+    "swap_piece",
+    "damage_piece",
+    "make_move",
+    "make_attack",
+    "unmake",
+)
+VALIDATOR_METHODS = ("get_valid_moves", "get_valid_attacks")
+
+
+class OperationStats:
+    """
+    Counters for one instrumented method. Time is inclusive of nested
+    instrumented calls. Allocations are the net change in allocated memory
+    blocks over the call, so they can be negative when a call frees more
+    than it allocates.
+    """
+    __slots__ = ("calls", "seconds", "allocations")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.allocations = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "allocations": self.allocations,
+        }
+
+
+class Instrumentation:
+    """
+    Opt-in call counters for hot methods. Enabling replaces each target
+    method on its class with a recording wrapper and disabling puts the
+    original back, so a disabled instrumentation adds no cost per call.
+    Only methods a class defines itself are wrapped, so a method is
+    recorded once under the class defining it, and only one
+    instrumentation can wrap a method at a time.
+    """
+    def __init__(self, targets: Optional[List[Tuple[type, str]]] = None):
+        """
+        Create an instrumentation.
+
+        Args:
+            targets (List[Tuple[type, str]], optional): The (class, method
+                name) pairs to record. Methods the class inherits are
+                skipped. Defaults to the Board mutations,
+                ActionValidator.get_valid_moves/get_valid_attacks and the
+                execute method of every Action subclass defining one.
+        """
+        self._targets = targets
+        self._stats: Dict[str, OperationStats] = {}
+        # Per label, the class and the method it had before enabling
+        self._originals: Dict[str, Tuple[type, str, Callable]] = {}
+
+    def is_enabled(self) -> bool:
+        return bool(self._originals)
+
+    def enable(self):
+        """
+        Start recording. Does nothing if already enabled.
+
+        Raises:
+            RuntimeError: If another instrumentation is recording one of
+                the targets.
+        """
+        if self.is_enabled():
+            return
+        targets = [
+            (cls, name) for cls, name in self._resolve_targets()
+            if name in cls.__dict__
+        ]
+        for cls, name in targets:
+            if getattr(cls.__dict__[name], "_instrumented", False):
+                raise RuntimeError(
+                    f"{cls.__name__}.{name} is already instrumented."
+                )
+        for cls, name in targets:
+            label = f"{cls.__name__}.{name}"
+            stats = self._stats.setdefault(label, OperationStats())
+            original = cls.__dict__[name]
+            self._originals[label] = (cls, name, original)
+            setattr(cls, name, _record(original, stats))
+
+    def disable(self):
+        """
+        Stop recording and restore the original methods. Recorded stats
+        are kept until reset.
+        """
+        for cls, name, original in self._originals.values():
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    def reset(self):
+        """
+        Zero every counter.
+        """
+        for stats in self._stats.values():
+            stats.__init__()
+
+    # --- Export ---
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the recorded stats of every method called at least once.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per "Class.method" label, its
+                calls, seconds and allocations, slowest first.
+        """
+        ordered = sorted(
+            self._stats.items(), key=lambda item: item[1].seconds,
+            reverse=True
+        )
+        return {
+            label: stats.to_dict()
+            for label, stats in ordered
+            if stats.calls
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "chess_rpg") -> str:
+        """
+        Render the snapshot in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Metric name prefix. Defaults to
+                "chess_rpg".
+
+        Returns:
+            str: One metric family per stat, labelled by method. Calls and
+                seconds are counters; allocations are a gauge since the
+                net block count can go down.
+        """
+        snapshot = self.snapshot()
+        metrics = (
+            ("calls", "calls_total", "counter", "Number of calls."),
+            (
+                "seconds", "seconds_total", "counter",
+                "Cumulative seconds spent."
+            ),
+            (
+                "allocations", "allocated_blocks", "gauge",
+                "Net memory blocks allocated."
+            ),
+        )
+        lines = []
+        for key, suffix, kind, help_text in metrics:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for label, stats in snapshot.items():
+                lines.append(f'{name}{{method="{label}"}} {stats[key]}')
+        return "\n".join(lines) + "\n"
+
+    def _resolve_targets(self) -> List[Tuple[type, str]]:
+        if self._targets is not None:
+            return list(self._targets)
+        # Imported here so the backend does not depend on diagnostics
+        from src.backend.actions import Action, ActionValidator
+        from src.backend.board import Board
+
+        targets = [(Board, name) for name in BOARD_METHODS]
+        targets += [(ActionValidator, name) for name in VALIDATOR_METHODS]
+        pending = list(Action.__subclasses__())
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if "execute" in cls.__dict__:
+                targets.append((cls, "execute"))
+        return targets
+
+
+def _record(method: Callable, stats: OperationStats) -> Callable:
+    """
+    Wrap a method so each call updates stats.
+    """
+    perf_counter = time.perf_counter
+    allocated_blocks = sys.getallocatedblocks
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        blocks = allocated_blocks()
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.seconds += perf_counter() - start
+            stats.allocations += allocated_blocks() - blocks
+            stats.calls += 1
+
+    # Marks the method as wrapped for Instrumentation.enable
+    wrapper._instrumented = True
+    return wrapper
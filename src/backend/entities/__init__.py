@@ -1,5 +1,12 @@
-from .entity import Entity
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .entity import Entity
 
 __all__ = [
     "Entity"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".entity": ("Entity",),
+})
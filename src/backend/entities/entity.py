@@ -1,25 +1,95 @@
 import copy
-import uuid
+from functools import lru_cache
+from typing import Tuple
+from src.backend.foundations.types import EntityId
+
+# Largest integer entity id allocated or reserved in this process
+_last_id = 0
+
+
+def allocate_id() -> int:
+    """
+    Allocate a new process-wide unique integer entity id.
+
+    Returns:
+        int: The new id.
+    """
+    global _last_id
+    _last_id += 1
+    return _last_id
+
+
+def reserve_id(id: EntityId):
+    """
+    Mark an id given explicitly, e.g. loaded from a saved board, as in
+    use so allocate_id never returns it. String ids are ignored.
+
+    Args:
+        id (EntityId): The id.
+    """
+    global _last_id
+    if type(id) is int and id > _last_id:
+        _last_id = id
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Get every slot declared by a class and its bases.
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in names)
+    return tuple(names)
 
 
 class Entity:
-    def __init__(self, name, id: str = None):
+    __slots__ = ("name", "_id")
+
+    def __init__(self, name, id: EntityId = None):
         self.name = name
-        self._id = id or uuid.uuid4().hex
+        if id is None:
+            id = allocate_id()
+        else:
+            reserve_id(id)
+        self._id = id
 
     @property
-    def id(self) -> str:
+    def id(self) -> EntityId:
         return self._id
 
-    def __copy__(self) -> 'Entity':
+    def clone(self, keep_id: bool = True) -> 'Entity':
         """
-        Create a shallow copy of entity. Keeps ID.
+        Create a copy of entity by copying its slots directly, without the
+        generic copy machinery. Slot values are shared rather than copied,
+        so every slot must hold an immutable value such as an int or a
+        string.
+
+        Args:
+            keep_id (bool, optional): Keep the id (e.g. for search) or
+                allocate a new one (e.g. for spawning). Defaults to True.
+
+        Returns:
+            Entity: The copy.
         """
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        for name in _slot_names(cls):
+            if hasattr(self, name):
+                setattr(result, name, getattr(self, name))
+        if not keep_id:
+            result._id = allocate_id()
         return result
 
+    def __copy__(self) -> 'Entity':
+        """
+        Create a shallow copy of entity. Keeps ID.
+        """
+        return self.clone()
+
     def __deepcopy__(self, memo) -> 'Entity':
         """
         Create a deep copy fo entity. Generates a new ID.
@@ -27,11 +97,12 @@ class Entity:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            if k == "_id":
-                setattr(result, k, uuid.uuid4().hex)
-            else:
-                setattr(result, k, copy.deepcopy(v, memo))
+        for name in _slot_names(cls):
+            if name == "_id":
+                result._id = allocate_id()
+            elif hasattr(self, name):
+                value = copy.deepcopy(getattr(self, name), memo)
+                setattr(result, name, value)
         return result
 
     def __eq__(self, other: 'Entity'):
@@ -1,12 +1,20 @@
-from .piece import Piece
-from .bishop import Bishop
-from .king import King
-from .knight import Knight
-from .pawn import Pawn
-from .queen import Queen
-from .rook import Rook
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .archetype import ARCHETYPES, PieceArchetype, load_archetypes
+    from .piece import Piece
+    from .bishop import Bishop
+    from .king import King
+    from .knight import Knight
+    from .pawn import Pawn
+    from .queen import Queen
+    from .rook import Rook
+    from .registry import PIECE_TYPES, get_kind
 
 __all__ = [
+    "ARCHETYPES",
+    "PieceArchetype",
+    "load_archetypes",
     "Piece",
     "Bishop",
     "King",
@@ -14,4 +22,18 @@ __all__ = [
     "Pawn",
     "Queen",
     "Rook",
+    "PIECE_TYPES",
+    "get_kind",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".archetype": ("ARCHETYPES", "PieceArchetype", "load_archetypes"),
+    ".piece": ("Piece",),
+    ".bishop": ("Bishop",),
+    ".king": ("King",),
+    ".knight": ("Knight",),
+    ".pawn": ("Pawn",),
+    ".queen": ("Queen",),
+    ".rook": ("Rook",),
+    ".registry": ("PIECE_TYPES", "get_kind"),
+})
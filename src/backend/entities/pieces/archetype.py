@@ -0,0 +1,89 @@
+import json
+import os
+from typing import Dict, NamedTuple, Optional, Tuple
+from src.backend.foundations.types import Side, Vector2
+
+PIECES_PATH = os.path.join(os.path.dirname(__file__), "pieces.json")
+
+# Directions for each side, indexed by Side
+SidedDirections = Tuple[Tuple[Vector2, ...], ...]
+
+
+class PieceArchetype(NamedTuple):
+    """
+    Immutable static data of a piece type, shared by every piece of that
+    type. Directions are (dx, dy) pairs stored once per side; oriented
+    archetypes such as the pawn have their rows mirrored for black.
+    """
+    name: str
+    hp: int
+    damage: int
+    move_range: int
+    move_directions: SidedDirections
+    attack_range: int
+    attack_directions: SidedDirections
+
+
+def _orient(
+    directions: Tuple[Vector2, ...],
+    oriented: bool
+) -> SidedDirections:
+    if not oriented:
+        return tuple(directions for _ in Side)
+    return tuple(
+        tuple((dx, dy if side == Side.WHITE else -dy) for dx, dy in directions)
+        for side in Side
+    )
+
+
+def compile_archetype(name: str, data: Dict) -> PieceArchetype:
+    """
+    Compile one row of the piece data table.
+
+    Args:
+        name (str): The piece type name.
+        data (Dict): The row of the data table.
+
+    Raises:
+        KeyError: If a required stat is missing.
+
+    Returns:
+        PieceArchetype: The compiled archetype.
+    """
+    oriented = data.get("oriented", False)
+    return PieceArchetype(
+        name=name,
+        hp=int(data["hp"]),
+        damage=int(data["damage"]),
+        move_range=int(data["move_range"]),
+        move_directions=_orient(
+            tuple(tuple(d) for d in data["move_directions"]), oriented
+        ),
+        attack_range=int(data["attack_range"]),
+        attack_directions=_orient(
+            tuple(tuple(d) for d in data["attack_directions"]), oriented
+        ),
+    )
+
+
+def load_archetypes(
+    path: Optional[str] = None
+) -> Dict[str, PieceArchetype]:
+    """
+    Load and compile the piece data table.
+
+    Args:
+        path (str, optional): Path to the JSON table. Defaults to the
+            bundled pieces.json.
+
+    Returns:
+        Dict[str, PieceArchetype]: The archetypes by piece type name.
+    """
+    with open(path or PIECES_PATH) as file:
+        table = json.load(file)
+    return {
+        name: compile_archetype(name, data) for name, data in table.items()
+    }
+
+
+ARCHETYPES: Dict[str, PieceArchetype] = load_archetypes()
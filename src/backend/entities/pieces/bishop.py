@@ -1,28 +1,7 @@
-from typing import List
-from src.backend.foundations.types import Vector2
+from .archetype import ARCHETYPES
 from .piece import Piece
 
 
 class Bishop(Piece):
-    def __init__(self, name: str = "Bishop", id: str = None):
-        super().__init__(name, id)
-        self.hp = 30
-        self.damage = 15
-
-    def get_move_range(self) -> int:
-        return 8
-
-    def get_move_directions(self) -> List[Vector2]:
-        return [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-    def get_attack_range(self) -> int:
-        return 8
-
-    def get_attack_directions(self) -> List[Vector2]:
-        return [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-    def get_damage(self) -> int:
-        return 15
-
-    def take_damage(self, amount):
-        self.hp -= amount
+    __slots__ = ()
+    archetype = ARCHETYPES["Bishop"]
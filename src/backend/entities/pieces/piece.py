@@ -1,26 +1,44 @@
 from src.backend.entities import Entity
-from src.backend.foundations.types import Vector2
-from typing import List
+from src.backend.foundations.types import EntityId, Side, Vector2
+from typing import ClassVar, Sequence
+from .archetype import PieceArchetype
 
 
 class Piece(Entity):
-    def __init__(self, name, id: str = None):
-        super().__init__(name, id)
+    """
+    A piece on the board. Static stats come from the shared archetype of
+    the piece type; instances only hold mutable state.
+    """
+    __slots__ = ("side", "hp")
+    archetype: ClassVar[PieceArchetype]
+
+    def __init__(
+        self,
+        name: str = None,
+        id: EntityId = None,
+        side: Side = Side.WHITE
+    ):
+        super().__init__(name or self.archetype.name, id)
+        self.side = side
+        self.hp = self.archetype.hp
+
+    def get_max_hp(self) -> int:
+        return self.archetype.hp
 
     def get_move_range(self) -> int:
-        raise NotImplementedError
+        return self.archetype.move_range
 
-    def get_move_directions(self) -> List[Vector2]:
-        raise NotImplementedError
+    def get_move_directions(self) -> Sequence[Vector2]:
+        return self.archetype.move_directions[self.side]
 
     def get_attack_range(self) -> int:
-        raise NotImplementedError
+        return self.archetype.attack_range
 
-    def get_attack_directions(self) -> List[Vector2]:
-        raise NotImplementedError
+    def get_attack_directions(self) -> Sequence[Vector2]:
+        return self.archetype.attack_directions[self.side]
 
     def get_damage(self) -> int:
-        raise NotImplementedError
+        return self.archetype.damage
 
     def take_damage(self, amount):
-        raise NotImplementedError
+        self.hp -= amount
@@ -0,0 +1,30 @@
+from typing import Dict, Tuple
+from .bishop import Bishop
+from .king import King
+from .knight import Knight
+from .pawn import Pawn
+from .piece import Piece
+from .queen import Queen
+from .rook import Rook
+
+# Stable piece type order. A piece type's position is its compact kind
+# code, used by array and binary encodings of a board.
+PIECE_TYPES: Tuple[type, ...] = (Pawn, Knight, Bishop, Rook, Queen, King)
+
+_KINDS: Dict[type, int] = {cls: kind for kind, cls in enumerate(PIECE_TYPES)}
+
+
+def get_kind(piece: Piece) -> int:
+    """
+    Get the kind code of a piece.
+
+    Args:
+        piece (Piece): The piece.
+
+    Raises:
+        KeyError: If the piece type is not registered.
+
+    Returns:
+        int: The index of the piece type in PIECE_TYPES.
+    """
+    return _KINDS[type(piece)]
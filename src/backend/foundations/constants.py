@@ -0,0 +1,10 @@
+# Window
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 800
+# Maximum frames rendered per second
+SCREEN_FRAMERATE = 60
+
+# Fixed simulation ticks per second
+TICK_RATE = 30
+# Most ticks simulated back to back before a frame is rendered
+MAX_FRAME_SKIP = 5
@@ -0,0 +1,41 @@
+import importlib
+import sys
+from typing import Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, Sequence[str]]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build a module __getattr__ and __dir__ (PEP 562) that import a
+    package's exports from their submodules on first access, so importing
+    the package does not import every submodule.
+
+    Args:
+        package (str): The package name, __name__ of its __init__.
+        exports (Dict[str, Sequence[str]]): Per relative submodule name,
+            the names it exports.
+
+    Returns:
+        Tuple[Callable, Callable]: The __getattr__ and __dir__ functions.
+    """
+    modules = {
+        name: module for module, names in exports.items() for name in names
+    }
+
+    def __getattr__(name: str) -> object:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | modules.keys())
+
+    return __getattr__, __dir__
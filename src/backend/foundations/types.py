@@ -1,3 +1,16 @@
-from typing import Tuple, TypeAlias
+from enum import IntEnum
+from typing import Tuple, TypeAlias, Union
 
 Vector2: TypeAlias = Tuple[int, int]
+# Entity ids are integers allocated per process; strings are accepted for
+# ids loaded from older saves.
+EntityId: TypeAlias = Union[int, str]
+
+
+class Side(IntEnum):
+    WHITE = 0
+    BLACK = 1
+
+    @property
+    def opponent(self) -> 'Side':
+        return Side(1 - self)
@@ -0,0 +1,22 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .auto_battle import AutoBattle
+    from .loop import GameLoop
+    from .rules import get_winner, is_game_over
+    from .setup import create_standard_board
+
+__all__ = [
+    "AutoBattle",
+    "GameLoop",
+    "get_winner",
+    "is_game_over",
+    "create_standard_board",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".auto_battle": ("AutoBattle",),
+    ".loop": ("GameLoop",),
+    ".rules": ("get_winner", "is_game_over"),
+    ".setup": ("create_standard_board",),
+})
@@ -0,0 +1,55 @@
+import random
+from typing import Optional, TYPE_CHECKING
+from src.backend.actions import ActionValidator
+from src.backend.foundations.types import Side
+from .rules import get_winner
+from .setup import create_standard_board
+if TYPE_CHECKING:
+    from src.backend.board import Board
+
+
+class AutoBattle:
+    """
+    A game where both sides play random legal actions, one action per
+    tick. It ends when a king falls or the side to move has no actions.
+    """
+    def __init__(
+        self,
+        board: Optional['Board'] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Create a battle.
+
+        Args:
+            board (Board, optional): The board to play on. Defaults to a
+                new standard board.
+            seed (int, optional): Seed for the random choices.
+        """
+        self.board = board or create_standard_board()
+        self.validator = ActionValidator(self.board)
+        self.side = Side.WHITE
+        self.turns = 0
+        self.finished = False
+        self.winner: Optional[Side] = None
+        self._rng = random.Random(seed)
+
+    def update(self, dt: float):
+        """
+        Play one action for the side to move.
+
+        Args:
+            dt (float): The tick length in seconds.
+        """
+        if self.finished:
+            return
+        moves = self.validator.generate_all(self.side)
+        if not moves:
+            self.finished = True
+            return
+        action = self.validator.to_action(self._rng.choice(moves))
+        action.execute(self.board)
+        self.turns += 1
+        self.winner = get_winner(self.board)
+        self.finished = self.winner is not None
+        self.side = self.side.opponent
@@ -0,0 +1,131 @@
+import time
+from typing import Callable, Optional
+from src.backend.foundations.constants import (
+    MAX_FRAME_SKIP, SCREEN_FRAMERATE, TICK_RATE
+)
+
+
+class GameLoop:
+    """
+    Runs the simulation on a fixed timestep, separate from rendering.
+
+    With a renderer, real time is accumulated and spent in fixed ticks;
+    a frame is rendered after each batch of ticks, at most frame_rate
+    times per second. Under load up to max_frame_skip ticks run between
+    two frames, and any backlog beyond that is dropped so the loop does
+    not spiral. Without a renderer the loop is headless: ticks run back
+    to back, never reading the clock or sleeping.
+    """
+    def __init__(
+        self,
+        update: Callable[[float], None],
+        render: Optional[Callable[[float], None]] = None,
+        tick_rate: int = TICK_RATE,
+        frame_rate: Optional[int] = SCREEN_FRAMERATE,
+        max_frame_skip: int = MAX_FRAME_SKIP,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Create a loop.
+
+        Args:
+            update (Callable[[float], None]): Advances the simulation by
+                one tick, given the tick length in seconds.
+            render (Callable[[float], None], optional): Draws a frame,
+                given how far into the next tick the simulation is, from 0
+                to 1. Headless if not given.
+            tick_rate (int, optional): Ticks per second.
+            frame_rate (int, optional): Maximum frames per second, or None
+                to render as often as ticks run.
+            max_frame_skip (int, optional): Most ticks run between two
+                frames.
+            clock (Callable[[], float], optional): Returns the time in
+                seconds. Defaults to time.perf_counter.
+            sleep (Callable[[float], None], optional): Sleeps for seconds.
+                Defaults to time.sleep.
+        """
+        self.update = update
+        self.render = render
+        self.tick_length = 1 / tick_rate
+        self.frame_length = 1 / (frame_rate or tick_rate)
+        self.max_frame_skip = max_frame_skip
+        self._clock = clock
+        self._sleep = sleep
+        self._running = False
+        self.ticks = 0
+        self.frames = 0
+        # Ticks dropped because the simulation fell behind
+        self.dropped_ticks = 0
+
+    def is_headless(self) -> bool:
+        return self.render is None
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def stop(self):
+        """
+        Stop the loop after the current tick.
+        """
+        self._running = False
+
+    def run(self, max_ticks: Optional[int] = None) -> int:
+        """
+        Run until stopped or max_ticks more ticks have run.
+
+        Args:
+            max_ticks (int, optional): Tick limit. Defaults to no limit.
+
+        Returns:
+            int: The number of ticks run by this call.
+        """
+        self._running = True
+        start = self.ticks
+        limit = None if max_ticks is None else start + max_ticks
+        if self.is_headless():
+            self._run_headless(limit)
+        else:
+            self._run_paced(limit)
+        self._running = False
+        return self.ticks - start
+
+    def _run_headless(self, limit: Optional[int]):
+        update = self.update
+        tick_length = self.tick_length
+        while self._running and (limit is None or self.ticks < limit):
+            update(tick_length)
+            self.ticks += 1
+
+    def _run_paced(self, limit: Optional[int]):
+        clock = self._clock
+        tick_length = self.tick_length
+        previous = clock()
+        lag = 0.0
+        while self._running and (limit is None or self.ticks < limit):
+            frame_start = clock()
+            lag += frame_start - previous
+            previous = frame_start
+
+            steps = 0
+            while (
+                lag >= tick_length
+                and steps < self.max_frame_skip
+                and self._running
+                and (limit is None or self.ticks < limit)
+            ):
+                self.update(tick_length)
+                self.ticks += 1
+                lag -= tick_length
+                steps += 1
+            if lag >= tick_length and steps == self.max_frame_skip:
+                dropped = int(lag // tick_length)
+                self.dropped_ticks += dropped
+                lag -= dropped * tick_length
+
+            self.render(lag / tick_length)
+            self.frames += 1
+
+            remaining = frame_start + self.frame_length - clock()
+            if remaining > 0:
+                self._sleep(remaining)
@@ -0,0 +1,38 @@
+from typing import Optional, TYPE_CHECKING
+from src.backend.entities.pieces import King
+from src.backend.foundations.types import Side
+if TYPE_CHECKING:
+    from src.backend.board import Board
+
+
+def get_winner(board: 'Board') -> Optional[Side]:
+    """
+    Get the winner of a game. A side wins once the other side's king has
+    been reduced to 0 hp and removed from the board.
+
+    Args:
+        board (Board): The board to check.
+
+    Returns:
+        Optional[Side]: The winning side, or None if both kings are alive.
+    """
+    alive = set()
+    for piece in board.get_slots():
+        if piece is not None and isinstance(piece, King):
+            alive.add(piece.side)
+    if len(alive) == 1:
+        return alive.pop()
+    return None
+
+
+def is_game_over(board: 'Board') -> bool:
+    """
+    Check if either king has been captured.
+
+    Args:
+        board (Board): The board to check.
+
+    Returns:
+        bool: True if the game is over, False otherwise.
+    """
+    return get_winner(board) is not None
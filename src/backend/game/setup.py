@@ -0,0 +1,30 @@
+from src.backend.board import Board
+from src.backend.entities.pieces import (
+    Bishop, King, Knight, Pawn, Queen, Rook
+)
+from src.backend.foundations.types import Side
+
+BACK_RANK = (Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook)
+
+
+def create_standard_board(hp_bucket_size: int = None) -> Board:
+    """
+    Create an 8x8 board in the standard chess starting position. White
+    starts on rows 0-1 and advances towards higher rows, black starts on
+    rows 6-7.
+
+    Args:
+        hp_bucket_size (int, optional): Passed on to the Board.
+
+    Returns:
+        Board: The board.
+    """
+    board = Board(8, 8, hp_bucket_size=hp_bucket_size)
+    for side, back_row, pawn_row in (
+        (Side.WHITE, 0, 1),
+        (Side.BLACK, 7, 6),
+    ):
+        for col, piece_type in enumerate(BACK_RANK):
+            board.place_piece(piece_type(side=side), (back_row, col))
+            board.place_piece(Pawn(side=side), (pawn_row, col))
+    return board
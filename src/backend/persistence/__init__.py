@@ -0,0 +1,13 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .match_store import MatchState, MatchStore
+
+__all__ = [
+    "MatchState",
+    "MatchStore",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".match_store": ("MatchState", "MatchStore"),
+})
@@ -0,0 +1,254 @@
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from src.backend.board import Board, decode_board, encode_board
+from src.backend.foundations.types import Side
+from src.backend.replay import LoggedAction
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS matches (
+        id TEXT PRIMARY KEY,
+        to_move INTEGER NOT NULL,
+        turn INTEGER NOT NULL,
+        board BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS actions (
+        match_id TEXT NOT NULL,
+        turn INTEGER NOT NULL,
+        kind INTEGER NOT NULL,
+        from_square INTEGER NOT NULL,
+        to_square INTEGER NOT NULL,
+        damage INTEGER NOT NULL,
+        PRIMARY KEY (match_id, turn)
+    ) WITHOUT ROWID
+    """,
+)
+
+# Statements are constant strings so sqlite3 reuses their prepared form
+_UPSERT_MATCH = """
+    INSERT INTO matches (id, to_move, turn, board) VALUES (?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        to_move = excluded.to_move,
+        turn = excluded.turn,
+        board = excluded.board
+"""
+_INSERT_ACTION = """
+    INSERT OR REPLACE INTO actions
+        (match_id, turn, kind, from_square, to_square, damage)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SELECT_MATCH = "SELECT id, to_move, turn, board FROM matches WHERE id = ?"
+_SELECT_MATCHES = "SELECT id, to_move, turn, board FROM matches"
+_SELECT_ACTIONS = """
+    SELECT kind, from_square, to_square, damage FROM actions
+    WHERE match_id = ? AND turn >= ? ORDER BY turn
+"""
+_DELETE_MATCH = "DELETE FROM matches WHERE id = ?"
+_DELETE_ACTIONS = "DELETE FROM actions WHERE match_id = ?"
+
+
+class MatchState(NamedTuple):
+    id: str
+    board: Board
+    to_move: Side
+    turn: int
+
+
+class MatchStore:
+    """
+    SQLite storage for match boards and action histories. Writes are
+    staged in memory and written in one transaction per flush with
+    executemany, automatically once batch_size rows are staged. Boards are
+    stored in the board codec encoding. File databases use WAL mode so
+    readers do not block the writer.
+    """
+    def __init__(self, path: str = ":memory:", batch_size: int = 500):
+        """
+        Open or create a store.
+
+        Args:
+            path (str, optional): The database file. Defaults to an
+                in-memory database.
+            batch_size (int, optional): Staged rows that trigger a flush.
+                Defaults to 500.
+        """
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, cached_statements=64
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        # Latest staged state per match id
+        self._matches: Dict[str, Tuple[str, int, int, bytes]] = {}
+        self._actions: List[Tuple[str, int, int, int, int, int]] = []
+
+    def __enter__(self) -> 'MatchStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Flush staged writes and close the database.
+        """
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+    def get_pending(self) -> int:
+        return len(self._matches) + len(self._actions)
+
+    def get_journal_mode(self) -> str:
+        return self._connection.execute(
+            "PRAGMA journal_mode"
+        ).fetchone()[0]
+
+    # --- Writes ---
+    def stage_match(self, id: str, board: Board, to_move: Side, turn: int):
+        """
+        Stage the state of a match. Only the latest staged state of a
+        match is written.
+
+        Args:
+            id (str): The match id.
+            board (Board): The board, encoded immediately.
+            to_move (Side): The side to move.
+            turn (int): The number of actions played.
+        """
+        self._matches[id] = (id, int(to_move), turn, encode_board(board))
+        self._flush_if_full()
+
+    def stage_action(self, id: str, turn: int, action: LoggedAction):
+        """
+        Stage an action of a match's history.
+
+        Args:
+            id (str): The match id.
+            turn (int): The turn the action was played on, from 0.
+            action (LoggedAction): The action.
+        """
+        self._actions.append((
+            id, turn, action.kind, action.from_square, action.to_square,
+            action.damage
+        ))
+        self._flush_if_full()
+
+    def save_matches(self, states: Iterable[MatchState]):
+        """
+        Write many match states at once.
+
+        Args:
+            states (Iterable[MatchState]): The states.
+        """
+        for state in states:
+            self._matches[state.id] = (
+                state.id, int(state.to_move), state.turn,
+                encode_board(state.board)
+            )
+        self.flush()
+
+    def delete_match(self, id: str):
+        """
+        Delete a match and its history, including staged writes.
+
+        Args:
+            id (str): The match id.
+        """
+        self._matches.pop(id, None)
+        self._actions = [row for row in self._actions if row[0] != id]
+        with self._transaction() as connection:
+            connection.execute(_DELETE_MATCH, (id,))
+            connection.execute(_DELETE_ACTIONS, (id,))
+
+    def flush(self):
+        """
+        Write every staged row in one transaction.
+        """
+        if not self._matches and not self._actions:
+            return
+        with self._transaction() as connection:
+            connection.executemany(_UPSERT_MATCH, self._matches.values())
+            connection.executemany(_INSERT_ACTION, self._actions)
+        self._matches.clear()
+        self._actions.clear()
+
+    def _flush_if_full(self):
+        if self.get_pending() >= self.batch_size:
+            self.flush()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a with block in a transaction, committed if the block exits
+        cleanly and rolled back otherwise.
+        """
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    # --- Reads ---
+    def load_match(self, id: str) -> Optional[MatchState]:
+        """
+        Load the last written state of a match. Staged writes are flushed
+        first.
+
+        Args:
+            id (str): The match id.
+
+        Returns:
+            Optional[MatchState]: The state, or None if unknown.
+        """
+        self.flush()
+        row = self._connection.execute(_SELECT_MATCH, (id,)).fetchone()
+        return _to_state(row) if row is not None else None
+
+    def load_matches(self) -> Dict[str, MatchState]:
+        """
+        Load every match in one query, e.g. at server start.
+
+        Returns:
+            Dict[str, MatchState]: The states by match id.
+        """
+        self.flush()
+        cursor = self._connection.execute(_SELECT_MATCHES)
+        cursor.arraysize = 1000
+        states = {}
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                states[row[0]] = _to_state(row)
+        return states
+
+    def load_actions(self, id: str, turn: int = 0) -> List[LoggedAction]:
+        """
+        Load the history of a match.
+
+        Args:
+            id (str): The match id.
+            turn (int, optional): The first turn. Defaults to 0.
+
+        Returns:
+            List[LoggedAction]: The actions in turn order.
+        """
+        self.flush()
+        rows = self._connection.execute(_SELECT_ACTIONS, (id, turn))
+        return [LoggedAction(*row) for row in rows]
+
+
+def _to_state(row: Tuple) -> MatchState:
+    id, to_move, turn, board = row
+    return MatchState(id, decode_board(board), Side(to_move), turn)
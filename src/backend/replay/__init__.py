@@ -0,0 +1,20 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .action_log import (
+        ActionLogReader, ActionLogWriter, LoggedAction, apply_logged_action
+    )
+
+__all__ = [
+    "ActionLogReader",
+    "ActionLogWriter",
+    "LoggedAction",
+    "apply_logged_action",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".action_log": (
+        "ActionLogReader", "ActionLogWriter", "LoggedAction",
+        "apply_logged_action",
+    ),
+})
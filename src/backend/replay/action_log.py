@@ -0,0 +1,292 @@
+import mmap
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Tuple
+from src.backend.actions import Action, AttackAction, MoveAction
+from src.backend.actions.move_encoding import ATTACK, MOVE
+from src.backend.board import Board, decode_board, encode_board
+
+_MAGIC = b"CRPGLOG1"
+
+# Record tags
+_ACTION = 0
+_CHECKPOINT = 1
+
+# tag, kind, from square, to square, damage. The from square stands in
+# for the piece, which is the piece on it when the action is replayed.
+_ACTION_RECORD = struct.Struct("<BBHHi")
+# tag, turn, encoded board length, followed by the encoded board
+_CHECKPOINT_RECORD = struct.Struct("<BII")
+
+
+class LoggedAction(NamedTuple):
+    kind: int
+    from_square: int
+    to_square: int
+    damage: int
+
+
+class ActionLogWriter:
+    """
+    Appends every executed action of a game to a binary log as a
+    fixed-width record, with a full board checkpoint every
+    checkpoint_interval actions. The board as it is when the writer is
+    created is stored as the checkpoint of turn 0. A record holds the
+    action kind, the from and to squares and the damage dealt; the acting
+    piece is not stored, since the from square identifies it on the
+    replayed board.
+    """
+    def __init__(
+        self,
+        path: str,
+        board: Board,
+        checkpoint_interval: int = 64
+    ):
+        """
+        Create a log file for a board, replacing any existing file.
+
+        Args:
+            path (str): The log file path.
+            board (Board): The board the logged actions are executed on.
+            checkpoint_interval (int, optional): Actions between board
+                checkpoints. Defaults to 64.
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1.")
+        self.board = board
+        self.checkpoint_interval = checkpoint_interval
+        self._file: BinaryIO = open(path, "wb")
+        try:
+            self._file.write(_MAGIC)
+            self._turn = 0
+            self._write_checkpoint()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> 'ActionLogWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def flush(self):
+        self._file.flush()
+
+    def get_turn(self) -> int:
+        """
+        Get the number of actions logged.
+
+        Returns:
+            int: The turn count.
+        """
+        return self._turn
+
+    def execute(self, action: Action):
+        """
+        Execute an action on the board and log it.
+
+        Args:
+            action (Action): The MoveAction or AttackAction to execute.
+
+        Raises:
+            TypeError: If the action type cannot be logged.
+        """
+        board = self.board
+        from_square = board.get_piece_index(action.actor)
+        if isinstance(action, MoveAction):
+            record = _ACTION_RECORD.pack(
+                _ACTION, MOVE, from_square,
+                board.to_index(action.position), 0
+            )
+        elif isinstance(action, AttackAction):
+            record = _ACTION_RECORD.pack(
+                _ACTION, ATTACK, from_square,
+                board.get_piece_index(action.target), action.damage
+            )
+        else:
+            raise TypeError(f"Cannot log action {action!r}.")
+
+        action.execute(board)
+        self._file.write(record)
+        self._turn += 1
+        if self._turn % self.checkpoint_interval == 0:
+            self._write_checkpoint()
+
+    def _write_checkpoint(self):
+        data = encode_board(self.board)
+        self._file.write(
+            _CHECKPOINT_RECORD.pack(_CHECKPOINT, self._turn, len(data))
+        )
+        self._file.write(data)
+
+
+class ActionLogReader:
+    """
+    Memory-maps a log written by ActionLogWriter. Opening the log indexes
+    its checkpoints; seek rebuilds the board at any turn from the nearest
+    checkpoint at or before it, replaying only the actions after it. The
+    reader sees the log as it was when opened, ignoring a partially
+    written last record.
+    """
+    def __init__(self, path: str):
+        """
+        Open a log.
+
+        Args:
+            path (str): The log file path.
+
+        Raises:
+            ValueError: If the file is not an action log.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except BaseException:
+            # E.g. an empty file, which cannot be mapped
+            self._file.close()
+            raise
+        if self._map[:len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an action log.")
+        # (turn, board offset, board length) per checkpoint, by turn
+        self._checkpoints: List[Tuple[int, int, int]] = []
+        # Offset of the first action record after each checkpoint
+        self._resume: List[int] = []
+        self._turns = 0
+        self._index()
+
+    def __enter__(self) -> 'ActionLogReader':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._turns
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _index(self):
+        data = self._map
+        offset = len(_MAGIC)
+        end = len(data)
+        while offset < end:
+            tag = data[offset]
+            if tag == _ACTION:
+                if offset + _ACTION_RECORD.size > end:
+                    # Partially written last record
+                    break
+                offset += _ACTION_RECORD.size
+                self._turns += 1
+                continue
+            if offset + _CHECKPOINT_RECORD.size > end:
+                break
+            _, turn, length = _CHECKPOINT_RECORD.unpack_from(data, offset)
+            start = offset + _CHECKPOINT_RECORD.size
+            if start + length > end:
+                break
+            self._checkpoints.append((turn, start, length))
+            offset = start + length
+            self._resume.append(offset)
+
+    def get_checkpoint_turns(self) -> List[int]:
+        return [turn for turn, _, _ in self._checkpoints]
+
+    def iter_actions(self, turn: int = 0) -> Iterator[LoggedAction]:
+        """
+        Iterate over the logged actions from a turn onward.
+
+        Args:
+            turn (int, optional): The first turn. Defaults to 0.
+
+        Yields:
+            LoggedAction: Each action record.
+        """
+        position = self._find_checkpoint(turn)
+        checkpoint_turn = self._checkpoints[position][0]
+        records = self._iter_from(self._resume[position])
+        for current, record in enumerate(records, checkpoint_turn):
+            if current >= turn:
+                yield record
+
+    def seek(self, turn: int) -> Board:
+        """
+        Rebuild the board as it was after a number of actions.
+
+        Args:
+            turn (int): The number of actions applied, from 0 to len(log).
+
+        Raises:
+            IndexError: If the turn is not in the log.
+
+        Returns:
+            Board: A new board with new pieces keeping their logged ids.
+        """
+        if not 0 <= turn <= self._turns:
+            raise IndexError(f"Turn {turn} is not in the log.")
+        position = self._find_checkpoint(turn)
+        checkpoint_turn, start, length = self._checkpoints[position]
+        board = decode_board(self._map[start:start + length])
+        records = self._iter_from(self._resume[position])
+        for _ in range(turn - checkpoint_turn):
+            apply_logged_action(board, next(records))
+        return board
+
+    def _find_checkpoint(self, turn: int) -> int:
+        """
+        Get the position of the last checkpoint at or before a turn.
+        """
+        low, high = 0, len(self._checkpoints) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._checkpoints[middle][0] <= turn:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _iter_from(self, offset: int) -> Iterator[LoggedAction]:
+        """
+        Iterate over the action records from an offset, skipping
+        checkpoints.
+        """
+        data = self._map
+        end = len(data)
+        while offset < end:
+            if data[offset] == _CHECKPOINT:
+                if offset + _CHECKPOINT_RECORD.size > end:
+                    # Partially written last record
+                    break
+                _, _, length = _CHECKPOINT_RECORD.unpack_from(data, offset)
+                offset += _CHECKPOINT_RECORD.size + length
+                continue
+            if offset + _ACTION_RECORD.size > end:
+                break
+            _, kind, from_square, to_square, damage = (
+                _ACTION_RECORD.unpack_from(data, offset)
+            )
+            offset += _ACTION_RECORD.size
+            yield LoggedAction(kind, from_square, to_square, damage)
+
+
+def apply_logged_action(board: Board, record: LoggedAction):
+    """
+    Apply a logged action to a board.
+
+    Args:
+        board (Board): The board to update.
+        record (LoggedAction): The action record.
+    """
+    if record.kind == ATTACK:
+        target = board.get_piece_at_index(record.to_square)
+        board.damage_piece(target, record.damage)
+    else:
+        piece = board.get_piece_at_index(record.from_square)
+        board.move_piece(piece, board.to_position(record.to_square))
@@ -0,0 +1,20 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .connection import Connection, LocalClient, SocketConnection
+    from .match import Match
+    from .server import MatchServer
+
+__all__ = [
+    "Connection",
+    "LocalClient",
+    "SocketConnection",
+    "Match",
+    "MatchServer",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".connection": ("Connection", "LocalClient", "SocketConnection"),
+    ".match": ("Match",),
+    ".server": ("MatchServer",),
+})
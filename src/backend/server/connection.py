@@ -0,0 +1,192 @@
+import asyncio
+import json
+from typing import Dict, Optional, Set, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .server import MatchServer
+
+# Messages queued for a client before it counts as too slow
+DEFAULT_MAX_PENDING = 256
+
+
+def encode_message(message: Dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def _reject_constant(name: str):
+    raise ValueError(f"{name} is not allowed.")
+
+
+def decode_message(line: bytes) -> Dict:
+    """
+    Decode one message line. NaN and Infinity are rejected.
+
+    Raises:
+        ValueError: If the line is not a JSON object.
+    """
+    try:
+        message = json.loads(line, parse_constant=_reject_constant)
+    except RecursionError:
+        raise ValueError("Message is nested too deeply.") from None
+    if not isinstance(message, dict):
+        raise ValueError("A message must be a JSON object.")
+    return message
+
+
+class Connection:
+    """
+    A client of the match server. Outgoing messages wait in a bounded
+    queue; a client that lets the queue fill up is disconnected instead
+    of slowing down the matches it watches.
+    """
+    def __init__(
+        self,
+        server: 'MatchServer',
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        self.server = server
+        self.outbox: asyncio.Queue = asyncio.Queue(max_pending)
+        # Ids of the matches the connection joined
+        self.matches: Set[str] = set()
+        self.closed = False
+
+    def deliver(self, message: Dict) -> bool:
+        """
+        Queue a message for the client without waiting.
+
+        Args:
+            message (Dict): The message.
+
+        Returns:
+            bool: False if the connection is closed or was just closed for
+                falling behind.
+        """
+        if self.closed:
+            return False
+        try:
+            self.outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.close()
+            return False
+        return True
+
+    def close(self):
+        """
+        Close the connection and leave its matches.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.server.disconnect(self)
+
+
+class SocketConnection(Connection):
+    """
+    A client connected over a stream socket, exchanging one JSON message
+    per line.
+    """
+    def __init__(
+        self,
+        server: 'MatchServer',
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        max_pending: int = DEFAULT_MAX_PENDING
+    ):
+        super().__init__(server, max_pending)
+        self.reader = reader
+        self.writer = writer
+        self._sender: Optional[asyncio.Task] = None
+
+    async def serve(self):
+        """
+        Handle the client's messages until it disconnects.
+        """
+        self._sender = asyncio.create_task(self._send_loop())
+        try:
+            while not self.closed:
+                try:
+                    line = await self.reader.readline()
+                except ValueError:
+                    # Longer than the stream limit; the rest of the line
+                    # cannot be told apart from the next message
+                    self.writer.write(encode_message(
+                        {"type": "error", "message": "Message too long."}
+                    ))
+                    break
+                if not line:
+                    break
+                try:
+                    message = decode_message(line)
+                except ValueError:
+                    self.deliver({"type": "error", "message": "Bad message."})
+                    continue
+                self.server.handle(self, message)
+        except ConnectionError:
+            pass
+        finally:
+            self.close()
+            await asyncio.gather(self._sender, return_exceptions=True)
+
+    async def _send_loop(self):
+        writer = self.writer
+        try:
+            while True:
+                message = await self.outbox.get()
+                writer.write(encode_message(message))
+                # Wait for the socket buffer to drain before sending more
+                await writer.drain()
+        except ConnectionError:
+            self.close()
+        finally:
+            writer.close()
+
+    def close(self):
+        if self.closed:
+            return
+        super().close()
+        if self._sender is not None:
+            self._sender.cancel()
+
+
+class LocalClient(Connection):
+    """
+    An in-process stand-in for a socket client, for tests and bots.
+    Messages go through the same JSON encoding as on a socket.
+    """
+    async def send(self, message: Dict):
+        """
+        Send a message to the server.
+
+        Args:
+            message (Dict): The message.
+
+        Raises:
+            ConnectionError: If the connection is closed.
+        """
+        if self.closed:
+            raise ConnectionError("The connection is closed.")
+        try:
+            message = decode_message(encode_message(message))
+        except (TypeError, ValueError, RecursionError):
+            self.deliver({"type": "error", "message": "Bad message."})
+            return
+        self.server.handle(self, message)
+
+    async def receive(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Wait for the next message from the server.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to no
+                limit.
+
+        Raises:
+            asyncio.TimeoutError: If no message arrives in time.
+
+        Returns:
+            Dict: The message.
+        """
+        message = await asyncio.wait_for(self.outbox.get(), timeout)
+        return decode_message(encode_message(message))
+
+    def pending(self) -> int:
+        return self.outbox.qsize()
@@ -0,0 +1,102 @@
+from typing import Dict, Optional, Set, TYPE_CHECKING
+from src.backend.actions import ActionValidator, AttackAction
+from src.backend.actions.move_encoding import ATTACK, MOVE, encode_move
+from src.backend.foundations.types import Side
+from src.backend.game.rules import get_winner
+if TYPE_CHECKING:
+    from src.backend.board import Board
+    from .connection import Connection
+
+
+class Match:
+    """
+    One game hosted by the server: its board, a validator for it, the
+    connection playing each side and everyone watching.
+    """
+    def __init__(
+        self,
+        id: str,
+        board: 'Board',
+        to_move: Side = Side.WHITE,
+        turn: int = 0
+    ):
+        """
+        Create a match, new or resumed from a saved state.
+
+        Args:
+            id (str): The match id.
+            board (Board): The board to play on.
+            to_move (Side, optional): The side to move. Defaults to WHITE.
+            turn (int, optional): The number of actions played. Defaults
+                to 0.
+        """
+        self.id = id
+        self.board = board
+        self.validator = ActionValidator(board)
+        self.to_move = to_move
+        self.turn = turn
+        self.winner: Optional[Side] = get_winner(board)
+        self.players: Dict[Side, 'Connection'] = {}
+        # Players and spectators, everyone results are broadcast to
+        self.subscribers: Set['Connection'] = set()
+
+    def is_over(self) -> bool:
+        return self.winner is not None
+
+    def apply(self, side: Side, from_square: int, to_square: int) -> Dict:
+        """
+        Validate and apply an action for a side. Moving onto an enemy is
+        an attack with the actor's damage.
+
+        Args:
+            side (Side): The side acting.
+            from_square (int): The square index of the actor.
+            to_square (int): The square index moved to or attacked.
+
+        Raises:
+            ValueError: If the game is over, it is not the side's turn or
+                the action is illegal.
+
+        Returns:
+            Dict: The result message to broadcast.
+        """
+        board = self.board
+        if self.is_over():
+            raise ValueError("The match is over.")
+        if side != self.to_move:
+            raise ValueError("It is not your turn.")
+        rows, cols = board.get_size()
+        if not (
+            0 <= from_square < rows * cols and 0 <= to_square < rows * cols
+        ):
+            raise ValueError("Square out of bounds.")
+        actor = board.get_piece_at_index(from_square)
+        if actor is None or actor.side != side:
+            raise ValueError("No piece of yours on that square.")
+
+        target = board.get_piece_at_index(to_square)
+        kind = MOVE if target is None else ATTACK
+        action = self.validator.to_action(
+            encode_move(from_square, to_square, kind)
+        )
+        if not self.validator.is_legal(action):
+            raise ValueError("Illegal action.")
+
+        action.execute(board)
+        self.turn += 1
+        self.to_move = side.opponent
+        self.winner = get_winner(board)
+        attack = isinstance(action, AttackAction)
+        return {
+            "type": "applied",
+            "match": self.id,
+            "turn": self.turn,
+            "side": side.name,
+            "from": from_square,
+            "to": to_square,
+            "attack": attack,
+            "damage": action.damage if attack else 0,
+            "hp": target.hp if attack else None,
+            "captured": attack and not board.contains_piece(target),
+            "winner": self.winner.name if self.winner is not None else None,
+        }
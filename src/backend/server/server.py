@@ -0,0 +1,389 @@
+import asyncio
+import base64
+import itertools
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from typing import TYPE_CHECKING
+from src.backend.actions.move_encoding import ATTACK, MOVE
+from src.backend.board import encode_board
+from src.backend.foundations.types import Side
+from src.backend.game.setup import create_standard_board
+from src.backend.replay import LoggedAction
+from .connection import (
+    DEFAULT_MAX_PENDING, Connection, LocalClient, SocketConnection
+)
+from .match import Match
+if TYPE_CHECKING:
+    from src.backend.board import Board
+    from src.backend.persistence import MatchState, MatchStore
+
+
+class MatchServer:
+    """
+    Hosts many matches on one asyncio event loop. Clients join a match as
+    a side or as a spectator, send actions as (from, to) square indices,
+    and every subscriber of the match is sent each applied action. A match
+    outlives its clients, so players can reconnect, until it is finished
+    or nobody has been in it for idle_timeout seconds.
+
+    With a store, every applied action is staged into it and the state of
+    changed matches is saved every save_interval seconds and on close, so
+    restore can resume them after a restart. Expired matches are deleted
+    from the store, finished ones are kept with their history.
+
+    Client messages:
+        {"type": "join", "match": id, "side": "WHITE" | "BLACK" | null}
+        {"type": "action", "match": id, "from": square, "to": square}
+        {"type": "leave", "match": id}
+
+    Server messages:
+        {"type": "joined", "match", "side", "to_move", "turn", "board"}
+            with the board codec encoding in base64.
+        {"type": "applied", ...}, see Match.apply.
+        {"type": "error", "message"}
+    """
+    def __init__(
+        self,
+        board_factory: Callable[[], 'Board'] = create_standard_board,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        idle_timeout: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        store: Optional['MatchStore'] = None,
+        save_interval: float = 30.0
+    ):
+        """
+        Create a server.
+
+        Args:
+            board_factory (Callable[[], Board], optional): Creates the
+                board of a new match. Defaults to create_standard_board.
+            max_pending (int, optional): Messages queued per client before
+                it is disconnected as too slow. Defaults to 256.
+            idle_timeout (float, optional): Seconds an unfinished match is
+                kept with nobody in it. Defaults to 300.
+            clock (Callable[[], float], optional): Returns the time in
+                seconds. Defaults to time.monotonic.
+            store (MatchStore, optional): Where matches are saved.
+                Defaults to none, matches only live in memory.
+            save_interval (float, optional): Seconds between saves of
+                changed matches to the store. Defaults to 30.
+        """
+        self.board_factory = board_factory
+        self.max_pending = max_pending
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self.store = store
+        self.save_interval = save_interval
+        self.matches: Dict[str, Match] = {}
+        # Per empty unfinished match id, when its last client left
+        self._idle_since: Dict[str, float] = {}
+        # Ids of matches changed since they were last saved
+        self._unsaved: Set[str] = set()
+        self._connections: Set[Connection] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._servers = []
+        self._reaper: Optional[asyncio.Task] = None
+        self._saver: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+
+    # --- Transports ---
+    async def serve(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Accept clients over TCP.
+
+        Args:
+            host (str, optional): The address to bind. Defaults to
+                localhost.
+            port (int, optional): The port, 0 for any free port.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        server = await asyncio.start_server(self._accept, host, port)
+        self._listen(server)
+        return server
+
+    async def serve_unix(self, path: str):
+        """
+        Accept clients over a Unix domain socket.
+
+        Args:
+            path (str): The socket path.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        server = await asyncio.start_unix_server(self._accept, path)
+        self._listen(server)
+        return server
+
+    def _listen(self, server: asyncio.Server):
+        self._servers.append(server)
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap())
+        if self.store is not None and self._saver is None:
+            self._saver = asyncio.create_task(self._autosave())
+
+    async def _reap(self):
+        # Check a few times per timeout so matches expire close to it
+        interval = max(self.idle_timeout / 4, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            self.expire_idle_matches()
+
+    async def _autosave(self):
+        while True:
+            await asyncio.sleep(self.save_interval)
+            self.save()
+
+    async def close(self):
+        """
+        Stop accepting clients, close every open connection and save
+        every changed match. The store is left open.
+        """
+        for server in self._servers:
+            server.close()
+        for connection in list(self._connections):
+            connection.close()
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self._saver is not None:
+            self._saver.cancel()
+            self._saver = None
+        tasks = list(self._tasks)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+        self.save()
+
+    def connect_local(self) -> LocalClient:
+        """
+        Connect an in-process client.
+
+        Returns:
+            LocalClient: The client.
+        """
+        client = LocalClient(self, self.max_pending)
+        self._connections.add(client)
+        return client
+
+    async def _accept(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ):
+        connection = SocketConnection(
+            self, reader, writer, self.max_pending
+        )
+        self._connections.add(connection)
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            await connection.serve()
+        finally:
+            self._tasks.discard(task)
+
+    # --- Messages ---
+    def handle(self, connection: Connection, message: Dict):
+        """
+        Handle one client message. Errors are reported to the client.
+
+        Args:
+            connection (Connection): The sender.
+            message (Dict): The decoded message.
+        """
+        kind = message.get("type")
+        handler = {
+            "join": self._join,
+            "action": self._action,
+            "leave": self._leave,
+        }.get(kind)
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown message type {kind}.")
+            handler(connection, message)
+        except (KeyError, TypeError, ValueError) as error:
+            connection.deliver({"type": "error", "message": str(error)})
+
+    def _join(self, connection: Connection, message: Dict):
+        match_id = str(message.get("match") or f"match-{next(self._ids)}")
+        side = message.get("side")
+        side = Side[side] if side is not None else None
+
+        match = self.matches.get(match_id)
+        if match is None:
+            match = Match(match_id, self.board_factory())
+            self.matches[match_id] = match
+        if side is not None:
+            player = match.players.get(side)
+            if player is not None and player is not connection:
+                raise ValueError(f"{side.name} is already taken.")
+            match.players[side] = connection
+        match.subscribers.add(connection)
+        connection.matches.add(match_id)
+        self._idle_since.pop(match_id, None)
+        connection.deliver({
+            "type": "joined",
+            "match": match_id,
+            "side": side.name if side is not None else None,
+            "to_move": match.to_move.name,
+            "turn": match.turn,
+            "board": base64.b64encode(encode_board(match.board)).decode(),
+        })
+
+    def _action(self, connection: Connection, message: Dict):
+        match = self._get_match(message)
+        side = next(
+            (
+                side for side, player in match.players.items()
+                if player is connection
+            ),
+            None
+        )
+        if side is None:
+            raise ValueError("You are not playing this match.")
+        from_square = message.get("from")
+        to_square = message.get("to")
+        if type(from_square) is not int or type(to_square) is not int:
+            raise ValueError("Squares must be integers.")
+        result = match.apply(side, from_square, to_square)
+        if self.store is not None:
+            kind = ATTACK if result["attack"] else MOVE
+            self.store.stage_action(match.id, match.turn - 1, LoggedAction(
+                kind, from_square, to_square, result["damage"]
+            ))
+            self._unsaved.add(match.id)
+        self.broadcast(match, result)
+
+    def _leave(self, connection: Connection, message: Dict):
+        self._remove(connection, self._get_match(message))
+
+    def broadcast(self, match: Match, message: Dict):
+        """
+        Queue a message for every subscriber of a match. Subscribers too
+        far behind are disconnected rather than waited for.
+
+        Args:
+            match (Match): The match.
+            message (Dict): The message.
+        """
+        for connection in list(match.subscribers):
+            connection.deliver(message)
+
+    # --- Connections ---
+    def disconnect(self, connection: Connection):
+        """
+        Remove a closed connection from every match it joined.
+
+        Args:
+            connection (Connection): The connection.
+        """
+        self._connections.discard(connection)
+        for match_id in list(connection.matches):
+            match = self.matches.get(match_id)
+            if match is not None:
+                self._remove(connection, match)
+
+    def _remove(self, connection: Connection, match: Match):
+        match.subscribers.discard(connection)
+        for side, player in list(match.players.items()):
+            if player is connection:
+                del match.players[side]
+        connection.matches.discard(match.id)
+        if not match.subscribers:
+            if match.is_over():
+                self._drop(match.id)
+            else:
+                self._idle_since[match.id] = self._clock()
+
+    def expire_idle_matches(self) -> int:
+        """
+        Drop unfinished matches nobody has been in for idle_timeout
+        seconds.
+
+        Returns:
+            int: The number of matches dropped.
+        """
+        deadline = self._clock() - self.idle_timeout
+        expired = [
+            match_id for match_id, since in self._idle_since.items()
+            if since <= deadline
+        ]
+        for match_id in expired:
+            self._drop(match_id)
+        return len(expired)
+
+    def _drop(self, match_id: str):
+        match = self.matches.pop(match_id)
+        self._idle_since.pop(match_id, None)
+        self._unsaved.discard(match_id)
+        if self.store is None:
+            return
+        if match.is_over():
+            # Kept for its history, restore skips finished matches
+            self.store.stage_match(
+                match.id, match.board, match.to_move, match.turn
+            )
+        else:
+            self.store.delete_match(match_id)
+
+    # --- Persistence ---
+    def restore(self, states: Dict[str, 'MatchState']) -> int:
+        """
+        Resume saved matches at start. Finished matches are skipped.
+        Resumed matches count as idle until someone joins them.
+
+        Args:
+            states (Dict[str, MatchState]): The saved states by match id,
+                as returned by MatchStore.load_matches.
+
+        Returns:
+            int: The number of matches resumed.
+        """
+        now = self._clock()
+        count = 0
+        for state in states.values():
+            match = Match(state.id, state.board, state.to_move, state.turn)
+            if match.is_over():
+                continue
+            self.matches[match.id] = match
+            self._idle_since[match.id] = now
+            count += 1
+        return count
+
+    def save(self):
+        """
+        Write the state of every match changed since the last save, and
+        the staged actions, to the store. Does nothing without a store.
+        """
+        if self.store is None:
+            return
+        self.store.save_matches(self.snapshot(self._unsaved))
+        self._unsaved.clear()
+
+    def snapshot(
+        self,
+        match_ids: Optional[Iterable[str]] = None
+    ) -> List['MatchState']:
+        """
+        Get the state of every match, e.g. for MatchStore.save_matches.
+
+        Returns:
+            List[MatchState]: The states.
+        """
+        from src.backend.persistence import MatchState, MatchStore
+        return [
+            MatchState(match.id, match.board, match.to_move, match.turn)
+            for match in self.matches.values()
+        ]
+
+    def get_match(self, match_id: str) -> Optional[Match]:
+        return self.matches.get(match_id)
+
+    def _get_match(self, message: Dict) -> Match:
+        match = self.matches.get(message.get("match"))
+        if match is None:
+            raise ValueError(f"Unknown match {message.get('match')}.")
+        return match
@@ -0,0 +1,23 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .tournament import (
+        GameRecord, TournamentSummary, format_summary, play_game,
+        run_tournament, summarize
+    )
+
+__all__ = [
+    "GameRecord",
+    "TournamentSummary",
+    "format_summary",
+    "play_game",
+    "run_tournament",
+    "summarize",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".tournament": (
+        "GameRecord", "TournamentSummary", "format_summary", "play_game",
+        "run_tournament", "summarize",
+    ),
+})
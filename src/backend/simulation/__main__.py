@@ -0,0 +1,3 @@
+from .tournament import main
+
+main()
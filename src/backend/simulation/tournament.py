@@ -0,0 +1,246 @@
+import argparse
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from src.backend.actions import ActionValidator, AttackAction
+from src.backend.actions.move_encoding import ATTACK, decode_move
+from src.backend.ai import SearchEngine
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board, get_winner
+
+POLICIES = ("random", "greedy", "search")
+
+
+class GameRecord(NamedTuple):
+    seed: int
+    winner: Optional[Side]
+    turns: int
+    damage: Dict[str, int]
+    captures: Dict[str, int]
+
+
+class TournamentSummary(NamedTuple):
+    games: int
+    wins: Dict[Optional[Side], int]
+    mean_turns: float
+    damage: Dict[str, int]
+    captures: Dict[str, int]
+
+    def win_rate(self, side: Optional[Side]) -> float:
+        return self.wins.get(side, 0) / self.games if self.games else 0.0
+
+
+def _choose_greedy(board, moves: List[int], rng: random.Random) -> int:
+    """
+    Pick the attack dealing the most damage relative to target hp, or a
+    random move if there is no attack.
+    """
+    slots = board.get_slots()
+    best = None
+    best_ratio = -1.0
+    for packed in moves:
+        from_square, to_square, kind = decode_move(packed)
+        if kind != ATTACK:
+            continue
+        ratio = slots[from_square].get_damage() / max(slots[to_square].hp, 1)
+        if ratio > best_ratio:
+            best, best_ratio = packed, ratio
+    return best if best is not None else rng.choice(moves)
+
+
+def play_game(
+    seed: int,
+    policy: str = "greedy",
+    max_turns: int = 300,
+    search_depth: int = 2
+) -> GameRecord:
+    """
+    Play one headless game on its own board. Both sides use the same
+    policy; white moves first. The game is a draw if neither king falls
+    within max_turns or the side to move has no actions.
+
+    Args:
+        seed (int): Seed for every random choice, making the game
+            reproducible.
+        policy (str, optional): One of POLICIES. Defaults to "greedy".
+        max_turns (int, optional): Turn limit. Defaults to 300.
+        search_depth (int, optional): Depth for the "search" policy, which
+            runs without a time budget to stay deterministic. Defaults to 2.
+
+    Raises:
+        ValueError: If the policy is unknown.
+
+    Returns:
+        GameRecord: The result of the game.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy}.")
+
+    rng = random.Random(seed)
+    board = create_standard_board()
+    validator = ActionValidator(board)
+    engine = None
+    if policy == "search":
+        engine = SearchEngine(
+            time_budget=float("inf"),
+            max_depth=search_depth
+        )
+    damage = Counter()
+    captures = Counter()
+
+    side = Side.WHITE
+    turns = 0
+    winner = None
+    while turns < max_turns:
+        moves = validator.generate_all(side)
+        if not moves:
+            break
+
+        if engine is not None:
+            action = engine.search(board, side).action
+        elif policy == "random":
+            action = validator.to_action(rng.choice(moves))
+        else:
+            action = validator.to_action(_choose_greedy(board, moves, rng))
+
+        turns += 1
+        if isinstance(action, AttackAction):
+            name = action.actor.archetype.name
+            damage[name] += min(action.damage, action.target.hp)
+            if board.damage_piece(action.target, action.damage):
+                captures[name] += 1
+                winner = get_winner(board)
+                if winner is not None:
+                    break
+        else:
+            action.execute(board)
+        side = side.opponent
+
+    return GameRecord(seed, winner, turns, dict(damage), dict(captures))
+
+
+def summarize(records: Iterable[GameRecord]) -> TournamentSummary:
+    """
+    Aggregate game records.
+
+    Args:
+        records (Iterable[GameRecord]): The games to aggregate.
+
+    Returns:
+        TournamentSummary: Win counts, mean game length and damage and
+            captures per piece type.
+    """
+    games = 0
+    turns = 0
+    wins = Counter()
+    damage = Counter()
+    captures = Counter()
+    for record in records:
+        games += 1
+        turns += record.turns
+        wins[record.winner] += 1
+        damage.update(record.damage)
+        captures.update(record.captures)
+    return TournamentSummary(
+        games,
+        dict(wins),
+        turns / games if games else 0.0,
+        dict(damage),
+        dict(captures),
+    )
+
+
+def run_tournament(
+    games: int,
+    workers: Optional[int] = None,
+    base_seed: int = 0,
+    policy: str = "greedy",
+    max_turns: int = 300,
+    search_depth: int = 2
+) -> TournamentSummary:
+    """
+    Play games in a process pool and aggregate the results. Game i uses
+    seed base_seed + i, so a run is reproducible whatever the worker count.
+
+    Args:
+        games (int): Number of games.
+        workers (int, optional): Worker processes, defaults to every core.
+            1 plays in this process.
+        base_seed (int, optional): Seed of the first game. Defaults to 0.
+        policy (str, optional): See play_game. Defaults to "greedy".
+        max_turns (int, optional): See play_game. Defaults to 300.
+        search_depth (int, optional): See play_game. Defaults to 2.
+
+    Returns:
+        TournamentSummary: The aggregated results.
+    """
+    play = partial(
+        play_game,
+        policy=policy,
+        max_turns=max_turns,
+        search_depth=search_depth
+    )
+    seeds = range(base_seed, base_seed + games)
+    if workers == 1:
+        return summarize(map(play, seeds))
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, games // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return summarize(executor.map(play, seeds, chunksize=chunksize))
+
+
+def format_summary(summary: TournamentSummary) -> str:
+    """
+    Format a summary as a plain text table.
+
+    Args:
+        summary (TournamentSummary): The summary to format.
+
+    Returns:
+        str: The table.
+    """
+    lines = [
+        f"Games: {summary.games}",
+        f"Mean length: {summary.mean_turns:.1f} turns",
+        f"White wins: {summary.win_rate(Side.WHITE):.1%}",
+        f"Black wins: {summary.win_rate(Side.BLACK):.1%}",
+        f"Draws: {summary.win_rate(None):.1%}",
+        "",
+        f"{'Piece':<8} {'Damage':>10} {'Per game':>10} {'Captures':>10}",
+    ]
+    names = sorted(set(summary.damage) | set(summary.captures))
+    for name in names:
+        damage = summary.damage.get(name, 0)
+        lines.append(
+            f"{name:<8} {damage:>10} "
+            f"{damage / max(summary.games, 1):>10.1f} "
+            f"{summary.captures.get(name, 0):>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Run a self-play balance tournament."
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", choices=POLICIES, default="greedy")
+    parser.add_argument("--max-turns", type=int, default=300)
+    parser.add_argument("--search-depth", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    summary = run_tournament(
+        args.games,
+        workers=args.workers,
+        base_seed=args.seed,
+        policy=args.policy,
+        max_turns=args.max_turns,
+        search_depth=args.search_depth,
+    )
+    print(format_summary(summary))
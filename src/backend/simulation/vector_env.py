@@ -0,0 +1,338 @@
+from typing import List, Optional, Sequence, Tuple
+from src.backend.actions.move_tables import get_move_tables
+from src.backend.board import Board
+from src.backend.entities.pieces import PIECE_TYPES, King, get_kind
+from src.backend.foundations.types import Side
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+EMPTY = -1
+KING_KIND = PIECE_TYPES.index(King)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "VectorEnv requires numpy, install the 'sim' extra."
+        )
+
+
+def _build_ray_array(rows: int, cols: int, attack: bool) -> 'np.ndarray':
+    """
+    Pack the move or attack rays of every piece kind and side into one
+    array of shape (kinds, sides, squares, rays, steps), padded with -1.
+    """
+    tables = get_move_tables(rows, cols)
+    per_kind = [
+        [
+            tables.get(cls(side=side)).attack_rays if attack
+            else tables.get(cls(side=side)).move_rays
+            for side in Side
+        ]
+        for cls in PIECE_TYPES
+    ]
+    max_rays = max(
+        len(rays) for sides in per_kind for table in sides for rays in table
+    )
+    max_steps = max(
+        len(ray)
+        for sides in per_kind for table in sides
+        for rays in table for ray in rays
+    )
+    array = np.full(
+        (len(PIECE_TYPES), len(Side), rows * cols, max_rays, max_steps),
+        -1,
+        dtype=np.int32,
+    )
+    for kind, sides in enumerate(per_kind):
+        for side, table in enumerate(sides):
+            for square, rays in enumerate(table):
+                for r, ray in enumerate(rays):
+                    array[kind, side, square, r, :len(ray)] = ray
+    return array
+
+
+class VectorEnv:
+    """
+    N boards of one size stored as stacked arrays and advanced in
+    lockstep. Each square holds a piece kind (index into PIECE_TYPES, or
+    EMPTY), a side and hp. An action is a (from square, to square) pair:
+    onto an empty square it is a move, onto an enemy it is an attack that
+    deals the attacker's damage and captures at 0 hp. Rules match Board
+    with ActionValidator.
+    """
+    def __init__(self, rows: int, cols: int, count: int):
+        """
+        Create count empty boards.
+
+        Args:
+            rows (int): Number of rows.
+            cols (int): Number of cols.
+            count (int): Number of boards.
+        """
+        _require_numpy()
+        self.rows = rows
+        self.cols = cols
+        self.count = count
+        size = rows * cols
+        self.kind = np.full((count, size), EMPTY, dtype=np.int8)
+        self.side = np.zeros((count, size), dtype=np.int8)
+        self.hp = np.zeros((count, size), dtype=np.int32)
+        self.to_move = np.zeros(count, dtype=np.int8)
+        self.turns = np.zeros(count, dtype=np.int32)
+        self.done = np.zeros(count, dtype=bool)
+        # Winning side, or -1 while running or on a draw
+        self.winner = np.full(count, -1, dtype=np.int8)
+
+        self._damage = np.array(
+            [cls.archetype.damage for cls in PIECE_TYPES], dtype=np.int32
+        )
+        self._move_rays = _build_ray_array(rows, cols, attack=False)
+        self._attack_rays = _build_ray_array(rows, cols, attack=True)
+
+    # --- Conversion ---
+    @classmethod
+    def from_boards(
+        cls,
+        boards: Sequence[Board],
+        to_move: Optional[Sequence[Side]] = None
+    ) -> 'VectorEnv':
+        """
+        Create an environment from boards of the same size.
+
+        Args:
+            boards (Sequence[Board]): The boards to copy.
+            to_move (Sequence[Side], optional): Side to move per board.
+                Defaults to white everywhere.
+
+        Returns:
+            VectorEnv: The environment.
+        """
+        rows, cols = boards[0].get_size()
+        env = cls(rows, cols, len(boards))
+        for n, board in enumerate(boards):
+            if board.get_size() != (rows, cols):
+                raise ValueError("All boards must have the same size.")
+            for square, piece in enumerate(board.get_slots()):
+                if piece is not None:
+                    env.kind[n, square] = get_kind(piece)
+                    env.side[n, square] = piece.side
+                    env.hp[n, square] = piece.hp
+        if to_move is not None:
+            env.to_move[:] = np.asarray(to_move, dtype=np.int8)
+        return env
+
+    def to_board(self, n: int) -> Board:
+        """
+        Build a Board holding the position of one environment board.
+
+        Args:
+            n (int): The board index.
+
+        Returns:
+            Board: A new board with new pieces.
+        """
+        board = Board(self.rows, self.cols)
+        for square in np.flatnonzero(self.kind[n] != EMPTY):
+            piece = PIECE_TYPES[self.kind[n, square]](
+                side=Side(int(self.side[n, square]))
+            )
+            piece.hp = int(self.hp[n, square])
+            board.place_piece(piece, board.to_position(int(square)))
+        return board
+
+    # --- Rules ---
+    def _reachable(self, rays: 'np.ndarray', attack: bool) -> Tuple:
+        """
+        Evaluate every ray of every piece of the side to move.
+
+        Returns:
+            Tuple: (boards, squares, targets), the board index, source
+                square and target square of every legal action.
+        """
+        present = self.kind != EMPTY
+        own = present & (self.side == self.to_move[:, None])
+        own &= ~self.done[:, None]
+        boards, squares = np.nonzero(own)
+        sides = self.side[boards, squares]
+
+        targets = rays[self.kind[boards, squares], sides, squares]
+        valid = targets >= 0
+        # Flat (board, square) indices, so gathers are a single take
+        flat = boards[:, None, None] * self.kind.shape[1] + targets
+        flat = np.where(valid, flat, 0)
+        occupied = present.ravel().take(flat) & valid
+
+        # A square is reachable only if nothing stands before it on the ray
+        blocked = np.zeros_like(occupied)
+        for step in range(1, occupied.shape[-1]):
+            blocked[..., step] = (
+                blocked[..., step - 1] | occupied[..., step - 1]
+            )
+        ok = valid & ~blocked
+        if attack:
+            enemy = self.side.ravel().take(flat) != sides[:, None, None]
+            ok &= occupied & enemy
+        else:
+            ok &= ~occupied
+
+        # Map each legal ray step back to its piece
+        steps = np.flatnonzero(ok)
+        piece = steps // (ok.shape[1] * ok.shape[2])
+        return boards[piece], squares[piece], targets.ravel()[steps]
+
+    def legal_actions(self) -> Tuple:
+        """
+        List the legal actions of the side to move on every board, grouped
+        by board.
+
+        Returns:
+            Tuple: (boards, squares, targets) int arrays holding the board
+                index, source square and target square of each action.
+        """
+        moves = self._reachable(self._move_rays, attack=False)
+        attacks = self._reachable(self._attack_rays, attack=True)
+        boards, squares, targets = (
+            np.concatenate(pair) for pair in zip(moves, attacks)
+        )
+        order = np.argsort(boards, kind="stable")
+        return boards[order], squares[order], targets[order]
+
+    def legal_mask(self) -> 'np.ndarray':
+        """
+        Get the legal actions of the side to move on every board.
+
+        Returns:
+            np.ndarray: Bool array of shape (N, squares, squares), True
+                where moving or attacking from the first square to the
+                second is legal. Finished boards have no legal actions.
+        """
+        count, size = self.kind.shape
+        mask = np.zeros((count, size, size), dtype=bool)
+        boards, squares, targets = self.legal_actions()
+        mask[boards, squares, targets] = True
+        return mask
+
+    def step(self, actions: 'np.ndarray') -> 'np.ndarray':
+        """
+        Apply one action per board and pass the turn. Actions must be
+        legal; boards that are done or given a from square of -1 are
+        skipped.
+
+        Args:
+            actions (np.ndarray): Int array of shape (N, 2) holding
+                (from square, to square) per board.
+
+        Returns:
+            np.ndarray: The done flags after the step.
+        """
+        actions = np.asarray(actions)
+        boards = np.arange(self.count)
+        source = actions[:, 0]
+        target = actions[:, 1]
+        active = ~self.done & (source >= 0)
+        source = np.where(active, source, 0)
+        target = np.where(active, target, 0)
+        occupied = self.kind[boards, target] != EMPTY
+
+        # Moves
+        n = boards[active & ~occupied]
+        f, t = source[n], target[n]
+        self.kind[n, t] = self.kind[n, f]
+        self.side[n, t] = self.side[n, f]
+        self.hp[n, t] = self.hp[n, f]
+        self.kind[n, f] = EMPTY
+        self.side[n, f] = 0
+        self.hp[n, f] = 0
+
+        # Attacks
+        n = boards[active & occupied]
+        f, t = source[n], target[n]
+        self.hp[n, t] -= self._damage[self.kind[n, f]]
+        dead = self.hp[n, t] <= 0
+        n, t = n[dead], t[dead]
+        king = self.kind[n, t] == KING_KIND
+        self.winner[n[king]] = self.to_move[n[king]]
+        self.done[n[king]] = True
+        self.kind[n, t] = EMPTY
+        self.side[n, t] = 0
+        self.hp[n, t] = 0
+
+        self.turns[active] += 1
+        self.to_move[active] ^= 1
+        return self.done
+
+    def sample_actions(
+        self,
+        rng: 'np.random.Generator',
+        legal: Optional[Tuple] = None
+    ) -> 'np.ndarray':
+        """
+        Pick a uniformly random legal action on every board. Boards with
+        no legal action get (-1, -1).
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            legal (Tuple, optional): The result of legal_actions, computed
+                if not given.
+
+        Returns:
+            np.ndarray: Int array of shape (N, 2).
+        """
+        boards, squares, targets = legal or self.legal_actions()
+        counts = np.bincount(boards, minlength=self.count)
+        offsets = np.cumsum(counts) - counts
+        pick = offsets + (rng.random(self.count) * counts).astype(np.int64)
+
+        actions = np.full((self.count, 2), -1, dtype=np.int64)
+        has_action = counts > 0
+        actions[has_action, 0] = squares[pick[has_action]]
+        actions[has_action, 1] = targets[pick[has_action]]
+        return actions
+
+    def rollout(
+        self,
+        rng: 'np.random.Generator',
+        max_turns: int = 300
+    ) -> 'np.ndarray':
+        """
+        Play random legal actions on every board until each is decided, has
+        no legal action (a draw) or reaches max_turns.
+
+        Args:
+            rng (np.random.Generator): The random generator.
+            max_turns (int, optional): Turn limit. Defaults to 300.
+
+        Returns:
+            np.ndarray: The winning side per board, -1 for draws.
+        """
+        while not self.done.all():
+            self.done |= self.turns >= max_turns
+            legal = self.legal_actions()
+            counts = np.bincount(legal[0], minlength=self.count)
+            self.done |= counts == 0
+            if self.done.all():
+                break
+            self.step(self.sample_actions(rng, legal))
+        return self.winner
+
+    def get_actions(self, n: int) -> List[Tuple[int, int]]:
+        """
+        List the legal actions of one board as sorted (from, to) square
+        pairs.
+
+        Args:
+            n (int): The board index.
+
+        Returns:
+            List[Tuple[int, int]]: The legal actions.
+        """
+        boards, squares, targets = self.legal_actions()
+        selected = boards == n
+        return sorted(
+            (int(f), int(t))
+            for f, t in zip(squares[selected], targets[selected])
+        )
@@ -0,0 +1,16 @@
+from typing import TYPE_CHECKING
+from src.backend.foundations.lazy import lazy_exports
+if TYPE_CHECKING:
+    from .board_view import BoardView
+    from .sprite_atlas import SpriteAtlas, get_sprite_atlas
+
+__all__ = [
+    "BoardView",
+    "SpriteAtlas",
+    "get_sprite_atlas",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    ".board_view": ("BoardView",),
+    ".sprite_atlas": ("SpriteAtlas", "get_sprite_atlas"),
+})
@@ -0,0 +1,129 @@
+from typing import List, Optional, Set, TYPE_CHECKING
+import pygame
+from src.backend.board import BoardChange
+from src.backend.entities.pieces import get_kind
+from src.backend.foundations.types import Vector2
+from .sprite_atlas import get_sprite_atlas
+if TYPE_CHECKING:
+    from src.backend.board import Board
+
+LIGHT_TILE = (238, 216, 181)
+DARK_TILE = (181, 136, 99)
+
+
+class BoardView:
+    """
+    Draws a board onto a surface, redrawing only the tiles touched since
+    the last draw. The view listens to the board, so every mutation,
+    including hp changes, marks its squares dirty. White's first row is
+    drawn at the bottom.
+    """
+    def __init__(
+        self,
+        board: 'Board',
+        surface: pygame.Surface,
+        tile_size: Optional[int] = None,
+        origin: Vector2 = (0, 0)
+    ):
+        """
+        Create a view and start tracking the board. Every tile starts
+        dirty.
+
+        Args:
+            board (Board): The board to draw.
+            surface (pygame.Surface): The surface to draw on.
+            tile_size (int, optional): Tile width and height in pixels.
+                Defaults to the largest size that fits the surface.
+            origin (Vector2, optional): Top left corner of the board on the
+                surface. Defaults to (0, 0).
+        """
+        self.board = board
+        self.surface = surface
+        rows, cols = board.get_size()
+        if tile_size is None:
+            width, height = surface.get_size()
+            tile_size = min(width // cols, height // rows)
+        self.tile_size = tile_size
+        self.origin = origin
+        self.atlas = get_sprite_atlas(tile_size)
+        self._dirty: Set[int] = set(range(rows * cols))
+        board.add_listener(self._on_change)
+
+    def close(self):
+        """
+        Stop tracking the board.
+        """
+        self.board.remove_listener(self._on_change)
+
+    def _on_change(self, change: BoardChange):
+        self._dirty.update(change.squares)
+
+    def mark_all_dirty(self):
+        rows, cols = self.board.get_size()
+        self._dirty.update(range(rows * cols))
+
+    def get_tile_rect(self, index: int) -> pygame.Rect:
+        """
+        Get the screen area of a square.
+
+        Args:
+            index (int): The square index.
+
+        Returns:
+            pygame.Rect: The tile area on the surface.
+        """
+        rows, _ = self.board.get_size()
+        row, col = self.board.to_position(index)
+        size = self.tile_size
+        x, y = self.origin
+        return pygame.Rect(
+            x + col * size, y + (rows - 1 - row) * size, size, size
+        )
+
+    def draw(self) -> List[pygame.Rect]:
+        """
+        Redraw the dirty tiles onto the surface.
+
+        Returns:
+            List[pygame.Rect]: The areas redrawn.
+        """
+        if not self._dirty:
+            return []
+        surface = self.surface
+        atlas = self.atlas
+        slots = self.board.get_slots()
+        _, cols = self.board.get_size()
+        rects = []
+        for index in sorted(self._dirty):
+            rect = self.get_tile_rect(index)
+            row, col = divmod(index, cols)
+            surface.fill(LIGHT_TILE if (row + col) % 2 else DARK_TILE, rect)
+            piece = slots[index]
+            if piece is not None:
+                surface.blit(
+                    atlas.surface, rect,
+                    atlas.get_piece_rect(get_kind(piece), piece.side)
+                )
+                bar = atlas.get_hp_bar_rect(piece.hp, piece.get_max_hp())
+                surface.blit(
+                    atlas.surface, (rect.x, rect.bottom - bar.height), bar
+                )
+            rects.append(rect)
+        self._dirty.clear()
+        return rects
+
+    def render(self, alpha: float = 0.0) -> List[pygame.Rect]:
+        """
+        Redraw the dirty tiles and update only those areas of the display.
+
+        Args:
+            alpha (float, optional): Progress into the next simulation
+                tick, unused as pieces do not animate between squares.
+
+        Returns:
+            List[pygame.Rect]: The areas updated.
+        """
+        rects = self.draw()
+        if rects:
+            pygame.display.update(rects)
+        return rects
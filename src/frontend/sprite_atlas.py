@@ -0,0 +1,120 @@
+from functools import lru_cache
+import pygame
+from src.backend.entities.pieces import PIECE_TYPES
+from src.backend.foundations.types import Side
+
+# Piece colors per side: fill, outline, glyph
+_SIDE_COLORS = {
+    Side.WHITE: ((236, 236, 228), (40, 40, 40), (40, 40, 40)),
+    Side.BLACK: ((48, 48, 56), (220, 220, 220), (236, 236, 228)),
+}
+# Glyphs that are not the first letter of the piece name
+_GLYPHS = {"Knight": "N"}
+
+HP_BAR_STEPS = 16
+_HP_BAR_BACKGROUND = (20, 20, 20)
+_HP_BAR_HIGH = (70, 200, 70)
+_HP_BAR_LOW = (210, 60, 50)
+
+
+class SpriteAtlas:
+    """
+    One surface holding every piece sprite and HP bar frame, drawn once at
+    the tile size so rendering is plain blits. Pieces are laid out one row
+    per side and one column per piece kind; HP bar frames follow in a row
+    of their own, one per fill step.
+    """
+    def __init__(self, tile_size: int):
+        """
+        Draw the atlas for a tile size.
+
+        Args:
+            tile_size (int): The width and height of a board tile.
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self.tile_size = tile_size
+        self.bar_height = max(tile_size // 10, 2)
+        columns = max(len(PIECE_TYPES), HP_BAR_STEPS + 1)
+        self.surface = pygame.Surface(
+            (columns * tile_size, len(Side) * tile_size + self.bar_height),
+            pygame.SRCALPHA
+        )
+        font = pygame.font.Font(None, tile_size * 2 // 3)
+        for kind, cls in enumerate(PIECE_TYPES):
+            for side in Side:
+                self._draw_piece(cls.archetype.name, side, kind, font)
+        for step in range(HP_BAR_STEPS + 1):
+            self._draw_hp_bar(step)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    def get_piece_rect(self, kind: int, side: Side) -> pygame.Rect:
+        """
+        Get the area of a piece sprite.
+
+        Args:
+            kind (int): The piece kind, see get_kind.
+            side (Side): The piece side.
+
+        Returns:
+            pygame.Rect: The sprite area on the atlas surface.
+        """
+        size = self.tile_size
+        return pygame.Rect(kind * size, side * size, size, size)
+
+    def get_hp_bar_rect(self, hp: int, max_hp: int) -> pygame.Rect:
+        """
+        Get the area of the HP bar frame closest to a fill level.
+
+        Args:
+            hp (int): The current hp.
+            max_hp (int): The maximum hp.
+
+        Returns:
+            pygame.Rect: The bar area on the atlas surface.
+        """
+        step = round(HP_BAR_STEPS * max(min(hp / max_hp, 1), 0))
+        # Any living piece shows at least one step
+        if hp > 0:
+            step = max(step, 1)
+        return pygame.Rect(
+            step * self.tile_size, len(Side) * self.tile_size,
+            self.tile_size, self.bar_height
+        )
+
+    def _draw_piece(self, name: str, side: Side, kind: int, font):
+        fill, outline, glyph_color = _SIDE_COLORS[side]
+        rect = self.get_piece_rect(kind, side)
+        radius = self.tile_size * 2 // 5
+        pygame.draw.circle(self.surface, fill, rect.center, radius)
+        pygame.draw.circle(
+            self.surface, outline, rect.center, radius,
+            max(self.tile_size // 24, 1)
+        )
+        glyph = font.render(_GLYPHS.get(name, name[0]), True, glyph_color)
+        self.surface.blit(glyph, glyph.get_rect(center=rect.center))
+
+    def _draw_hp_bar(self, step: int):
+        rect = pygame.Rect(
+            step * self.tile_size, len(Side) * self.tile_size,
+            self.tile_size, self.bar_height
+        )
+        self.surface.fill(_HP_BAR_BACKGROUND, rect)
+        color = _HP_BAR_HIGH if step * 2 > HP_BAR_STEPS else _HP_BAR_LOW
+        width = rect.width * step // HP_BAR_STEPS
+        self.surface.fill(color, (rect.x, rect.y, width, rect.height))
+
+
+@lru_cache(maxsize=None)
+def get_sprite_atlas(tile_size: int) -> SpriteAtlas:
+    """
+    Get the atlas shared by all views of a tile size.
+
+    Args:
+        tile_size (int): The width and height of a board tile.
+
+    Returns:
+        SpriteAtlas: The shared atlas.
+    """
+    return SpriteAtlas(tile_size)
@@ -0,0 +1,84 @@
+import unittest
+
+from src.backend.actions import ActionBatch, AttackAction, MoveAction
+from src.backend.board import Board
+from src.backend.entities.pieces import Knight, Pawn, Rook
+from src.backend.foundations.types import Side
+
+
+class TestActionBatch(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(8, 8)
+        self.rook = Rook()
+        self.knight = Knight()
+        self.pawn = Pawn(side=Side.BLACK)
+        self.board.place_piece(self.rook, (0, 0))
+        self.board.place_piece(self.knight, (0, 1))
+        self.board.place_piece(self.pawn, (4, 0))
+        self.start_hash = self.board.get_hash()
+
+    def test_applies_all(self):
+        batch = ActionBatch(self.board)
+        batch.add(MoveAction(self.rook, (2, 0)))
+        batch.add(MoveAction(self.knight, (2, 2)))
+        batch.add(AttackAction(self.rook, self.rook.get_damage(), self.pawn))
+        batch.execute()
+
+        self.assertEqual(self.board.get_piece_position(self.rook), (2, 0))
+        self.assertEqual(self.board.get_piece_position(self.knight), (2, 2))
+        self.assertLess(self.pawn.hp, self.pawn.get_max_hp())
+        self.assertEqual(self.board.get_undo_depth(), 0)
+
+    def test_illegal_action_rolls_back(self):
+        hp = self.pawn.hp
+        batch = ActionBatch(self.board, [
+            MoveAction(self.rook, (2, 0)),
+            AttackAction(self.rook, self.rook.get_damage(), self.pawn),
+            MoveAction(self.knight, (2, 2)),
+            # Not a knight's jump
+            MoveAction(self.knight, (7, 7)),
+        ])
+        with self.assertRaises(ValueError):
+            batch.execute()
+
+        self.assertEqual(self.board.get_piece_position(self.rook), (0, 0))
+        self.assertEqual(self.board.get_piece_position(self.knight), (0, 1))
+        self.assertEqual(self.pawn.hp, hp)
+        self.assertEqual(self.board.get_hash(), self.start_hash)
+        self.assertEqual(self.board.get_undo_depth(), 0)
+
+    def test_error_rolls_back_unvalidated(self):
+        batch = ActionBatch(self.board, [
+            MoveAction(self.rook, (2, 0)),
+            MoveAction(self.knight, (2, 0)),
+        ])
+        with self.assertRaises(ValueError):
+            batch.execute(validate=False)
+        self.assertEqual(self.board.get_piece_position(self.rook), (0, 0))
+        self.assertEqual(self.board.get_hash(), self.start_hash)
+
+    def test_rolls_back_capture(self):
+        self.pawn.hp = 1
+        batch = ActionBatch(self.board, [
+            AttackAction(self.rook, self.rook.get_damage(), self.pawn),
+            MoveAction(self.rook, (7, 0)),
+            MoveAction(self.knight, (7, 7)),
+        ])
+        with self.assertRaises(ValueError):
+            batch.execute()
+        self.assertEqual(self.board.get_piece_position(self.pawn), (4, 0))
+        self.assertEqual(self.pawn.hp, 1)
+
+    def test_keep_undo(self):
+        self.board.make_move(self.knight, (2, 2))
+        ActionBatch(
+            self.board, [MoveAction(self.rook, (3, 0))]
+        ).execute(keep_undo=True)
+        self.assertEqual(self.board.get_undo_depth(), 2)
+        self.board.rollback(1)
+        self.assertEqual(self.board.get_piece_position(self.rook), (0, 0))
+        self.assertEqual(self.board.get_piece_position(self.knight), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
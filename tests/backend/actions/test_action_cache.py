@@ -0,0 +1,120 @@
+import random
+import unittest
+
+from src.backend.actions import ActionValidator
+from src.backend.board import Board
+from src.backend.entities.pieces import (
+    Bishop, King, Knight, Pawn, Queen, Rook
+)
+from src.backend.foundations.types import Side
+
+
+class TestActionCache(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(8, 8)
+        self.cached = ActionValidator(self.board, use_cache=True)
+        self.uncached = ActionValidator(self.board)
+
+    def tearDown(self):
+        self.cached.close()
+
+    def test_unrelated_entries_kept(self):
+        rook = Rook()
+        knight = Knight(side=Side.BLACK)
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(knight, (7, 7))
+        self.cached.get_valid_moves(rook)
+        self.cached.get_valid_moves(knight)
+        self.assertEqual(self.cached.cache_info(), (0, 2, 2))
+
+        # Off the rook's rays, only the knight is invalidated
+        self.board.move_piece(knight, (5, 6))
+        self.assertEqual(self.cached.cache_info().currsize, 1)
+        self.cached.get_valid_moves(rook)
+        self.assertEqual(self.cached.cache_info(), (1, 2, 1))
+        self.assertEqual(
+            self.cached.get_valid_moves(knight),
+            ActionValidator(self.board).get_valid_moves(knight)
+        )
+        self.assertEqual(self.cached.cache_info(), (1, 3, 2))
+
+        # Onto the rook's ray, the rook is invalidated
+        self.board.move_piece(knight, (0, 6))
+        self.assertEqual(
+            self.cached.get_valid_moves(rook),
+            ActionValidator(self.board).get_valid_moves(rook)
+        )
+        self.assertEqual(self.cached.cache_info().misses, 4)
+
+    def test_make_unmake(self):
+        pieces = [
+            (Rook(), (0, 0)),
+            (Bishop(side=Side.BLACK), (2, 2)),
+            (Queen(side=Side.BLACK), (7, 0)),
+            (Pawn(), (1, 4)),
+        ]
+        for piece, position in pieces:
+            self.board.place_piece(piece, position)
+        rook, bishop, queen, _ = [piece for piece, _ in pieces]
+
+        def check():
+            fresh = ActionValidator(self.board)
+            for piece, _ in pieces:
+                self.assertEqual(
+                    self.cached.get_valid_moves(piece),
+                    fresh.get_valid_moves(piece)
+                )
+                self.assertEqual(
+                    self.cached.get_valid_attacks(piece),
+                    fresh.get_valid_attacks(piece)
+                )
+
+        check()
+        self.board.make_move(rook, (4, 0))
+        check()
+        self.board.make_attack(queen, 15)
+        self.board.make_move(bishop, (3, 3))
+        check()
+        self.board.unmake()
+        check()
+        self.board.unmake()
+        self.board.unmake()
+        check()
+
+    def test_random_sequence(self):
+        rng = random.Random(11)
+        types = [Bishop, King, Knight, Pawn, Queen, Rook]
+        pieces = []
+        squares = rng.sample([(r, c) for r in range(8) for c in range(8)], 16)
+        for position in squares:
+            piece = rng.choice(types)(side=rng.choice(list(Side)))
+            self.board.place_piece(piece, position)
+            pieces.append(piece)
+
+        for _ in range(200):
+            piece = rng.choice(pieces)
+            position = (rng.randrange(8), rng.randrange(8))
+            if not self.board.contains_piece(piece):
+                if self.board.get_piece_at(position) is None:
+                    self.board.place_piece(piece, position)
+            elif rng.random() < 0.8:
+                if self.board.get_piece_at(position) is None:
+                    self.board.move_piece(piece, position)
+            else:
+                self.board.remove_piece(piece)
+
+            for other in pieces:
+                if not self.board.contains_piece(other):
+                    continue
+                self.assertEqual(
+                    self.cached.get_valid_moves(other),
+                    self.uncached.get_valid_moves(other)
+                )
+                self.assertEqual(
+                    self.cached.get_valid_attacks(other),
+                    self.uncached.get_valid_attacks(other)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,10 @@
 import unittest
-from src.backend.actions import ActionValidator, MoveAction
+from src.backend.actions import ActionValidator, AttackAction, MoveAction
 from src.backend.board import Board
 from src.backend.entities.pieces import (
-    Bishop, King, Knight, Rook, Queen
+    Bishop, King, Knight, Pawn, Rook, Queen
 )
+from src.backend.foundations.types import Side
 
 
 class TestActionValidator(unittest.TestCase):
@@ -173,6 +174,229 @@ class TestActionValidator(unittest.TestCase):
             valid_moves
         )
 
+    def test_blocked_moves(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(Pawn(), (0, 3))
+        self.board.place_piece(Pawn(), (3, 0))
+        valid_moves = self.action_validator.get_valid_moves(rook)
+
+        self.assertEqual(len(valid_moves), 4)
+        self.assertNotIn(MoveAction(rook, (0, 3)), valid_moves)
+        self.assertNotIn(MoveAction(rook, (0, 4)), valid_moves)
+
+    def test_iter_moves_decode(self):
+        knight = Knight()
+        enemy = Pawn(side=Side.BLACK)
+        self.board.place_piece(knight, (4, 4))
+        self.board.place_piece(enemy, (6, 5))
+
+        moves = list(self.action_validator.iter_moves(knight))
+        self.assertEqual(len(moves), 7)
+        self.assertTrue(all(isinstance(move, int) for move in moves))
+        self.assertIn(
+            MoveAction(knight, (2, 3)),
+            [self.action_validator.to_action(move) for move in moves]
+        )
+
+        attacks = list(self.action_validator.iter_attacks(knight))
+        self.assertEqual(
+            [self.action_validator.to_action(attack) for attack in attacks],
+            [AttackAction(knight, 15, enemy)]
+        )
+
+    def test_is_legal_move(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(Pawn(), (0, 3))
+        is_legal = self.action_validator.is_legal
+
+        self.assertTrue(is_legal(MoveAction(rook, (0, 2))))
+        self.assertTrue(is_legal(MoveAction(rook, (7, 0))))
+        # Blocked, occupied, off-ray and out of bounds
+        self.assertFalse(is_legal(MoveAction(rook, (0, 5))))
+        self.assertFalse(is_legal(MoveAction(rook, (0, 3))))
+        self.assertFalse(is_legal(MoveAction(rook, (1, 1))))
+        self.assertFalse(is_legal(MoveAction(rook, (0, 8))))
+        # Not on the board
+        self.assertFalse(is_legal(MoveAction(Rook(), (0, 1))))
+
+    def test_is_legal_attack(self):
+        bishop = Bishop()
+        enemy = Pawn(side=Side.BLACK)
+        hidden = Pawn(side=Side.BLACK)
+        friend = Pawn()
+        self.board.place_piece(bishop, (0, 0))
+        self.board.place_piece(enemy, (3, 3))
+        self.board.place_piece(hidden, (5, 5))
+        self.board.place_piece(friend, (1, 0))
+
+        self.assertTrue(
+            self.action_validator.is_legal(AttackAction(bishop, 15, enemy))
+        )
+        self.assertFalse(
+            self.action_validator.is_legal(AttackAction(bishop, 15, hidden))
+        )
+        self.assertFalse(
+            self.action_validator.is_legal(AttackAction(bishop, 15, friend))
+        )
+        self.assertFalse(
+            self.action_validator.is_legal(AttackAction(bishop, 99, enemy))
+        )
+
+    def test_is_legal_matches_enumeration(self):
+        queen = Queen()
+        self.board.place_piece(queen, (3, 3))
+        self.board.place_piece(Pawn(side=Side.BLACK), (3, 6))
+        self.board.place_piece(Knight(), (5, 5))
+
+        valid_moves = self.action_validator.get_valid_moves(queen)
+        for row in range(8):
+            for col in range(8):
+                move = MoveAction(queen, (row, col))
+                self.assertEqual(
+                    self.action_validator.is_legal(move),
+                    move in valid_moves
+                )
+
+    def test_generate_all(self):
+        pieces = [
+            (Rook(), (0, 0)),
+            (Knight(), (0, 1)),
+            (Pawn(), (1, 3)),
+            (Queen(side=Side.BLACK), (5, 0)),
+            (Pawn(side=Side.BLACK), (2, 2)),
+        ]
+        for piece, position in pieces:
+            self.board.place_piece(piece, position)
+
+        for side in Side:
+            expected = []
+            for piece, _ in pieces:
+                if piece.side != side:
+                    continue
+                expected += self.action_validator.iter_moves(piece)
+                expected += self.action_validator.iter_attacks(piece)
+            self.assertEqual(
+                sorted(self.action_validator.generate_all(side)),
+                sorted(expected)
+            )
+
+
+class TestAttackRules(unittest.TestCase):
+    """
+    Attack rules: a piece attacks along its attack directions up to its
+    attack range, the first piece on a ray blocks it, only enemies can be
+    attacked, and pawns move and attack toward the enemy's side.
+    """
+    def setUp(self):
+        self.board = Board(8, 8)
+        self.action_validator = ActionValidator(self.board)
+
+    def test_pawn_moves(self):
+        white = Pawn()
+        black = Pawn(side=Side.BLACK)
+        self.board.place_piece(white, (1, 1))
+        self.board.place_piece(black, (6, 6))
+
+        self.assertEqual(
+            self.action_validator.get_valid_moves(white),
+            [MoveAction(white, (2, 1))]
+        )
+        self.assertEqual(
+            self.action_validator.get_valid_moves(black),
+            [MoveAction(black, (5, 6))]
+        )
+
+    def test_attacks(self):
+        rook = Rook()
+        enemy = Pawn(side=Side.BLACK)
+        hidden = Pawn(side=Side.BLACK)
+        friend = Pawn()
+        self.board.place_piece(rook, (4, 4))
+        self.board.place_piece(enemy, (4, 6))
+        self.board.place_piece(hidden, (4, 7))
+        self.board.place_piece(friend, (2, 4))
+
+        valid_attacks = self.action_validator.get_valid_attacks(rook)
+        self.assertEqual(valid_attacks, [AttackAction(rook, 25, enemy)])
+
+    def test_pawn_attacks(self):
+        pawn = Pawn()
+        left = Knight(side=Side.BLACK)
+        right = Knight(side=Side.BLACK)
+        behind = Knight(side=Side.BLACK)
+        self.board.place_piece(pawn, (3, 3))
+        self.board.place_piece(left, (4, 2))
+        self.board.place_piece(right, (4, 4))
+        self.board.place_piece(behind, (2, 4))
+
+        valid_attacks = self.action_validator.get_valid_attacks(pawn)
+        self.assertEqual(len(valid_attacks), 2)
+        self.assertIn(AttackAction(pawn, 5, left), valid_attacks)
+        self.assertIn(AttackAction(pawn, 5, right), valid_attacks)
+
+    def test_rook_attacks_every_direction(self):
+        rook = Rook()
+        self.board.place_piece(rook, (4, 4))
+        enemies = [Pawn(side=Side.BLACK) for _ in range(4)]
+        for enemy, position in zip(
+            enemies, [(4, 0), (4, 7), (0, 4), (7, 4)]
+        ):
+            self.board.place_piece(enemy, position)
+
+        valid_attacks = self.action_validator.get_valid_attacks(rook)
+        self.assertEqual(len(valid_attacks), 4)
+        for enemy in enemies:
+            self.assertIn(AttackAction(rook, 25, enemy), valid_attacks)
+
+    def test_friendly_piece_blocks(self):
+        bishop = Bishop()
+        friend = Pawn()
+        enemy = Pawn(side=Side.BLACK)
+        self.board.place_piece(bishop, (0, 0))
+        self.board.place_piece(friend, (2, 2))
+        self.board.place_piece(enemy, (4, 4))
+
+        self.assertEqual(self.action_validator.get_valid_attacks(bishop), [])
+        self.assertFalse(
+            self.action_validator.is_legal(AttackAction(bishop, 15, enemy))
+        )
+
+    def test_no_friendly_fire(self):
+        king = King()
+        self.board.place_piece(king, (0, 4))
+        for position in [(0, 3), (0, 5), (1, 3), (1, 4), (1, 5)]:
+            self.board.place_piece(Pawn(), position)
+
+        self.assertEqual(self.action_validator.get_valid_attacks(king), [])
+        for side in Side:
+            attacks = [
+                self.action_validator.to_action(packed)
+                for packed in self.action_validator.generate_all(side)
+            ]
+            for attack in attacks:
+                if isinstance(attack, AttackAction):
+                    self.assertNotEqual(attack.target.side, side)
+
+    def test_black_pawn_attacks(self):
+        pawn = Pawn(side=Side.BLACK)
+        left = Knight()
+        right = Knight()
+        behind = Knight()
+        self.board.place_piece(pawn, (4, 3))
+        self.board.place_piece(left, (3, 2))
+        self.board.place_piece(right, (3, 4))
+        self.board.place_piece(behind, (5, 4))
+
+        valid_attacks = self.action_validator.get_valid_attacks(pawn)
+        self.assertEqual(len(valid_attacks), 2)
+        self.assertIn(AttackAction(pawn, 5, left), valid_attacks)
+        self.assertIn(AttackAction(pawn, 5, right), valid_attacks)
+        self.assertFalse(
+            self.action_validator.is_legal(AttackAction(pawn, 5, behind))
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
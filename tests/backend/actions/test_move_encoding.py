@@ -0,0 +1,25 @@
+import unittest
+
+from src.backend.actions.move_encoding import (
+    ATTACK, MOVE, decode_move, encode_move, move_from, move_kind, move_to
+)
+
+
+class TestMoveEncoding(unittest.TestCase):
+    def test_round_trip(self):
+        packed = encode_move(12, 63, ATTACK)
+        self.assertEqual(decode_move(packed), (12, 63, ATTACK))
+        self.assertEqual(move_from(packed), 12)
+        self.assertEqual(move_to(packed), 63)
+        self.assertEqual(move_kind(packed), ATTACK)
+
+    def test_default_kind(self):
+        self.assertEqual(move_kind(encode_move(0, 1)), MOVE)
+
+    def test_large_board(self):
+        packed = encode_move(65535, 40000, MOVE)
+        self.assertEqual(decode_move(packed), (65535, 40000, MOVE))
+
+
+if __name__ == "__main__":
+    unittest.main()
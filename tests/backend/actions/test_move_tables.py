@@ -0,0 +1,37 @@
+import unittest
+
+from src.backend.actions.move_tables import get_move_tables
+from src.backend.entities.pieces import Knight, Pawn, Rook
+from src.backend.foundations.types import Side
+
+
+class TestMoveTables(unittest.TestCase):
+    def test_shared_per_size(self):
+        self.assertIs(get_move_tables(8, 8), get_move_tables(8, 8))
+        self.assertIsNot(get_move_tables(8, 8), get_move_tables(10, 10))
+        tables = get_move_tables(8, 8)
+        self.assertIs(tables.get(Rook()), tables.get(Rook()))
+
+    def test_rays_clipped(self):
+        table = get_move_tables(8, 8).get(Rook())
+        # Corner rook only has two rays of seven squares
+        rays = table.move_rays[0]
+        self.assertEqual(len(rays), 2)
+        self.assertEqual(sorted(len(ray) for ray in rays), [7, 7])
+        self.assertIn((1, 2, 3, 4, 5, 6, 7), rays)
+
+    def test_jumps(self):
+        table = get_move_tables(8, 8).get(Knight())
+        targets = sorted(ray[0] for ray in table.move_rays[0])
+        self.assertEqual(targets, [10, 17])
+
+    def test_side(self):
+        tables = get_move_tables(8, 8)
+        white = tables.get(Pawn())
+        black = tables.get(Pawn(side=Side.BLACK))
+        self.assertEqual(white.move_rays[9], ((17,),))
+        self.assertEqual(black.move_rays[9], ((1,),))
+
+
+if __name__ == "__main__":
+    unittest.main()
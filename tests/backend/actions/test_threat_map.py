@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from src.backend.actions import ThreatMap
+from src.backend.board import Board
+from src.backend.entities.pieces import (
+    Bishop, King, Knight, Pawn, Queen, Rook
+)
+from src.backend.foundations.types import Side
+
+
+class TestThreatMap(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(8, 8)
+
+    def assertMatchesFresh(self, threat_map: ThreatMap):
+        fresh = ThreatMap(self.board)
+        fresh.close()
+        for side in Side:
+            self.assertEqual(
+                threat_map.get_counts(side),
+                fresh.get_counts(side)
+            )
+
+    def test_attacked(self):
+        rook = Rook(side=Side.BLACK)
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(Pawn(), (0, 4))
+        threat_map = ThreatMap(self.board)
+
+        self.assertTrue(threat_map.is_attacked((0, 3), Side.BLACK))
+        # Blocker is attacked, squares behind it are not
+        self.assertTrue(threat_map.is_attacked((0, 4), Side.BLACK))
+        self.assertFalse(threat_map.is_attacked((0, 5), Side.BLACK))
+        self.assertFalse(threat_map.is_attacked((0, 3), Side.WHITE))
+        self.assertEqual(
+            threat_map.get_attackers((7, 0), Side.BLACK),
+            [rook]
+        )
+
+    def test_incremental_move(self):
+        rook = Rook(side=Side.BLACK)
+        pawn = Pawn()
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(pawn, (0, 4))
+        threat_map = ThreatMap(self.board)
+
+        # Moving the blocker opens the rook's ray
+        self.board.move_piece(pawn, (1, 4))
+        self.assertTrue(threat_map.is_attacked((0, 7), Side.BLACK))
+        self.assertEqual(threat_map.get_attack_count((2, 3), Side.WHITE), 1)
+        self.assertMatchesFresh(threat_map)
+
+        self.board.remove_piece(rook)
+        self.assertFalse(threat_map.is_attacked((0, 7), Side.BLACK))
+        self.assertMatchesFresh(threat_map)
+
+    def test_random_sequence(self):
+        rng = random.Random(7)
+        types = [Bishop, King, Knight, Pawn, Queen, Rook]
+        pieces = []
+        squares = rng.sample([(r, c) for r in range(8) for c in range(8)], 16)
+        for position in squares:
+            piece = rng.choice(types)(side=rng.choice(list(Side)))
+            self.board.place_piece(piece, position)
+            pieces.append(piece)
+        threat_map = ThreatMap(self.board)
+
+        for _ in range(200):
+            piece = rng.choice(pieces)
+            op = rng.random()
+            if not self.board.contains_piece(piece):
+                position = (rng.randrange(8), rng.randrange(8))
+                if self.board.get_piece_at(position) is None:
+                    self.board.place_piece(piece, position)
+            elif op < 0.6:
+                position = (rng.randrange(8), rng.randrange(8))
+                if self.board.get_piece_at(position) is None:
+                    self.board.move_piece(piece, position)
+            elif op < 0.8:
+                other = rng.choice(pieces)
+                if other is not piece and self.board.contains_piece(other):
+                    self.board.swap_piece(piece, other)
+            else:
+                self.board.remove_piece(piece)
+            self.assertMatchesFresh(threat_map)
+
+
+if __name__ == "__main__":
+    unittest.main()
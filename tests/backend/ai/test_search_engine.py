@@ -0,0 +1,102 @@
+import time
+import unittest
+
+from src.backend.actions import AttackAction, MoveAction
+from src.backend.ai import SearchEngine
+from src.backend.ai.search_engine import MATE_SCORE, evaluate
+from src.backend.board import Board
+from src.backend.entities.pieces import King, Pawn, Queen, Rook
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+
+
+class TestSearchEngine(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(8, 8)
+        self.engine = SearchEngine(time_budget=0.2, max_depth=4)
+
+    def test_finishes_king(self):
+        queen = Queen()
+        king = King(side=Side.BLACK)
+        self.board.place_piece(queen, (0, 0))
+        self.board.place_piece(King(), (0, 7))
+        self.board.place_piece(king, (5, 5))
+        self.board.place_piece(Pawn(side=Side.BLACK), (3, 0))
+        king.hp = 40
+
+        result = self.engine.search(self.board, Side.WHITE)
+        self.assertEqual(result.action, AttackAction(queen, 45, king))
+        self.assertGreater(result.score, 0)
+
+    def test_attacks_weak_piece(self):
+        rook = Rook()
+        weak = Pawn(side=Side.BLACK)
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(King(), (7, 7))
+        self.board.place_piece(King(side=Side.BLACK), (7, 3))
+        self.board.place_piece(weak, (0, 4))
+
+        result = self.engine.search(self.board, Side.WHITE)
+        self.assertEqual(result.action, AttackAction(rook, 25, weak))
+
+    def test_board_unchanged(self):
+        board = create_standard_board()
+        start = board.get_hash()
+        positions = {
+            piece.id: board.get_piece_position(piece)
+            for piece in board.get_slots() if piece is not None
+        }
+
+        result = self.engine.search(board, Side.WHITE)
+        self.assertIsInstance(result.action, MoveAction)
+        self.assertEqual(result.action.actor.side, Side.WHITE)
+        self.assertTrue(board.contains_piece(result.action.actor))
+        self.assertEqual(board.get_hash(), start)
+        for piece in board.get_slots():
+            if piece is not None:
+                self.assertEqual(
+                    board.get_piece_position(piece),
+                    positions[piece.id]
+                )
+                self.assertEqual(piece.hp, piece.get_max_hp())
+
+    def test_time_budget(self):
+        engine = SearchEngine(time_budget=0.05, max_depth=64)
+        board = create_standard_board()
+
+        start = time.perf_counter()
+        result = engine.search(board, Side.BLACK)
+        # Generous bound for busy machines; without the deadline this
+        # search would run for much longer
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertLess(result.depth, engine.max_depth)
+        self.assertIsNotNone(result.action)
+        self.assertGreaterEqual(result.depth, 1)
+
+    def test_mate_score_stable_across_searches(self):
+        queen = Queen()
+        king = King(side=Side.BLACK)
+        self.board.place_piece(queen, (0, 0))
+        self.board.place_piece(King(), (0, 7))
+        self.board.place_piece(king, (5, 5))
+        king.hp = 40
+
+        first = self.engine.search(self.board, Side.WHITE)
+        # The table now holds entries from the first search
+        second = self.engine.search(self.board, Side.WHITE)
+        self.assertEqual(first.score, MATE_SCORE - 1)
+        self.assertEqual(second.score, first.score)
+
+    def test_no_actions(self):
+        result = self.engine.search(self.board, Side.WHITE)
+        self.assertIsNone(result.action)
+
+        # A side with no actions gets its evaluation, not -INFINITY
+        self.board.place_piece(King(side=Side.BLACK), (7, 7))
+        result = self.engine.search(self.board, Side.WHITE)
+        self.assertIsNone(result.action)
+        self.assertEqual(result.score, evaluate(self.board, Side.WHITE))
+
+
+if __name__ == "__main__":
+    unittest.main()
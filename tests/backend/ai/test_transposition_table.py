@@ -0,0 +1,40 @@
+import unittest
+
+from src.backend.ai import TranspositionTable
+from src.backend.ai.transposition_table import EXACT, LOWER
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(16)
+
+    def test_size(self):
+        self.assertEqual(len(self.table), 16)
+        self.assertEqual(len(TranspositionTable(20)), 32)
+
+    def test_store_probe(self):
+        self.table.store(0x1234, 3, 50, EXACT, 7)
+        entry = self.table.probe(0x1234)
+        self.assertEqual((entry.depth, entry.score, entry.move), (3, 50, 7))
+        # Same slot, different key
+        self.assertIsNone(self.table.probe(0x1234 + 16))
+
+    def test_depth_preferred(self):
+        self.table.store(1, 5, 10, EXACT, 1)
+        self.table.store(17, 2, 20, LOWER, 2)
+        self.assertIsNotNone(self.table.probe(1))
+        self.assertIsNone(self.table.probe(17))
+
+        self.table.store(17, 6, 20, LOWER, 2)
+        self.assertIsNotNone(self.table.probe(17))
+
+    def test_aging(self):
+        self.table.store(1, 5, 10, EXACT, 1)
+        self.table.new_search()
+        self.table.store(17, 1, 20, LOWER, 2)
+        self.assertIsNone(self.table.probe(1))
+        self.assertIsNotNone(self.table.probe(17))
+
+
+if __name__ == "__main__":
+    unittest.main()
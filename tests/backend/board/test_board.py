@@ -1,7 +1,11 @@
+import copy
 import unittest
 
-from src.backend.board import Board
+from src.backend.actions import AttackAction, MoveAction
+from src.backend.board import Board, ChangeKind
 from src.backend.entities import Entity
+from src.backend.entities.pieces import Knight, Pawn, Rook
+from src.backend.foundations.types import Side
 
 
 class TestBoard(unittest.TestCase):
@@ -89,6 +93,234 @@ class TestBoard(unittest.TestCase):
         self.board.swap_piece(first, second)
         self.assertEqual(self.board.get_piece_position(first), (1, 1))
         self.assertEqual(self.board.get_piece_position(second), (0, 0))
+        self.assertEqual(self.board.get_piece_at((0, 0)), second)
+        self.assertEqual(self.board.get_piece_at((1, 1)), first)
+
+    def test_index_conversion(self):
+        self.assertEqual(self.board.to_index((0, 0)), 0)
+        self.assertEqual(self.board.to_index((2, 3)), 19)
+        self.assertEqual(self.board.to_position(19), (2, 3))
+        with self.assertRaises(IndexError):
+            self.board.to_index((8, 0))
+
+    def test_occupancy(self):
+        self.board.place_piece(self.entity, (2, 3))
+        self.assertTrue(self.board.is_occupied(19))
+        self.assertEqual(self.board.get_piece_index(self.entity), 19)
+        self.assertEqual(self.board.get_piece_at_index(19), self.entity)
+
+        self.board.move_piece(self.entity, (3, 3))
+        self.assertFalse(self.board.is_occupied(19))
+        self.assertIsNone(self.board.get_piece_at_index(19))
+        self.assertTrue(self.board.is_occupied(27))
+
+        self.board.remove_piece(self.entity)
+        self.assertFalse(self.board.is_occupied(27))
+
+    def test_get_piece_at_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            self.board.get_piece_at((-1, 0))
+
+    def test_hash_empty(self):
+        self.assertEqual(self.board.get_hash(), 0)
+
+    def test_hash_incremental(self):
+        rook = Rook()
+        knight = Knight(side=Side.BLACK)
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(knight, (7, 6))
+        self.assertEqual(self.board.get_hash(), self.board.compute_hash())
+
+        self.board.move_piece(rook, (0, 5))
+        self.assertEqual(self.board.get_hash(), self.board.compute_hash())
+
+        self.board.swap_piece(rook, knight)
+        self.assertEqual(self.board.get_hash(), self.board.compute_hash())
+
+        self.board.remove_piece(knight)
+        self.assertEqual(self.board.get_hash(), self.board.compute_hash())
+
+    def test_hash_same_position(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+        start = self.board.get_hash()
+
+        self.board.move_piece(rook, (0, 5))
+        self.assertNotEqual(self.board.get_hash(), start)
+        self.board.move_piece(rook, (0, 0))
+        self.assertEqual(self.board.get_hash(), start)
+
+        other = Board(rows=8, cols=8)
+        other.place_piece(Rook(), (0, 0))
+        self.assertEqual(other.get_hash(), start)
+
+    def test_hash_side(self):
+        white = Board(rows=8, cols=8)
+        white.place_piece(Pawn(side=Side.WHITE), (1, 1))
+        black = Board(rows=8, cols=8)
+        black.place_piece(Pawn(side=Side.BLACK), (1, 1))
+        self.assertNotEqual(white.get_hash(), black.get_hash())
+
+    def test_hash_hp_bucket(self):
+        board = Board(rows=8, cols=8, hp_bucket_size=10)
+        rook = Rook()
+        board.place_piece(rook, (0, 0))
+        start = board.get_hash()
+
+        board.damage_piece(rook, 5)
+        damaged = board.get_hash()
+        self.assertNotEqual(damaged, start)
+        self.assertEqual(damaged, board.compute_hash())
+
+        # Same hp bucket, same hash
+        board.damage_piece(rook, 4)
+        self.assertEqual(board.get_hash(), damaged)
+
+    def test_make_unmake_move(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+        start = self.board.get_hash()
+
+        self.board.make(MoveAction(rook, (0, 5)))
+        self.assertEqual(self.board.get_piece_position(rook), (0, 5))
+        self.assertEqual(self.board.get_undo_depth(), 1)
+
+        self.board.unmake()
+        self.assertEqual(self.board.get_piece_position(rook), (0, 0))
+        self.assertIsNone(self.board.get_piece_at((0, 5)))
+        self.assertEqual(self.board.get_hash(), start)
+        self.assertEqual(self.board.get_undo_depth(), 0)
+
+    def test_make_unmake_attack(self):
+        board = Board(rows=8, cols=8, hp_bucket_size=10)
+        rook = Rook()
+        pawn = Pawn(side=Side.BLACK)
+        board.place_piece(rook, (0, 0))
+        board.place_piece(pawn, (0, 3))
+        start = board.get_hash()
+
+        board.make(AttackAction(pawn, 5, rook))
+        self.assertEqual(rook.hp, 45)
+        self.assertNotEqual(board.get_hash(), start)
+
+        board.unmake()
+        self.assertEqual(rook.hp, 50)
+        self.assertEqual(board.get_hash(), start)
+
+    def test_make_unmake_capture(self):
+        rook = Rook()
+        pawn = Pawn(side=Side.BLACK)
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(pawn, (0, 3))
+        start = self.board.get_hash()
+
+        self.board.make(AttackAction(rook, 25, pawn))
+        self.assertFalse(self.board.contains_piece(pawn))
+        self.assertIsNone(self.board.get_piece_at((0, 3)))
+
+        self.board.unmake()
+        self.assertEqual(pawn.hp, 10)
+        self.assertEqual(self.board.get_piece_position(pawn), (0, 3))
+        self.assertEqual(self.board.get_piece_at((0, 3)), pawn)
+        self.assertEqual(self.board.get_hash(), start)
+
+    def test_unmake_empty(self):
+        with self.assertRaises(IndexError):
+            self.board.unmake()
+
+    def test_rollback_commit(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+        self.board.make_move(rook, (0, 5))
+        self.board.make_move(rook, (3, 5))
+        self.board.make_move(rook, (3, 1))
+
+        self.board.rollback(1)
+        self.assertEqual(self.board.get_piece_position(rook), (0, 5))
+        self.board.commit(0)
+        self.assertEqual(self.board.get_undo_depth(), 0)
+        self.assertEqual(self.board.get_piece_position(rook), (0, 5))
+
+    def test_listeners(self):
+        changes = []
+        self.board.add_listener(changes.append)
+        other = Entity("other")
+
+        self.board.place_piece(self.entity, (0, 0))
+        self.board.place_piece(other, (0, 1))
+        self.board.move_piece(self.entity, (1, 0))
+        self.board.swap_piece(self.entity, other)
+        self.board.remove_piece(other)
+        self.assertEqual(
+            [(change.kind, change.squares) for change in changes],
+            [
+                (ChangeKind.PLACE, (0,)),
+                (ChangeKind.PLACE, (1,)),
+                (ChangeKind.MOVE, (0, 8)),
+                (ChangeKind.SWAP, (8, 1)),
+                (ChangeKind.REMOVE, (8,)),
+            ]
+        )
+
+        self.board.remove_listener(changes.append)
+        self.board.remove_piece(self.entity)
+        self.assertEqual(len(changes), 5)
+
+    def test_hp_listeners(self):
+        changes = []
+        rook = Rook()
+        self.board.place_piece(rook, (0, 2))
+        self.board.add_listener(changes.append)
+
+        self.board.make_attack(rook, 5)
+        self.board.unmake()
+        self.board.damage_piece(rook, rook.hp)
+        self.assertEqual(
+            [(change.kind, change.squares) for change in changes],
+            [
+                (ChangeKind.HP, (2,)),
+                (ChangeKind.HP, (2,)),
+                (ChangeKind.REMOVE, (2,)),
+            ]
+        )
+
+    def test_clone(self):
+        rook = Rook()
+        pawn = Pawn(side=Side.BLACK)
+        self.board.place_piece(rook, (0, 0))
+        self.board.place_piece(pawn, (0, 3))
+
+        clone = self.board.clone()
+        self.assertEqual(clone.get_hash(), self.board.get_hash())
+        clone_rook = clone.get_piece_at((0, 0))
+        self.assertEqual(clone_rook, rook)
+        self.assertIsNot(clone_rook, rook)
+
+        # Mutating the clone leaves the original untouched
+        clone.damage_piece(clone_rook, 10)
+        clone.move_piece(clone_rook, (5, 0))
+        self.assertEqual(rook.hp, 50)
+        self.assertEqual(self.board.get_piece_position(rook), (0, 0))
+        self.assertEqual(clone.get_hash(), clone.compute_hash())
+
+    def test_clone_new_ids(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+
+        clone = self.board.clone(keep_ids=False)
+        clone_rook = clone.get_piece_at((0, 0))
+        self.assertNotEqual(clone_rook, rook)
+        self.assertEqual(clone.get_piece_position(clone_rook), (0, 0))
+        self.assertFalse(clone.contains_piece(rook))
+
+    def test_deep_copy(self):
+        rook = Rook()
+        self.board.place_piece(rook, (0, 0))
+
+        board_deep = copy.deepcopy(self.board)
+        rook_deep = board_deep.get_piece_at((0, 0))
+        self.assertNotEqual(rook_deep, rook)
+        self.assertEqual(board_deep.get_piece_position(rook_deep), (0, 0))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+import unittest
+
+from src.backend.board import Board, decode_board, encode_board
+from src.backend.entities.pieces import King, Knight, Pawn
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+
+
+class TestCodec(unittest.TestCase):
+    def test_round_trip(self):
+        board = create_standard_board(hp_bucket_size=10)
+        piece = board.get_piece_at((1, 3))
+        board.damage_piece(piece, 4)
+
+        decoded = decode_board(encode_board(board))
+        self.assertEqual(decoded.get_size(), board.get_size())
+        self.assertEqual(decoded.get_hp_bucket_size(), 10)
+        self.assertEqual(decoded.get_hash(), board.get_hash())
+        for original, copy in zip(board.get_slots(), decoded.get_slots()):
+            if original is None:
+                self.assertIsNone(copy)
+                continue
+            self.assertIsNot(copy, original)
+            self.assertIs(type(copy), type(original))
+            self.assertEqual(copy.id, original.id)
+            self.assertEqual(copy.side, original.side)
+            self.assertEqual(copy.hp, original.hp)
+
+    def test_string_ids(self):
+        board = Board(4, 6)
+        board.place_piece(King(id="white-king"), (0, 0))
+        board.place_piece(Knight(id="bk", side=Side.BLACK), (3, 5))
+
+        decoded = decode_board(encode_board(board))
+        self.assertEqual(decoded.get_piece_at((0, 0)).id, "white-king")
+        knight = decoded.get_piece_at((3, 5))
+        self.assertEqual(knight.id, "bk")
+        self.assertEqual(knight.side, Side.BLACK)
+
+    def test_new_ids(self):
+        board = Board(8, 8)
+        pawn = Pawn()
+        board.place_piece(pawn, (1, 1))
+        decoded = decode_board(encode_board(board), keep_ids=False)
+        self.assertNotEqual(decoded.get_piece_at((1, 1)).id, pawn.id)
+
+    def test_compact(self):
+        # A fixed-width record per piece on top of a small header
+        board = create_standard_board()
+        self.assertLess(len(encode_board(board)), 32 * 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
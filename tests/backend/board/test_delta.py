@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from src.backend.actions import ActionValidator, AttackAction, MoveAction
+from src.backend.board import (
+    Board, ChangeKind, DeltaRecorder, apply_delta, decode_board,
+    encode_board, get_delta_tick
+)
+from src.backend.entities.pieces import Knight, Pawn, Rook
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+
+
+class TestDelta(unittest.TestCase):
+    def setUp(self):
+        self.board = create_standard_board(hp_bucket_size=5)
+        self.mirror = decode_board(encode_board(self.board))
+        self.recorder = DeltaRecorder(self.board)
+
+    def tearDown(self):
+        self.recorder.close()
+
+    def sync(self):
+        delta = self.recorder.flush()
+        if delta is not None:
+            apply_delta(self.mirror, delta)
+        self.assertEqual(
+            encode_board(self.mirror), encode_board(self.board)
+        )
+        self.assertEqual(self.mirror.get_hash(), self.board.get_hash())
+        return delta
+
+    def test_no_changes(self):
+        self.assertIsNone(self.recorder.flush())
+        self.assertFalse(self.recorder.has_changes())
+
+    def test_coalesces_tick(self):
+        pawn = self.board.get_piece_at((1, 0))
+        self.board.move_piece(pawn, (2, 0))
+        self.board.move_piece(pawn, (3, 0))
+        self.board.move_piece(pawn, (4, 0))
+        delta = self.sync()
+        self.assertEqual(get_delta_tick(delta), 1)
+        # Three squares touched, far smaller than the whole board
+        self.assertLess(len(delta) * 4, len(encode_board(self.board)))
+
+    def test_mirror_keeps_pieces(self):
+        knight = self.mirror.get_piece_at((0, 1))
+        MoveAction(self.board.get_piece_at((0, 1)), (2, 2)).execute(
+            self.board
+        )
+        self.sync()
+        self.assertIs(self.mirror.get_piece_at((2, 2)), knight)
+
+        changes = []
+        self.mirror.add_listener(changes.append)
+        target = self.board.get_piece_at((6, 3))
+        self.board.move_piece(target, (3, 3))
+        self.sync()
+        changes.clear()
+        AttackAction(knight, 5, target).execute(self.board)
+        self.sync()
+        # An hp change arrives as an hp change
+        self.assertEqual([change.kind for change in changes], [ChangeKind.HP])
+
+    def test_swap_and_capture(self):
+        first = self.board.get_piece_at((0, 0))
+        second = self.board.get_piece_at((0, 7))
+        self.board.swap_piece(first, second)
+        victim = self.board.get_piece_at((6, 4))
+        self.board.damage_piece(victim, victim.hp)
+        self.board.place_piece(Knight(side=Side.BLACK), (4, 4))
+        self.sync()
+
+    def test_random_games(self):
+        rng = random.Random(5)
+        validator = ActionValidator(self.board)
+        side = Side.WHITE
+        for tick in range(1, 80):
+            # A few actions per tick
+            for _ in range(rng.randint(0, 3)):
+                moves = validator.generate_all(side)
+                if not moves:
+                    return
+                validator.to_action(rng.choice(moves)).execute(self.board)
+                side = side.opponent
+            self.sync()
+
+    def test_small_board(self):
+        board = Board(3, 3)
+        mirror = Board(3, 3)
+        recorder = DeltaRecorder(board)
+        rook = Rook(id="r")
+        board.place_piece(rook, (0, 0))
+        board.place_piece(Pawn(side=Side.BLACK), (2, 2))
+        apply_delta(mirror, recorder.flush())
+        board.remove_piece(rook)
+        apply_delta(mirror, recorder.flush())
+        self.assertEqual(encode_board(mirror), encode_board(board))
+        recorder.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import unittest
+
+from src.backend.actions import (
+    ActionValidator, AttackAction, MoveAction
+)
+from src.backend.board import Board
+from src.backend.diagnostics import Instrumentation
+from src.backend.entities.pieces import Pawn, Rook
+from src.backend.foundations.types import Side
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+        self.board = Board(8, 8)
+        self.rook = Rook()
+        self.pawn = Pawn(side=Side.BLACK)
+        self.board.place_piece(self.rook, (0, 0))
+        self.board.place_piece(self.pawn, (5, 0))
+
+    def tearDown(self):
+        self.instrumentation.disable()
+
+    def test_disabled_leaves_methods_untouched(self):
+        move_piece = Board.__dict__["move_piece"]
+        self.instrumentation.enable()
+        self.assertIsNot(Board.__dict__["move_piece"], move_piece)
+        self.instrumentation.disable()
+        self.assertIs(Board.__dict__["move_piece"], move_piece)
+        self.assertNotIn("execute", Pawn.__dict__)
+
+    def test_records_calls(self):
+        self.instrumentation.enable()
+        validator = ActionValidator(self.board)
+        validator.get_valid_moves(self.rook)
+        validator.get_valid_attacks(self.rook)
+        MoveAction(self.rook, (1, 0)).execute(self.board)
+        AttackAction(self.rook, 10, self.pawn).execute(self.board)
+        self.instrumentation.disable()
+        # Not recorded once disabled
+        self.board.move_piece(self.rook, (2, 0))
+
+        snapshot = self.instrumentation.snapshot()
+        self.assertEqual(
+            snapshot["ActionValidator.get_valid_moves"]["calls"], 1
+        )
+        self.assertEqual(snapshot["MoveAction.execute"]["calls"], 1)
+        self.assertEqual(snapshot["AttackAction.execute"]["calls"], 1)
+        self.assertEqual(snapshot["Board.move_piece"]["calls"], 1)
+        self.assertEqual(snapshot["Board.damage_piece"]["calls"], 1)
+        self.assertNotIn("Board.swap_piece", snapshot)
+        self.assertGreater(snapshot["MoveAction.execute"]["seconds"], 0)
+
+    def test_one_instrumentation_at_a_time(self):
+        move_piece = Board.__dict__["move_piece"]
+        other = Instrumentation([(Board, "move_piece")])
+        self.instrumentation.enable()
+        with self.assertRaises(RuntimeError):
+            other.enable()
+        self.assertFalse(other.is_enabled())
+
+        self.instrumentation.disable()
+        other.enable()
+        other.disable()
+        self.assertIs(Board.__dict__["move_piece"], move_piece)
+
+    def test_inherited_methods_skipped(self):
+        class Step(MoveAction):
+            pass
+
+        instrumentation = Instrumentation(
+            [(MoveAction, "execute"), (Step, "execute")]
+        )
+        instrumentation.enable()
+        Step(self.rook, (1, 0)).execute(self.board)
+        instrumentation.disable()
+
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(list(snapshot), ["MoveAction.execute"])
+        self.assertEqual(snapshot["MoveAction.execute"]["calls"], 1)
+        self.assertNotIn("execute", Step.__dict__)
+
+    def test_reset(self):
+        self.instrumentation.enable()
+        self.board.move_piece(self.rook, (1, 0))
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.snapshot(), {})
+
+    def test_exports(self):
+        self.instrumentation.enable()
+        self.board.move_piece(self.rook, (1, 0))
+        self.board.move_piece(self.rook, (2, 0))
+
+        exported = json.loads(self.instrumentation.to_json())
+        self.assertEqual(exported["Board.move_piece"]["calls"], 2)
+        text = self.instrumentation.to_prometheus()
+        self.assertIn("# TYPE chess_rpg_calls_total counter", text)
+        self.assertIn("# TYPE chess_rpg_allocated_blocks gauge", text)
+        self.assertIn(
+            'chess_rpg_calls_total{method="Board.move_piece"} 2', text
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.backend.entities.pieces import (
+    ARCHETYPES, Bishop, King, Pawn, Queen, load_archetypes
+)
+from src.backend.foundations.types import Side
+
+
+class TestArchetype(unittest.TestCase):
+    def test_stats(self):
+        queen = Queen()
+        self.assertEqual(queen.name, "Queen")
+        self.assertEqual(queen.hp, 90)
+        self.assertEqual(queen.get_max_hp(), 90)
+        self.assertEqual(queen.get_damage(), 45)
+        self.assertEqual(King().hp, 100)
+        self.assertEqual(Bishop().get_damage(), 15)
+
+    def test_shared(self):
+        first = Queen()
+        second = Queen()
+        self.assertIs(first.archetype, ARCHETYPES["Queen"])
+        self.assertIs(
+            first.get_move_directions(),
+            second.get_move_directions()
+        )
+
+    def test_instance_hp(self):
+        first = Queen()
+        second = Queen()
+        first.take_damage(10)
+        self.assertEqual(first.hp, 80)
+        self.assertEqual(second.hp, 90)
+        self.assertEqual(ARCHETYPES["Queen"].hp, 90)
+
+    def test_oriented(self):
+        self.assertEqual(list(Pawn().get_move_directions()), [(0, 1)])
+        self.assertEqual(
+            list(Pawn(side=Side.BLACK).get_move_directions()),
+            [(0, -1)]
+        )
+        self.assertEqual(
+            list(Pawn(side=Side.BLACK).get_attack_directions()),
+            [(1, -1), (-1, -1)]
+        )
+
+    def test_load_custom_table(self):
+        table = {
+            "Pawn": {
+                "hp": 12,
+                "damage": 6,
+                "move_range": 2,
+                "move_directions": [[0, 1]],
+                "attack_range": 1,
+                "attack_directions": [[1, 1]],
+                "oriented": True,
+            }
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pieces.json")
+            with open(path, "w") as file:
+                json.dump(table, file)
+            archetypes = load_archetypes(path)
+
+        pawn = archetypes["Pawn"]
+        self.assertEqual((pawn.hp, pawn.damage, pawn.move_range), (12, 6, 2))
+        self.assertEqual(pawn.move_directions[Side.BLACK], ((0, -1),))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@ import copy
 import unittest
 
 from src.backend.entities import Entity
+from src.backend.entities.pieces import Rook
+from src.backend.foundations.types import Side
 
 
 class TestEntity(unittest.TestCase):
@@ -28,6 +30,53 @@ class TestEntity(unittest.TestCase):
         entity = Entity("test", "id")
         self.assertEqual(str(entity), "<Entity name='test', id='id'>")
 
+    def test_integer_ids(self):
+        first = Entity("first")
+        second = Entity("second")
+        self.assertIsInstance(first.id, int)
+        self.assertNotEqual(first.id, second.id)
+
+    def test_loaded_ids_reserved(self):
+        loaded = Entity("loaded", Entity("latest").id + 1000)
+        ids = {Entity(f"new{n}").id for n in range(2000)}
+        self.assertNotIn(loaded.id, ids)
+        self.assertGreater(min(ids), loaded.id)
+
+    def test_string_id(self):
+        entity = Entity("test", "5f1c0c2a")
+        self.assertEqual(entity.id, "5f1c0c2a")
+        self.assertEqual(entity, Entity("other", "5f1c0c2a"))
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.entity, "__dict__"))
+        self.assertFalse(hasattr(Rook(), "__dict__"))
+
+    def test_piece_copy(self):
+        rook = Rook(side=Side.BLACK)
+        rook.take_damage(10)
+
+        rook_copy = copy.copy(rook)
+        self.assertEqual(rook_copy.id, rook.id)
+        self.assertEqual(rook_copy.hp, 40)
+        self.assertEqual(rook_copy.side, Side.BLACK)
+
+        rook_deep = copy.deepcopy(rook)
+        self.assertNotEqual(rook_deep.id, rook.id)
+        self.assertEqual(rook_deep.hp, 40)
+        self.assertEqual(rook_deep.side, Side.BLACK)
+
+    def test_clone(self):
+        rook = Rook(side=Side.BLACK)
+        rook.take_damage(5)
+
+        rook_clone = rook.clone()
+        self.assertEqual(rook_clone, rook)
+        self.assertEqual((rook_clone.hp, rook_clone.side), (45, Side.BLACK))
+
+        rook_spawn = rook.clone(keep_id=False)
+        self.assertNotEqual(rook_spawn, rook)
+        self.assertEqual(rook_spawn.hp, 45)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from src.backend.game import AutoBattle, GameLoop
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestGameLoop(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.updates = []
+        self.frames = []
+
+    def create(self, **kwargs) -> GameLoop:
+        return GameLoop(
+            self.updates.append, self.frames.append,
+            clock=self.clock, sleep=self.clock.sleep, **kwargs
+        )
+
+    def test_headless_never_waits(self):
+        def fail(*args):
+            raise AssertionError("Headless loop used the clock.")
+
+        loop = GameLoop(
+            self.updates.append, tick_rate=20, clock=fail, sleep=fail
+        )
+        self.assertTrue(loop.is_headless())
+        self.assertEqual(loop.run(max_ticks=100), 100)
+        self.assertEqual(self.updates, [0.05] * 100)
+
+    def test_stop(self):
+        def update(dt):
+            if loop.ticks == 9:
+                loop.stop()
+
+        loop = GameLoop(update)
+        self.assertEqual(loop.run(), 10)
+        self.assertFalse(loop.is_running())
+
+    def test_fixed_timestep(self):
+        loop = self.create(tick_rate=10, frame_rate=20)
+        loop.run(max_ticks=10)
+        # Simulation advances in fixed ticks while frames run twice as often
+        self.assertEqual(self.updates, [0.1] * 10)
+        self.assertGreaterEqual(loop.frames, 19)
+        self.assertTrue(all(0 <= alpha < 1 for alpha in self.frames))
+        self.assertAlmostEqual(sum(self.clock.sleeps), self.clock.now)
+
+    def test_frame_skip(self):
+        def slow_update(dt):
+            self.updates.append(dt)
+            self.clock.now += 0.3
+
+        loop = GameLoop(
+            slow_update, self.frames.append, tick_rate=10, frame_rate=None,
+            max_frame_skip=3, clock=self.clock, sleep=self.clock.sleep
+        )
+        loop.run(max_ticks=9)
+        # Each tick takes three ticks of real time, so ticks are batched
+        # up to the frame skip limit and the backlog is dropped
+        self.assertEqual(len(self.updates), 9)
+        self.assertLess(loop.frames, 9)
+        self.assertGreater(loop.dropped_ticks, 0)
+
+    def test_auto_battle(self):
+        battle = AutoBattle(seed=1)
+        loop = GameLoop(battle.update)
+        loop.run(max_ticks=50)
+        self.assertEqual(battle.turns, 50)
+        self.assertEqual(battle.board.get_undo_depth(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from src.backend.board import Board
+from src.backend.entities.pieces import King, Pawn
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board, get_winner, is_game_over
+
+
+class TestRules(unittest.TestCase):
+    def test_standard_board(self):
+        board = create_standard_board()
+        self.assertEqual(len(board._id_position_map), 32)
+        self.assertIsInstance(board.get_piece_at((0, 4)), King)
+        self.assertEqual(board.get_piece_at((7, 4)).side, Side.BLACK)
+        self.assertIsInstance(board.get_piece_at((6, 0)), Pawn)
+        self.assertIsNone(get_winner(board))
+
+    def test_winner(self):
+        board = Board(8, 8)
+        white = King()
+        black = King(side=Side.BLACK)
+        board.place_piece(white, (0, 0))
+        board.place_piece(black, (7, 7))
+        self.assertFalse(is_game_over(board))
+
+        board.damage_piece(black, 100)
+        self.assertTrue(is_game_over(board))
+        self.assertEqual(get_winner(board), Side.WHITE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+
+from src.backend.actions import ActionValidator
+from src.backend.actions.move_encoding import ATTACK, decode_move
+from src.backend.board import encode_board
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+from src.backend.persistence import MatchState, MatchStore
+from src.backend.replay import LoggedAction, apply_logged_action
+
+
+class TestMatchStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, "matches.db")
+        self.store = MatchStore(self.path, batch_size=50)
+
+    def tearDown(self):
+        self.store.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+        os.rmdir(os.path.dirname(self.path))
+
+    def play(self, id, turns, seed=0):
+        """
+        Play random actions, staging each one, and return the board.
+        """
+        rng = random.Random(seed)
+        board = create_standard_board()
+        validator = ActionValidator(board)
+        side = Side.WHITE
+        for turn in range(turns):
+            packed = rng.choice(validator.generate_all(side))
+            action = validator.to_action(packed)
+            from_square, to_square, kind = decode_move(packed)
+            damage = action.actor.get_damage() if kind == ATTACK else 0
+            record = LoggedAction(kind, from_square, to_square, damage)
+            apply_logged_action(board, record)
+            self.store.stage_action(id, turn, record)
+            side = side.opponent
+        self.store.stage_match(id, board, side, turns)
+        return board
+
+    def test_wal_mode(self):
+        self.assertEqual(self.store.get_journal_mode(), "wal")
+
+    def test_round_trip(self):
+        board = self.play("a", 30)
+        state = self.store.load_match("a")
+        self.assertEqual(state.turn, 30)
+        self.assertEqual(state.to_move, Side.WHITE)
+        self.assertEqual(encode_board(state.board), encode_board(board))
+        self.assertIsNone(self.store.load_match("missing"))
+
+    def test_history_replays(self):
+        board = self.play("a", 40, seed=2)
+        replayed = create_standard_board()
+        for record in self.store.load_actions("a"):
+            apply_logged_action(replayed, record)
+        # Same position, with the replayed board's own piece ids
+        self.assertEqual(
+            [
+                (type(piece), piece.side, piece.hp) if piece else None
+                for piece in replayed.get_slots()
+            ],
+            [
+                (type(piece), piece.side, piece.hp) if piece else None
+                for piece in board.get_slots()
+            ]
+        )
+        self.assertEqual(len(self.store.load_actions("a", 35)), 5)
+
+    def test_batches_writes(self):
+        self.play("a", 20)
+        # 20 actions and one match state are below the batch size
+        self.assertEqual(self.store.get_pending(), 21)
+        self.play("b", 40)
+        self.assertLess(self.store.get_pending(), 50)
+
+        # A second connection sees only flushed rows
+        other = MatchStore(self.path)
+        self.assertIn("a", other.load_matches())
+        other.close()
+
+    def test_latest_state_wins(self):
+        board = create_standard_board()
+        self.store.stage_match("a", board, Side.WHITE, 0)
+        board.damage_piece(board.get_piece_at((1, 1)), 3)
+        self.store.stage_match("a", board, Side.BLACK, 1)
+        self.assertEqual(self.store.get_pending(), 1)
+        state = self.store.load_match("a")
+        self.assertEqual((state.to_move, state.turn), (Side.BLACK, 1))
+        self.assertEqual(encode_board(state.board), encode_board(board))
+
+    def test_bulk_load(self):
+        states = [
+            MatchState(f"m{n}", create_standard_board(), Side.WHITE, 0)
+            for n in range(300)
+        ]
+        self.store.save_matches(states)
+        self.store.close()
+
+        self.store = MatchStore(self.path)
+        loaded = self.store.load_matches()
+        self.assertEqual(len(loaded), 300)
+        self.assertEqual(
+            encode_board(loaded["m7"].board),
+            encode_board(states[7].board)
+        )
+
+    def test_delete(self):
+        self.play("a", 5)
+        self.play("b", 5)
+        self.store.delete_match("a")
+        self.assertIsNone(self.store.load_match("a"))
+        self.assertEqual(self.store.load_actions("a"), [])
+        self.assertEqual(len(self.store.load_actions("b")), 5)
+
+    def test_close_after_failed_flush(self):
+        # Not a value sqlite3 can bind, so the flush fails
+        self.store.stage_action("a", 0, LoggedAction(0, 8, 16, object()))
+        with self.assertRaises(sqlite3.Error):
+            self.store.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.store.get_journal_mode()
+        self.store = MatchStore(self.path)
+        self.assertEqual(self.store.load_actions("a"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
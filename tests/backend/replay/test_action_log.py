@@ -0,0 +1,109 @@
+import gc
+import os
+import random
+import tempfile
+import unittest
+import warnings
+
+from src.backend.actions import ActionValidator
+from src.backend.board import encode_board
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+from src.backend.replay import ActionLogReader, ActionLogWriter
+
+
+class TestActionLog(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def play(self, turns, checkpoint_interval):
+        """
+        Play random actions, logging them, and return the encoded board
+        after every turn.
+        """
+        rng = random.Random(3)
+        board = create_standard_board()
+        validator = ActionValidator(board)
+        states = [encode_board(board)]
+        side = Side.WHITE
+        with ActionLogWriter(
+            self.path, board, checkpoint_interval
+        ) as writer:
+            for _ in range(turns):
+                moves = validator.generate_all(side)
+                if not moves:
+                    break
+                writer.execute(validator.to_action(rng.choice(moves)))
+                states.append(encode_board(board))
+                side = side.opponent
+        return states
+
+    def test_seek_every_turn(self):
+        states = self.play(60, checkpoint_interval=16)
+        with ActionLogReader(self.path) as reader:
+            self.assertEqual(len(reader), len(states) - 1)
+            self.assertEqual(
+                reader.get_checkpoint_turns(), [0, 16, 32, 48]
+            )
+            for turn, state in enumerate(states):
+                self.assertEqual(encode_board(reader.seek(turn)), state)
+            with self.assertRaises(IndexError):
+                reader.seek(len(states))
+
+    def test_iter_actions(self):
+        self.play(20, checkpoint_interval=8)
+        with ActionLogReader(self.path) as reader:
+            records = list(reader.iter_actions())
+            self.assertEqual(len(records), 20)
+            self.assertEqual(list(reader.iter_actions(10)), records[10:])
+
+    def test_truncated_record_ignored(self):
+        self.play(10, checkpoint_interval=100)
+        with open(self.path, "ab") as file:
+            file.write(b"\x00\x01")
+        with ActionLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 10)
+            reader.seek(10)
+
+    def test_truncated_checkpoint_ignored(self):
+        states = self.play(16, checkpoint_interval=8)
+        full = os.path.getsize(self.path)
+        # Cut the turn 16 checkpoint inside its board, then its header
+        for size in (full - 10, full - len(states[-1]) - 4):
+            with open(self.path, "r+b") as file:
+                file.truncate(size)
+            with ActionLogReader(self.path) as reader:
+                self.assertEqual(len(reader), 16)
+                self.assertEqual(reader.get_checkpoint_turns(), [0, 8])
+                self.assertEqual(len(list(reader.iter_actions())), 16)
+                self.assertEqual(
+                    encode_board(reader.seek(16)), states[16]
+                )
+
+    def test_failed_open_closes_file(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            # An empty file cannot be mapped
+            with self.assertRaises(ValueError):
+                ActionLogReader(self.path)
+            with self.assertRaises(AttributeError):
+                ActionLogWriter(self.path, None)
+            gc.collect()
+        self.assertEqual(
+            [w for w in caught if issubclass(w.category, ResourceWarning)],
+            []
+        )
+
+    def test_not_a_log(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a log")
+        with self.assertRaises(ValueError):
+            ActionLogReader(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
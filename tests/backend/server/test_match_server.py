@@ -0,0 +1,305 @@
+import asyncio
+import base64
+import json
+import unittest
+
+from src.backend.board import decode_board, encode_board
+from src.backend.entities.pieces import King
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+from src.backend.persistence import MatchState, MatchStore
+from src.backend.server import MatchServer
+
+
+class TestMatchServer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = MatchServer()
+        self.white = self.server.connect_local()
+        self.black = self.server.connect_local()
+
+    async def join(self, client, side, match="m1"):
+        await client.send({"type": "join", "match": match, "side": side})
+        return await client.receive(timeout=1)
+
+    async def test_join_sends_board(self):
+        joined = await self.join(self.white, "WHITE")
+        self.assertEqual(joined["to_move"], "WHITE")
+        board = decode_board(base64.b64decode(joined["board"]))
+        self.assertEqual(
+            encode_board(board),
+            encode_board(self.server.get_match("m1").board)
+        )
+
+    async def test_actions_are_broadcast(self):
+        await self.join(self.white, "WHITE")
+        await self.join(self.black, "BLACK")
+        spectator = self.server.connect_local()
+        await self.join(spectator, None)
+
+        # White pawn one square forward
+        await self.white.send(
+            {"type": "action", "match": "m1", "from": 8, "to": 16}
+        )
+        for client in (self.white, self.black, spectator):
+            applied = await client.receive(timeout=1)
+            self.assertEqual(applied["type"], "applied")
+            self.assertEqual(applied["turn"], 1)
+            self.assertFalse(applied["attack"])
+
+        board = self.server.get_match("m1").board
+        self.assertIsNotNone(board.get_piece_at_index(16))
+        self.assertIsNone(board.get_piece_at_index(8))
+
+    async def test_rejects_bad_actions(self):
+        await self.join(self.white, "WHITE")
+        await self.join(self.black, "BLACK")
+        cases = [
+            # Not black's turn
+            (self.black, {"from": 48, "to": 40}),
+            # Pawns cannot move three squares
+            (self.white, {"from": 8, "to": 32}),
+            # Not white's piece
+            (self.white, {"from": 48, "to": 40}),
+            (self.white, {"from": 8, "to": 9999}),
+        ]
+        for client, action in cases:
+            await client.send({"type": "action", "match": "m1", **action})
+            reply = await client.receive(timeout=1)
+            self.assertEqual(reply["type"], "error", action)
+        self.assertEqual(self.server.get_match("m1").turn, 0)
+
+        await self.white.send({"type": "action", "match": "nope"})
+        reply = await self.white.receive(timeout=1)
+        self.assertEqual(reply["type"], "error")
+
+    async def test_rejects_malformed_messages(self):
+        await self.join(self.white, "WHITE")
+        nested = []
+        for _ in range(100_000):
+            nested = [nested]
+        cases = [
+            {"type": "action", "match": "m1", "from": float("inf"), "to": 16},
+            {"type": "action", "match": "m1", "from": 8.0, "to": 16},
+            {"type": "action", "match": "m1", "from": "8", "to": 16},
+            {"type": "action", "match": "m1", "from": True, "to": 16},
+            {"type": "action", "match": "m1", "from": 8},
+            {"type": "join", "match": nested},
+        ]
+        for message in cases:
+            await self.white.send(message)
+            reply = await self.white.receive(timeout=1)
+            self.assertEqual(reply["type"], "error")
+        self.assertFalse(self.white.closed)
+        self.assertEqual(self.server.get_match("m1").turn, 0)
+
+    async def test_side_taken(self):
+        await self.join(self.white, "WHITE")
+        reply = await self.join(self.black, "WHITE")
+        self.assertEqual(reply["type"], "error")
+
+    async def test_slow_client_disconnected(self):
+        server = MatchServer(max_pending=3)
+        white = server.connect_local()
+        slow = server.connect_local()
+        await self.join(white, "WHITE")
+        # The spectator never reads; its joined message is pending
+        await slow.send({"type": "join", "match": "m1", "side": None})
+        match = server.get_match("m1")
+        for _ in range(3):
+            server.broadcast(match, {"type": "ping"})
+        self.assertTrue(slow.closed)
+        self.assertNotIn(slow, match.subscribers)
+        self.assertFalse(white.closed)
+        with self.assertRaises(ConnectionError):
+            await slow.send({"type": "leave", "match": "m1"})
+
+    async def test_many_matches(self):
+        clients = []
+        for n in range(200):
+            client = self.server.connect_local()
+            await self.join(client, "WHITE", match=f"game-{n}")
+            clients.append(client)
+        for client in clients:
+            (match,) = client.matches
+            await client.send(
+                {"type": "action", "match": match, "from": 9, "to": 17}
+            )
+        replies = await asyncio.gather(
+            *(client.receive(timeout=1) for client in clients)
+        )
+        self.assertTrue(all(reply["turn"] == 1 for reply in replies))
+
+        for client in clients:
+            client.close()
+        self.assertEqual(len(self.server.matches), 200)
+
+    async def test_tcp(self):
+        listener = await self.server.serve(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def request(message):
+            writer.write(json.dumps(message).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await asyncio.wait_for(reader.readline(), 1))
+
+        joined = await request({"type": "join", "match": "t", "side": "WHITE"})
+        self.assertEqual(joined["type"], "joined")
+        applied = await request(
+            {"type": "action", "match": "t", "from": 8, "to": 16}
+        )
+        self.assertEqual(applied["type"], "applied")
+        for line in (
+            b"not json\n",
+            b'{"type":"action","match":"t","from":Infinity,"to":16}\n',
+            b"[" * 30_000 + b"]" * 30_000 + b"\n",
+        ):
+            writer.write(line)
+            error = json.loads(await asyncio.wait_for(reader.readline(), 1))
+            self.assertEqual(error["type"], "error")
+
+        # A line over the stream limit ends the connection with an error
+        writer.write(b"x" * 100_000 + b"\n")
+        error = json.loads(await asyncio.wait_for(reader.readline(), 1))
+        self.assertEqual(error["message"], "Message too long.")
+        self.assertEqual(await asyncio.wait_for(reader.read(), 1), b"")
+
+        writer.close()
+        await writer.wait_closed()
+        await self.server.close()
+        # The unfinished match waits for its players to come back
+        self.assertEqual(self.server.get_match("t").turn, 1)
+
+    async def test_close_disconnects_clients(self):
+        listener = await self.server.serve(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b'{"type":"join","match":"c","side":"WHITE"}\n')
+        await asyncio.wait_for(reader.readline(), 1)
+        await self.join(self.black, "BLACK", match="c")
+
+        await asyncio.wait_for(self.server.close(), 1)
+        self.assertEqual(await asyncio.wait_for(reader.read(), 1), b"")
+        self.assertTrue(self.black.closed)
+        writer.close()
+
+    async def test_match_survives_reconnect(self):
+        now = [0.0]
+        server = MatchServer(idle_timeout=60, clock=lambda: now[0])
+        white = server.connect_local()
+        await self.join(white, "WHITE")
+        await white.send(
+            {"type": "action", "match": "m1", "from": 8, "to": 16}
+        )
+        white.close()
+
+        now[0] = 59
+        self.assertEqual(server.expire_idle_matches(), 0)
+        white = server.connect_local()
+        joined = await self.join(white, "WHITE")
+        self.assertEqual(joined["turn"], 1)
+        self.assertEqual(joined["to_move"], "BLACK")
+
+        # Empty for longer than the timeout, the match is dropped
+        white.close()
+        now[0] = 120
+        self.assertEqual(server.expire_idle_matches(), 1)
+        self.assertIsNone(server.get_match("m1"))
+
+    async def test_finished_match_dropped(self):
+        await self.join(self.white, "WHITE")
+        match = self.server.get_match("m1")
+        match.winner = match.to_move
+        self.white.close()
+        self.assertIsNone(self.server.get_match("m1"))
+
+    async def test_restore_from_store(self):
+        store = MatchStore()
+        self.addCleanup(store.close)
+        server = MatchServer(store=store)
+        white = server.connect_local()
+        await self.join(white, "WHITE")
+        await white.send(
+            {"type": "action", "match": "m1", "from": 8, "to": 16}
+        )
+        board = encode_board(server.get_match("m1").board)
+        await server.close()
+        finished = create_standard_board()
+        finished.remove_piece(
+            next(p for p in finished.get_slots() if isinstance(p, King))
+        )
+        store.save_matches([MatchState("done", finished, Side.BLACK, 9)])
+
+        server = MatchServer(store=store)
+        self.assertEqual(server.restore(store.load_matches()), 1)
+        self.assertIsNone(server.get_match("done"))
+        black = server.connect_local()
+        joined = await self.join(black, "BLACK")
+        self.assertEqual(joined["turn"], 1)
+        self.assertEqual(joined["to_move"], "BLACK")
+        self.assertEqual(
+            joined["board"], base64.b64encode(board).decode()
+        )
+        await black.send(
+            {"type": "action", "match": "m1", "from": 48, "to": 40}
+        )
+        applied = await black.receive(timeout=1)
+        self.assertEqual(applied["turn"], 2)
+
+    async def test_store_history(self):
+        now = [0.0]
+        store = MatchStore()
+        self.addCleanup(store.close)
+        server = MatchServer(
+            idle_timeout=60, clock=lambda: now[0], store=store
+        )
+        white = server.connect_local()
+        black = server.connect_local()
+        await self.join(white, "WHITE")
+        await self.join(black, "BLACK")
+        for client, from_square, to_square in [
+            (white, 8, 16), (black, 48, 40), (white, 9, 17)
+        ]:
+            await client.send({
+                "type": "action", "match": "m1",
+                "from": from_square, "to": to_square
+            })
+            await white.receive(timeout=1)
+            await black.receive(timeout=1)
+        server.save()
+
+        self.assertEqual(store.load_match("m1").turn, 3)
+        self.assertEqual(
+            [
+                (action.from_square, action.to_square)
+                for action in store.load_actions("m1")
+            ],
+            [(8, 16), (48, 40), (9, 17)]
+        )
+
+        # Expired matches are deleted from the store too
+        white.close()
+        black.close()
+        now[0] = 60
+        self.assertEqual(server.expire_idle_matches(), 1)
+        self.assertIsNone(store.load_match("m1"))
+        self.assertEqual(store.load_actions("m1"), [])
+
+    async def test_autosave(self):
+        store = MatchStore()
+        self.addCleanup(store.close)
+        server = MatchServer(store=store, save_interval=0.01)
+        await server.serve(port=0)
+        white = server.connect_local()
+        await self.join(white, "WHITE")
+        await white.send(
+            {"type": "action", "match": "m1", "from": 8, "to": 16}
+        )
+        await white.receive(timeout=1)
+        await asyncio.sleep(0.05)
+        self.assertEqual(store.get_pending(), 0)
+        self.assertEqual(store.load_match("m1").turn, 1)
+        await server.close()
+
+if __name__ == "__main__":
+    unittest.main()
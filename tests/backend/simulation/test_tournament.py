@@ -0,0 +1,43 @@
+import unittest
+
+from src.backend.foundations.types import Side
+from src.backend.simulation import (
+    format_summary, play_game, run_tournament, summarize
+)
+
+
+class TestTournament(unittest.TestCase):
+    def test_play_game_deterministic(self):
+        first = play_game(3, policy="random", max_turns=100)
+        second = play_game(3, policy="random", max_turns=100)
+        self.assertEqual(first, second)
+        self.assertLessEqual(first.turns, 100)
+
+    def test_play_game_winner(self):
+        record = play_game(1, policy="greedy")
+        self.assertIn(record.winner, (Side.WHITE, Side.BLACK))
+        self.assertGreater(sum(record.damage.values()), 0)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            play_game(0, policy="unknown")
+
+    def test_summarize(self):
+        records = [play_game(seed, max_turns=50) for seed in range(4)]
+        summary = summarize(records)
+        self.assertEqual(summary.games, 4)
+        self.assertEqual(sum(summary.wins.values()), 4)
+        self.assertEqual(
+            summary.mean_turns,
+            sum(record.turns for record in records) / 4
+        )
+        self.assertIn("Queen", format_summary(summary))
+
+    def test_pool_matches_serial(self):
+        serial = run_tournament(6, workers=1, base_seed=10, max_turns=80)
+        pooled = run_tournament(6, workers=2, base_seed=10, max_turns=80)
+        self.assertEqual(serial, pooled)
+
+
+if __name__ == "__main__":
+    unittest.main()
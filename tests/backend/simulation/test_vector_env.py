@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from src.backend.actions import ActionValidator
+from src.backend.actions.move_encoding import decode_move
+from src.backend.board import Board
+from src.backend.entities.pieces import PIECE_TYPES
+from src.backend.foundations.types import Side
+from src.backend.game import create_standard_board
+
+try:
+    import numpy as np
+    from src.backend.simulation.vector_env import VectorEnv
+except ImportError:
+    np = None
+
+
+def random_board(rng: random.Random, count: int = 14) -> Board:
+    board = Board(8, 8)
+    squares = rng.sample([(r, c) for r in range(8) for c in range(8)], count)
+    for position in squares:
+        piece = rng.choice(PIECE_TYPES)(side=rng.choice(list(Side)))
+        piece.hp = rng.randint(1, piece.hp)
+        board.place_piece(piece, position)
+    return board
+
+
+def board_actions(board: Board, side: Side):
+    actions = ActionValidator(board).generate_all(side)
+    return sorted(decode_move(packed)[:2] for packed in actions)
+
+
+def board_state(board: Board):
+    return [
+        None if piece is None else (type(piece), piece.side, piece.hp)
+        for piece in board.get_slots()
+    ]
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestVectorEnv(unittest.TestCase):
+    def test_round_trip(self):
+        board = create_standard_board()
+        env = VectorEnv.from_boards([board])
+        self.assertEqual(board_state(env.to_board(0)), board_state(board))
+
+    def test_mask_matches_validator(self):
+        rng = random.Random(5)
+        boards = [random_board(rng) for _ in range(20)]
+        sides = [rng.choice(list(Side)) for _ in boards]
+        env = VectorEnv.from_boards(boards, sides)
+        for n, board in enumerate(boards):
+            self.assertEqual(
+                env.get_actions(n),
+                board_actions(board, sides[n])
+            )
+
+    def test_lockstep_matches_board(self):
+        rng = random.Random(9)
+        boards = [create_standard_board() for _ in range(4)]
+        boards += [random_board(rng) for _ in range(4)]
+        env = VectorEnv.from_boards(boards)
+        np_rng = np.random.default_rng(0)
+
+        for _ in range(60):
+            actions = env.sample_actions(np_rng)
+            for n, board in enumerate(boards):
+                if env.done[n] or actions[n, 0] < 0:
+                    continue
+                piece = board.get_piece_at_index(int(actions[n, 0]))
+                target = board.get_piece_at_index(int(actions[n, 1]))
+                if target is None:
+                    board.move_piece(
+                        piece,
+                        board.to_position(int(actions[n, 1]))
+                    )
+                else:
+                    board.damage_piece(target, piece.get_damage())
+            env.step(actions)
+            for n, board in enumerate(boards):
+                self.assertEqual(
+                    board_state(env.to_board(n)),
+                    board_state(board)
+                )
+
+    def test_rollout(self):
+        env = VectorEnv.from_boards(
+            [create_standard_board() for _ in range(16)]
+        )
+        winners = env.rollout(np.random.default_rng(1), max_turns=400)
+        self.assertTrue(env.done.all())
+        self.assertEqual(winners.shape, (16,))
+        self.assertTrue(set(winners.tolist()) <= {-1, 0, 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# Seconds allowed to import the headless entry point, well above the
+# usual cost so only a real regression fails
+IMPORT_BUDGET = 0.3
+
+# Modules a headless worker must never import
+FORBIDDEN = (
+    "pygame",
+    "numpy",
+    "src.frontend",
+    "concurrent.futures",
+    "multiprocessing",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(sys.modules)}}))
+"""
+
+
+def probe(module: str) -> dict:
+    """
+    Import a module in a fresh interpreter and report the time it took and
+    every module loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+class TestStartup(unittest.TestCase):
+    def test_headless_imports(self):
+        for module in ("src.backend.cli", "main"):
+            modules = probe(module)["modules"]
+            for name in FORBIDDEN:
+                with self.subTest(module=module, forbidden=name):
+                    self.assertNotIn(name, modules)
+
+    def test_lazy_packages(self):
+        modules = probe("src.backend.actions")["modules"]
+        self.assertNotIn("src.backend.actions.threat_map", modules)
+        self.assertNotIn("src.backend.entities.pieces", modules)
+
+    def test_import_budget(self):
+        # Best of a few runs, to ignore a busy machine
+        seconds = min(
+            probe("src.backend.cli")["seconds"] for _ in range(3)
+        )
+        self.assertLess(seconds, IMPORT_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
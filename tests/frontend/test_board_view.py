@@ -0,0 +1,66 @@
+import unittest
+
+from src.backend.board import Board
+from src.backend.entities.pieces import Pawn, Rook
+from src.backend.foundations.types import Side
+
+try:
+    import pygame
+    from src.frontend import BoardView, get_sprite_atlas
+except ImportError:
+    pygame = None
+
+
+@unittest.skipUnless(pygame, "pygame is not installed")
+class TestBoardView(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(8, 8)
+        self.rook = Rook()
+        self.pawn = Pawn(side=Side.BLACK)
+        self.board.place_piece(self.rook, (0, 0))
+        self.board.place_piece(self.pawn, (4, 0))
+        self.surface = pygame.Surface((400, 400))
+        self.view = BoardView(self.board, self.surface)
+
+    def tearDown(self):
+        self.view.close()
+
+    def test_first_draw_is_full(self):
+        self.assertEqual(self.view.tile_size, 50)
+        self.assertEqual(len(self.view.draw()), 64)
+        self.assertEqual(self.view.draw(), [])
+
+    def test_redraws_touched_tiles(self):
+        self.view.draw()
+        self.board.move_piece(self.rook, (2, 0))
+        rects = self.view.draw()
+        self.assertEqual(
+            sorted(rects, key=lambda rect: rect.y),
+            [self.view.get_tile_rect(16), self.view.get_tile_rect(0)]
+        )
+
+        self.board.damage_piece(self.pawn, 1)
+        self.assertEqual(self.view.draw(), [self.view.get_tile_rect(32)])
+
+    def test_tile_layout(self):
+        # White's first row is at the bottom
+        self.assertEqual(
+            self.view.get_tile_rect(0), pygame.Rect(0, 350, 50, 50)
+        )
+        self.assertEqual(
+            self.view.get_tile_rect(63), pygame.Rect(350, 0, 50, 50)
+        )
+
+    def test_shared_atlas(self):
+        atlas = get_sprite_atlas(50)
+        self.assertIs(self.view.atlas, atlas)
+        full = atlas.get_hp_bar_rect(10, 10)
+        empty = atlas.get_hp_bar_rect(0, 10)
+        self.assertNotEqual(full, empty)
+        self.assertTrue(atlas.surface.get_rect().contains(full))
+        # Nearly dead pieces still show a sliver of bar
+        self.assertNotEqual(atlas.get_hp_bar_rect(1, 100), empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import unittest
+
+from benchmarks.perft import perft
+from benchmarks.positions import POSITIONS
+from benchmarks.run import BASELINE_PATH, compare
+from src.backend.actions import ActionValidator
+from src.backend.foundations.types import Side
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_perft_depth_one(self):
+        for create in POSITIONS.values():
+            board = create()
+            moves = ActionValidator(board).generate_all(Side.WHITE)
+            self.assertEqual(perft(board, Side.WHITE, 1), len(moves))
+
+    def test_perft_restores_board(self):
+        board = POSITIONS["rpg_skirmish"]()
+        start = board.get_hash()
+        hp = [piece.hp for piece in board.get_slots() if piece is not None]
+
+        perft(board, Side.WHITE, 3)
+        self.assertEqual(board.get_hash(), start)
+        self.assertEqual(
+            [piece.hp for piece in board.get_slots() if piece is not None],
+            hp
+        )
+        self.assertEqual(board.get_undo_depth(), 0)
+
+    def test_baseline_path(self):
+        # Found from any working directory
+        self.assertTrue(os.path.isabs(BASELINE_PATH))
+        self.assertTrue(os.path.isfile(BASELINE_PATH))
+
+    def test_compare(self):
+        baseline = {"perft": {"nodes": 10, "seconds": 1.0}}
+        within = {"perft": {"nodes": 10, "seconds": 1.2}}
+        self.assertEqual(compare(within, baseline, 0.25, True), [])
+        # Times only count when checked
+        slower = {"perft": {"nodes": 10, "seconds": 1.3}}
+        self.assertEqual(compare(slower, baseline, 0.25), [])
+        self.assertEqual(len(compare(slower, baseline, 0.25, True)), 1)
+        wrong_nodes = {"perft": {"nodes": 11, "seconds": 1.0}}
+        self.assertEqual(len(compare(wrong_nodes, baseline, 0.25)), 1)
+        self.assertEqual(len(compare({}, baseline, 0.25)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()